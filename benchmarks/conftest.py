@@ -0,0 +1,95 @@
+"""Shared geometry for the pymesh benchmark suite.
+
+Benchmarks use the 'benchmark' fixture from pytest-benchmark, see docs/dev/benchmarks.md.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from pymesh import (
+    Point,
+    Line,
+    Arc3P,
+    ArcPVA,
+    Bezier,
+    UserDefinedCurve,
+    BilinearSurface,
+    CoonsPatch,
+    PlaneSurface,
+    RuledSurface,
+    SweptSurface,
+    MeshGenerator,
+    ExponentialDistribution,
+)
+
+
+def create_curves() -> dict:
+    """Returns one curve of each curve class, keyed by class name."""
+    return {
+        "Line": Line(Point(0, 0, 0), Point(1, 2, 3)),
+        "Arc3P": Arc3P(Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0)),
+        "ArcPVA": ArcPVA(Point(1, 0, 0), math.pi, 0, 0, 1),
+        "Bezier": Bezier(
+            [Point(0, 0, 0), Point(1, 2, 0), Point(2, -1, 1), Point(3, 0, 0)]
+        ),
+        "UserDefinedCurve": UserDefinedCurve(
+            lambda u: np.array([u, math.sin(math.pi * u), 0.0])
+        ),
+    }
+
+
+def create_surfaces() -> dict:
+    """Returns one surface of each surface class, keyed by class name."""
+    curves = create_curves()
+    p00, p10 = Point(0, 0, 0), Point(1, 0, 0)
+    p11, p01 = Point(1, 1, 0.5), Point(0, 1, 0)
+    coons_curves = (
+        Line(Point(0, 0, 0), Point(1, 0, 0)),
+        Line(Point(0, 1, 0), Point(1, 1, 0)),
+        Bezier([Point(0, 0, 0), Point(-0.5, 0.5, 0), Point(0, 1, 0)]),
+        Bezier([Point(1, 0, 0), Point(1.5, 0.5, 0), Point(1, 1, 0)]),
+    )
+    return {
+        "PlaneSurface": PlaneSurface(p00, p10, p01),
+        "BilinearSurface": BilinearSurface(p00, p10, p11, p01),
+        "RuledSurface": RuledSurface(curves["Arc3P"], curves["Bezier"]),
+        "SweptSurface": SweptSurface(curves["ArcPVA"], curves["Line"]),
+        "CoonsPatch": CoonsPatch(coons_curves),
+    }
+
+
+def create_cylinder_mesh(density: int) -> MeshGenerator:
+    """Returns a mesh of a vertical cylinder with a bottom plate.
+
+    Args:
+        density: Number of panels along each surface dimension.
+    """
+    mesh = MeshGenerator()
+    plate = SweptSurface(
+        ArcPVA(Point(1, 0, -1), 2 * math.pi, a=0, b=0, c=1),
+        Line(Point(0, 0, -1), Point(1, 0, -1)),
+    )
+    cylinder = SweptSurface(
+        ArcPVA(Point(1, 0, -1), 2 * math.pi, a=0, b=0, c=1),
+        Line(Point(0, 0, -1), Point(0, 0, 0)),
+    )
+    mesh.add_surface(plate, density_u=density, density_w=density)
+    mesh.add_surface(
+        cylinder,
+        density_u=density,
+        density_w=density,
+        distribution_w=ExponentialDistribution(flip_direction=True),
+    )
+    return mesh
+
+
+@pytest.fixture(params=list(create_curves()))
+def curve(request):
+    return create_curves()[request.param]
+
+
+@pytest.fixture(params=list(create_surfaces()))
+def surface(request):
+    return create_surfaces()[request.param]
@@ -0,0 +1,26 @@
+"""Benchmarks of curve evaluation per curve class"""
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("num_points", [10, 100, 1_000])
+def test_path(benchmark, curve, num_points) -> None:
+    u = np.linspace(0, 1, num=num_points).tolist()
+    benchmark(lambda: [curve.path(val) for val in u])
+
+
+@pytest.mark.parametrize("num_points", [10, 1_000, 100_000])
+def test_path_array(benchmark, curve, num_points) -> None:
+    u = np.linspace(0, 1, num=num_points)
+    benchmark(curve.path_array, u)
+
+
+@pytest.mark.parametrize("length_tolerance", [1e-4, 1e-8, 1e-12])
+def test_length(benchmark, curve, length_tolerance) -> None:
+    def setup():
+        new_curve = curve.copy()
+        new_curve.length_tolerance = length_tolerance
+        return (new_curve,), {}
+
+    benchmark.pedantic(lambda new_curve: new_curve.length, setup=setup, rounds=20)
@@ -0,0 +1,13 @@
+"""Benchmarks of reading panels with the GDFReader class"""
+
+import pytest
+
+from pymesh import GDFReader, GDFWriter
+from benchmarks.conftest import create_cylinder_mesh
+
+
+@pytest.mark.parametrize("density", [10, 100, 300])
+def test_get_panel_array(benchmark, tmp_path, density) -> None:
+    filename = tmp_path / "mesh.gdf"
+    GDFWriter(create_cylinder_mesh(density)).write(filename)
+    benchmark(GDFReader(filename).get_panel_array)
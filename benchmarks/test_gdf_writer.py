@@ -0,0 +1,12 @@
+"""Benchmarks of writing panels with the GDFWriter class"""
+
+import pytest
+
+from pymesh import GDFWriter
+from benchmarks.conftest import create_cylinder_mesh
+
+
+@pytest.mark.parametrize("density", [10, 100, 300])
+def test_write(benchmark, tmp_path, density) -> None:
+    writer = GDFWriter(create_cylinder_mesh(density))
+    benchmark(writer.write, tmp_path / "mesh.gdf")
@@ -0,0 +1,68 @@
+"""Benchmarks of panel generation in the MeshGenerator class"""
+
+import math
+
+import pytest
+
+from pymesh import ArcPVA, Line, MeshGenerator, Point, SweptSurface
+from pymesh.utils import get_rotation_affine
+from benchmarks.conftest import create_cylinder_mesh
+
+DENSITIES = [10, 100, 500]
+"""Number of panels along each surface dimension."""
+
+
+def create_setup(density: int):
+    """Returns a benchmark setup function creating a new mesh for every round,
+    such that panels are not memoized between rounds."""
+    return lambda: ((create_cylinder_mesh(density),), {})
+
+
+@pytest.mark.parametrize("density", DENSITIES)
+def test_get_panel_array(benchmark, density) -> None:
+    benchmark.pedantic(
+        lambda mesh: mesh.get_panel_array(), setup=create_setup(density), rounds=5
+    )
+
+
+@pytest.mark.parametrize("density", DENSITIES)
+def test_get_panel_array_memoized(benchmark, density) -> None:
+    mesh = create_cylinder_mesh(density)
+    mesh.get_panel_array()
+    benchmark(mesh.get_panel_array)
+
+
+@pytest.mark.parametrize("density", DENSITIES)
+def test_get_panels(benchmark, density) -> None:
+    benchmark.pedantic(
+        lambda mesh: mesh.get_panels(), setup=create_setup(density), rounds=5
+    )
+
+
+def create_swept_arcs_mesh(density: int, instanced: bool) -> MeshGenerator:
+    """Returns a mesh of four surfaces, each a quarter circle arc swept along a
+    radial line, either as rotated copies or as rotated instances of the first."""
+    quarter = SweptSurface(
+        ArcPVA(Point(1, 0, 0), math.pi / 2, a=0, b=0, c=1),
+        Line(Point(0, 0, 0), Point(1, 0, 0)),
+    )
+    mesh = MeshGenerator()
+    mesh.add_surface(quarter, density_u=density, density_w=density)
+    for angle in (0.5 * math.pi, math.pi, 1.5 * math.pi):
+        if instanced:
+            rotation = get_rotation_affine(angle, a=0, b=0, c=1)
+            mesh.add_instance(quarter, rotation, density_u=density, density_w=density)
+        else:
+            surface = quarter.copy().rotate(angle, a=0, b=0, c=1)
+            mesh.add_surface(surface, density_u=density, density_w=density)
+    return mesh
+
+
+@pytest.mark.parametrize("instanced", [False, True])
+@pytest.mark.parametrize("density", DENSITIES)
+def test_get_panel_array_instanced(benchmark, density, instanced) -> None:
+    benchmark.pedantic(
+        lambda mesh: mesh.get_panel_array(),
+        setup=lambda: ((create_swept_arcs_mesh(density, instanced),), {}),
+        rounds=5,
+    )
@@ -0,0 +1,22 @@
+"""Benchmarks of setting up plots with the MeshViewer class"""
+
+import pytest
+
+from benchmarks.conftest import create_cylinder_mesh
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+from pymesh import MeshViewer  # pylint: disable=wrong-import-position
+
+
+@pytest.mark.parametrize("density", [10, 50, 100])
+def test_plot(benchmark, density) -> None:
+    mesh = create_cylinder_mesh(density)
+
+    def plot():
+        viewer = MeshViewer(mesh)
+        viewer._plot_panels()
+        viewer._set_axis_limits()
+
+    benchmark(plot)
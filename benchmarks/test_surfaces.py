@@ -0,0 +1,16 @@
+"""Benchmarks of surface evaluation per surface class"""
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("num_points", [10, 100])
+def test_path(benchmark, surface, num_points) -> None:
+    u = np.linspace(0, 1, num=num_points).tolist()
+    benchmark(lambda: [surface.path(val, val) for val in u])
+
+
+@pytest.mark.parametrize("num_points", [10, 100, 1_000])
+def test_path_grid(benchmark, surface, num_points) -> None:
+    u = np.linspace(0, 1, num=num_points)
+    benchmark(surface.path_grid, u, u)
@@ -12,6 +12,7 @@ from pathlib import Path
 from pymesh import Point, Line, Arc3P, ArcPVA, PlaneSurface, RuledSurface, SweptSurface
 from pymesh import MeshGenerator, ExponentialDistribution
 from pymesh import MeshViewer, GDFWriter
+from pymesh.utils import get_mirror_affine, get_rotation_affine
 
 DIAMETER = 2.0
 RATIO = 0.4
@@ -21,26 +22,34 @@ DEPTH = 1
 point00 = Point(0, 0, -DEPTH)
 point10 = Point(RATIO * DIAMETER / 2, 0, -DEPTH)
 point01 = Point(0, RATIO * DIAMETER / 2, -DEPTH)
-PlaneSurface(point00, point10, point01).flip_normal()
+surface_inner = PlaneSurface(point00, point10, point01).flip_normal()
 
-# Create one quarter of the circle plate outer part
+# Create one eighth of the circle plate outer part
 point11 = Point(RATIO * DIAMETER / 2, RATIO * DIAMETER / 2, -DEPTH)
 point11c = Point(DIAMETER / 2 / math.sqrt(2), DIAMETER / 2 / math.sqrt(2), -DEPTH)
 point10c = Point(DIAMETER / 2, 0, -DEPTH)
 point01c = Point(0, DIAMETER / 2, -DEPTH)
 line10 = Line(point10, point11)
 arc10 = Arc3P(point00, point10c, point11c)
-RuledSurface(line10, arc10).copy().mirror(a=-1, b=-1, c=0).flip_normal()
-
-# Create a full circular plate by copying and rotating existing surfaces
-for surface in RuledSurface.get_all_surfaces():
-    for angle in (90, 180, 270):
-        surface.copy().rotate(angle * math.pi / 180, a=0, b=0, c=1)
+surface_outer = RuledSurface(line10, arc10)
 
 # Add surfaces to the mesh generator and set mesh settings
 mesh = MeshGenerator()
-for surface in RuledSurface.get_all_surfaces():
-    mesh.add_surface(surface, density_u=0.2, density_w=0.2)
+mesh.add_surface(surface_inner, density_u=0.2, density_w=0.2)
+mesh.add_surface(surface_outer, density_u=0.2, density_w=0.2)
+
+# Complete the outer quarter by a mirrored instance of the outer part,
+# whose normal is flipped to keep the normal direction of the plate
+mirror = get_mirror_affine(a=-1, b=-1, c=0)
+mesh.add_instance(surface_outer, mirror, density_u=0.2, density_w=0.2)
+
+# Create a full circular plate by adding rotated instances of the quarter,
+# which reuse the mesh points of the surfaces instead of meshing copies
+for angle in (90, 180, 270):
+    rotation = get_rotation_affine(angle * math.pi / 180, a=0, b=0, c=1)
+    mesh.add_instance(surface_inner, rotation, density_u=0.2, density_w=0.2)
+    mesh.add_instance(surface_outer, rotation, density_u=0.2, density_w=0.2)
+    mesh.add_instance(surface_outer, rotation @ mirror, density_u=0.2, density_w=0.2)
 
 # Create cylinder surface
 circle = ArcPVA(Point(DIAMETER / 2, 0, -DEPTH), 2 * math.pi, a=0, b=0, c=1)
@@ -1,4 +1,13 @@
+"""Top-level package exposing the public pymesh classes.
+
+Classes depending on heavy optional packages, such as MeshViewer relying on
+matplotlib, are imported lazily on first attribute access.
+"""
+
+import importlib
+
 from pymesh.geo.point import Point
+from pymesh.geo.point_array import PointArray
 from pymesh.geo.curves.curve import Curve
 from pymesh.geo.curves.line import Line
 from pymesh.geo.curves.arc3p import Arc3P
@@ -16,6 +25,57 @@ from pymesh.mesh.mesh_distributions import LinearDistribution
 from pymesh.mesh.mesh_distributions import ExponentialDistribution
 from pymesh.mesh.mesh_distributions import PowerDistribution
 from pymesh.mesh.mesh_distributions import CosineDistribution
+from pymesh.mesh.indexed_mesh import IndexedMesh
+from pymesh.mesh.mesh_cache import MeshCache
 from pymesh.mesh.mesh_generator import MeshGenerator
-from pymesh.mesh.mesh_viewer import MeshViewer
 from pymesh.writers.gdf_writer import GDFWriter
+from pymesh.writers.panel_store_writer import PanelStoreWriter
+from pymesh.readers.gdf_reader import GDFReader
+from pymesh.readers.panel_store_reader import PanelStoreReader
+
+__all__ = [
+    "Point",
+    "PointArray",
+    "Curve",
+    "Line",
+    "Arc3P",
+    "ArcPVA",
+    "Bezier",
+    "UserDefinedCurve",
+    "Surface",
+    "BilinearSurface",
+    "CoonsPatch",
+    "PlaneSurface",
+    "RuledSurface",
+    "SweptSurface",
+    "MeshDistribution",
+    "LinearDistribution",
+    "ExponentialDistribution",
+    "PowerDistribution",
+    "CosineDistribution",
+    "IndexedMesh",
+    "MeshCache",
+    "MeshGenerator",
+    "GDFWriter",
+    "PanelStoreWriter",
+    "GDFReader",
+    "PanelStoreReader",
+    "MeshViewer",
+]
+
+_LAZY_IMPORTS = {
+    "MeshViewer": "pymesh.mesh.mesh_viewer",
+}
+"""Lazily imported attribute names mapped to the module defining them."""
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -103,11 +103,13 @@ class AsContainerOf(Validator):
         item_type,
         min_length: int | None = None,
         max_length: int | None = None,
+        return_type: Callable | None = None,
     ):
         self.container_type = container_type
         self.item_type = item_type
         self.min_length = min_length
         self.max_length = max_length
+        self.return_type = return_type
 
     def validate(self, value):
         if not isinstance(value, self.container_type):
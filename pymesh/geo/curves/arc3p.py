@@ -8,7 +8,7 @@ import numpy as np
 from pymesh.descriptors import AsInstanceOf
 from pymesh.geo.curves.curve import Curve
 from pymesh.geo.point import Point
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.utils import validate_curve_path_parameters
 
 
@@ -119,25 +119,37 @@ class Arc3P(Curve):
 
     @property
     def radius(self) -> float:
-        return np.sqrt(np.sum((self.start - self.centre) ** 2))
+        return self._get_cached(
+            "radius", lambda: np.sqrt(np.sum((self.start - self.centre) ** 2))
+        )
 
     @property
     def cross_product(self) -> NDArray3[np.float64]:
-        sign = -1 if self.inverse_sector else 1
-        return sign * np.cross((self.start - self.centre), (self.end - self.centre))
+        def get_cross_product():
+            sign = -1 if self.inverse_sector else 1
+            v1, v2 = (self.start - self.centre), (self.end - self.centre)
+            return read_only(sign * np.cross(v1, v2))
+
+        return self._get_cached("cross_product", get_cross_product)
 
     @property
     def plane_unit_normal(self) -> NDArray3[np.float64]:
-        return self.cross_product / np.sqrt(np.sum(self.cross_product**2))
+        def get_plane_unit_normal():
+            cross_product = self.cross_product
+            return read_only(cross_product / np.sqrt(np.sum(cross_product**2)))
+
+        return self._get_cached("plane_unit_normal", get_plane_unit_normal)
 
     @property
     def angle(self) -> float:
-        angle = np.arccos(
-            np.dot((self.start - self.centre), (self.end - self.centre))
-            / (self.radius**2)
-        )
-        angle = 2 * math.pi - angle if self.inverse_sector else angle
-        return angle
+        def get_angle():
+            angle = np.arccos(
+                np.dot((self.start - self.centre), (self.end - self.centre))
+                / (self.radius**2)
+            )
+            return 2 * math.pi - angle if self.inverse_sector else angle
+
+        return self._get_cached("angle", get_angle)
 
     @property
     def length(self) -> float:
@@ -145,12 +157,30 @@ class Arc3P(Curve):
 
     def path(self, u: int | float, flip: bool = False) -> NDArray3[np.float64]:
         u = validate_curve_path_parameters(u, flip)
-        v, k, a = (self.start - self.centre), self.plane_unit_normal, self.angle
+        return self._path_array(np.array(u))
+
+    def _path_array(self, u: NDArrayN[np.float64]) -> NDArrayNx3[np.float64]:
+        xyz0, v, kxv, kkv, angle = self._get_cached("frame", self._get_frame)
+        theta = angle * u[..., np.newaxis]
+        cos_theta = np.cos(theta)
+        return xyz0 + v * cos_theta + kxv * np.sin(theta) + kkv * (1 - cos_theta)
+
+    def _get_frame(self) -> tuple:
+        """Returns the arc frame used for evaluating the Rodrigues rotation formula.
+
+        The frame holds the centre xyz, the centre-to-start vector v, the cross
+        product of the plane unit normal k and v, the projection k * (k . v) and
+        the arc angle.
+        """
+        v, k = (self.start - self.centre), self.plane_unit_normal
         xyz0 = self.centre.xyz
-        part1 = v * math.cos(a * u)
-        part2 = np.cross(k, v) * math.sin(a * u)
-        part3 = k * np.dot(k, v) * (1 - math.cos(a * u))
-        return xyz0 + part1 + part2 + part3
+        kxv = np.cross(k, v)
+        kkv = k * np.dot(k, v)
+        return xyz0, v, kxv, kkv, self.angle
+
+    def _cache_key(self) -> tuple:
+        c, s, e = self.centre, self.start, self.end
+        return (c.x, c.y, c.z, s.x, s.y, s.z, e.x, e.y, e.z, self.inverse_sector)
 
 
 def validate_radii_and_cross_product(centre: Point, start: Point, end: Point) -> None:
@@ -161,3 +191,9 @@ def validate_radii_and_cross_product(centre: Point, start: Point, end: Point) ->
     cross_product = np.cross((start - centre), (end - centre))
     if np.all(cross_product == 0):
         raise ValueError("Resulting cross product is zero")
+
+
+def read_only(arr: np.ndarray) -> np.ndarray:
+    """Returns arr flagged as read-only, protecting cached arrays from mutation."""
+    arr.flags.writeable = False
+    return arr
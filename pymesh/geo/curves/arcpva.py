@@ -1,13 +1,12 @@
 """Module containing the ArcPVA class"""
 
-import math
 from typing import Self
 import numpy as np
 
 from pymesh.descriptors import AsNumber
 from pymesh.geo.point import Point
 from pymesh.geo.curves.curve import Curve
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.utils import (
     validate_curve_path_parameters,
     rotate_point_xyz,
@@ -101,11 +100,15 @@ class ArcPVA(Curve):
     @property
     def radius(self) -> float:
         """Returns the arc radius."""
-        xyz0 = np.array([self.x0, self.y0, self.z0])
-        a = self.start.xyz - xyz0
-        b = np.array([self.a, self.b, self.c])
-        r = a - np.dot(a, b) / np.dot(b, b) * b
-        return np.sqrt(np.sum(r**2))
+
+        def get_radius():
+            xyz0 = np.array([self.x0, self.y0, self.z0])
+            a = self.start.xyz - xyz0
+            b = np.array([self.a, self.b, self.c])
+            r = a - np.dot(a, b) / np.dot(b, b) * b
+            return np.sqrt(np.sum(r**2))
+
+        return self._get_cached("radius", get_radius)
 
     @property
     def length(self) -> float:
@@ -113,14 +116,29 @@ class ArcPVA(Curve):
 
     def path(self, u: int | float, flip: bool = False) -> NDArray3[np.float64]:
         u = validate_curve_path_parameters(u, flip)
-        angle = self.angle
+        return self._path_array(np.array(u))
+
+    def _path_array(self, u: NDArrayN[np.float64]) -> NDArrayNx3[np.float64]:
+        xyz0, pvec, axp, aap = self._get_cached("frame", self._get_frame)
+        theta = self.angle * u[..., np.newaxis]
+        cos_theta = np.cos(theta)
+        return xyz0 + pvec * cos_theta + axp * np.sin(theta) + aap * (1 - cos_theta)
+
+    def _get_frame(self) -> tuple:
+        """Returns the arc frame used for evaluating the Rodrigues rotation formula.
+
+        The frame holds the axis base xyz, the base-to-start vector p, the cross
+        product of the axis vector a and p, and the projection a * (a . p).
+        """
         xyz0 = np.array([self.x0, self.y0, self.z0])
         abc = np.array([self.a, self.b, self.c])
         pvec = self.start.xyz - xyz0
-        part1 = pvec * math.cos(angle * u)
-        part2 = np.cross(abc, pvec) * math.sin(angle * u)
-        part3 = abc * np.dot(abc, pvec) * (1 - math.cos(angle * u))
-        return xyz0 + part1 + part2 + part3
+        return xyz0, pvec, np.cross(abc, pvec), abc * np.dot(abc, pvec)
+
+    def _cache_key(self) -> tuple:
+        s = self.start
+        axis = (self.a, self.b, self.c, self.x0, self.y0, self.z0)
+        return (s.x, s.y, s.z, self.angle) + axis
 
     def copy(self) -> Self:
         return ArcPVA(
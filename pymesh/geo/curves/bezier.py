@@ -1,40 +1,47 @@
 """Module containing the Bezier class"""
 
+from functools import lru_cache
+import math
 from typing import Self
 
 import numpy as np
 
 from pymesh.geo.curves.curve import Curve
 from pymesh.geo.point import Point
-from pymesh.typing import NDArray3
+from pymesh.geo.point_array import PointArray
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.descriptors import AsContainerOf
 from pymesh.utils import validate_curve_path_parameters
 
-NUM_POINTS = 1000
-
 
 class Bezier(Curve):
     """Creates a bezier curve from a collection of three-dimensional points.
 
+    The point coordinates are copied into a single PointArray, such that
+    the curve can be transformed with one matrix operation. The curve
+    therefore no longer shares coordinates with the points it was created
+    from: moving these points afterwards leaves the curve unchanged, while
+    the points of the curve are modified through the points attribute.
+
     Attributes:
-        points (list[Point] | tuple[Point]): List or tuple of points.
+        points (PointArray): Array of points, set from a list or tuple of points.
     """
 
-    points = AsContainerOf(tuple, Point, min_length=2)
+    points = AsContainerOf(tuple, Point, min_length=2, return_type=PointArray)
 
-    def __init__(self, points: list[Point] | tuple[Point]):
+    def __init__(self, points: list[Point] | tuple[Point] | PointArray):
         """Initialization method.
 
         Args:
-            points: List or tuple of points.
+            points: List, tuple or PointArray of points.
 
         Raises:
-            TypeError: If points is not a list or tuple
+            TypeError: If points is not a list, tuple or PointArray
             ValueError: If points has less than two elements.
             TypeError: If elements of points are not of type Point.
         """
-        if not isinstance(points, (tuple, list)):
-            raise TypeError(f"{points!r} is not a tuple or list")
+        if not isinstance(points, (tuple, list, PointArray)):
+            raise TypeError(f"{points!r} is not a tuple, list or PointArray")
         self.points = tuple(points)
 
     def __eq__(self, other):
@@ -70,39 +77,42 @@ class Bezier(Curve):
 
     @property
     def length(self) -> float:
-        distance = 0.0
-        xyz0 = self.path(0)
-        for u in np.linspace(start=0, stop=1, num=NUM_POINTS, endpoint=True):
-            xyz1 = self.path(u)
-            distance += np.sqrt(np.sum((xyz1 - xyz0) ** 2))
-            xyz0 = xyz1
-        return distance
+        return self._get_integrated_length()
+
+    @property
+    def control_points(self) -> NDArrayNx3[np.float64]:
+        """Control point coordinates as a read-only numpy ndarray with shape (n, 3)."""
+        return self.points.xyz
 
     def path(self, u: int | float, flip: bool = False) -> NDArray3[np.float64]:
         u = validate_curve_path_parameters(u, flip)
+        return self._path_array(np.array(u))
+
+    def _path_array(self, u: NDArrayN[np.float64]) -> NDArrayNx3[np.float64]:
+        return bernstein(u, self.control_points)
+
+    def _path_derivative_array(self, u: NDArrayN[np.float64]) -> NDArrayNx3[np.float64]:
+        """Evaluates the derivative from the hodograph control points.
+
+        Based on https://en.wikipedia.org/wiki/B%C3%A9zier_curve#Derivative
+        """
 
-        def bezier(points, t):
-            """Recursive bezier curve definition.
+        def get_hodograph_points():
+            xyz = self.control_points
+            return (xyz.shape[0] - 1) * np.diff(xyz, axis=0)
 
-            Based on https://en.wikipedia.org/wiki/B%C3%A9zier_curve#Constructing_B%C3%A9zier_curves
-            """
-            if len(points) == 1:
-                return points[0].xyz
-            return (1 - t) * bezier(points[0:-1], t) + t * bezier(points[1:], t)
+        return bernstein(u, self._get_cached("hodograph_points", get_hodograph_points))
 
-        return bezier(self.points, u)
+    def _cache_key(self) -> bytes:
+        return self.points.xyz.tobytes()
 
     def copy(self) -> Self:
-        points = []
-        for point in self.points:
-            points.append(point.copy())
-        return Bezier(points)
+        return Bezier(self.points)
 
     def move(
         self, dx: int | float = 0.0, dy: int | float = 0.0, dz: int | float = 0.0
     ) -> Self:
-        for point in self.points:
-            point.move(dx, dy, dz)
+        self.points.move(dx, dy, dz)
         return self
 
     def rotate(
@@ -115,8 +125,7 @@ class Bezier(Curve):
         y0: int | float = 0.0,
         z0: int | float = 0.0,
     ) -> Self:
-        for point in self.points:
-            point.rotate(angle, a, b, c, x0, y0, z0)
+        self.points.rotate(angle, a, b, c, x0, y0, z0)
         return self
 
     def mirror(
@@ -128,6 +137,34 @@ class Bezier(Curve):
         y0: int | float = 0.0,
         z0: int | float = 0.0,
     ) -> Self:
-        for point in self.points:
-            point.mirror(a, b, c, x0, y0, z0)
+        self.points.mirror(a, b, c, x0, y0, z0)
         return self
+
+
+def bernstein(
+    u: NDArrayN[np.float64], xyz: NDArrayNx3[np.float64]
+) -> NDArrayNx3[np.float64]:
+    """Evaluates a Bezier curve in the Bernstein basis at O(n*m) cost for m samples.
+
+    Based on https://en.wikipedia.org/wiki/B%C3%A9zier_curve#Explicit_definition
+
+    Args:
+        u: Float ndarray with normalized path parameters between 0 and 1.
+        xyz: Control point coordinates with shape (n, 3).
+
+    Returns:
+        (NDArrayNx3): Numpy ndarray with shape (*u.shape, 3).
+    """
+    degree = xyz.shape[0] - 1
+    k = np.arange(degree + 1)
+    t = u[..., np.newaxis]
+    basis = binomial_coefficients(degree) * t**k * (1.0 - t) ** (degree - k)
+    return basis @ xyz
+
+
+@lru_cache
+def binomial_coefficients(degree: int) -> NDArrayN[np.float64]:
+    """Returns a read-only ndarray with the binomial coefficients of degree."""
+    coefficients = np.array([math.comb(degree, k) for k in range(degree + 1)], float)
+    coefficients.flags.writeable = False
+    return coefficients
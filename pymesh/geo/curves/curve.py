@@ -1,20 +1,30 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Self
+from collections.abc import Callable, Hashable
+from typing import Any, Self
 
 import numpy as np
 
+from pymesh import instrumentation
 from pymesh.geo.point import Point
-from pymesh.descriptors import AsInstanceOf
-from pymesh.typing import NDArray3
+from pymesh.descriptors import AsInstanceOf, AsNumber
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
+from pymesh.utils import integrate_gauss_legendre, validate_curve_path_array
+
+DERIVATIVE_STEP = 1e-6
 
 
 class Curve(ABC):
     """Abstract base class used which all curve classes inherit from.
 
+    The public path methods validate their parameters. Internal callers
+    generating the parameters themselves, such as surfaces evaluated by a
+    MeshGenerator, use the unchecked _path_array kernel instead.
+
     Attributes:
         start (Point): Curve starting point.
         end (Point): Curve ending point.
+        length_tolerance (float): Relative tolerance used by curves
+            computing their length by numerical integration.
     """
 
     start = AsInstanceOf(Point)
@@ -23,6 +33,16 @@ class Curve(ABC):
     end = AsInstanceOf(Point)
     """Curve ending point."""
 
+    length_tolerance = AsNumber(minvalue=0, return_type=float)
+    """Relative tolerance used by curves computing their length by numerical integration."""
+
+    _length_tolerance: float = 1e-8
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "path" in cls.__dict__:
+            cls.path = instrumentation.counted(cls.path)
+
     @abstractmethod
     def copy(self) -> Self:
         """Returns a recursive copy of curve instance."""
@@ -137,6 +157,93 @@ class Curve(ABC):
             ValueError: If u is not part of the number set [0 1].
         """
 
+    def path_array(self, u: NDArrayN, flip: bool = False) -> NDArrayNx3[np.float64]:
+        """Vectorized curve path function evaluating all path parameters in u at once.
+
+        Args:
+            u: One-dimensional array with N normalized path parameters between 0 and 1,
+                where 0 and 1 represents the start and end locations, respectively.
+            flip: Bool specifying if path direction is flipped.
+                If True then u = (1 - u), i.e. the direction is flipped. Defaults
+                to False.
+
+        Returns:
+            (NDArrayNx3): Numpy ndarray with shape (N, 3),
+                where index [k, :] holds the point at u[k].
+
+        Raises:
+            TypeError: If u does not contain int or float numbers.
+            ValueError: If u is not one-dimensional.
+            ValueError: If u contains values not part of the number set [0 1].
+        """
+        if instrumentation.enabled:
+            instrumentation.count(f"{type(self).__name__}.path_array")
+        u = validate_curve_path_array(u, flip)
+        if u.ndim != 1:
+            raise ValueError("Expected u to be a one-dimensional array")
+        return self._path_array(u)
+
+    def _path_array(self, u: NDArrayN[np.float64]) -> NDArrayNx3[np.float64]:
+        """Vectorized curve path function used by path_array.
+
+        Takes a float ndarray u and returns a numpy ndarray with shape
+        (*u.shape, 3). Part of the trusted evaluation path: u is not
+        validated, and must only hold values between 0 and 1. Falls back
+        to calling path once for every value in u. Subclasses with a
+        closed-form expression should override this method.
+        """
+        xyz = [self.path(float(value)) for value in u.ravel()]
+        return np.reshape(xyz, u.shape + (3,))
+
+    def _path_derivative_array(self, u: NDArrayN[np.float64]) -> NDArrayNx3[np.float64]:
+        """Returns the path derivative dxyz/du, shaped (*u.shape, 3).
+
+        Uses central differences of _path_array by default, falling back
+        to one-sided differences at the ends of the path. Subclasses with
+        a closed-form derivative should override this method.
+        """
+        u0 = np.clip(u - DERIVATIVE_STEP, 0.0, 1.0)
+        u1 = np.clip(u + DERIVATIVE_STEP, 0.0, 1.0)
+        dxyz = self._path_array(u1) - self._path_array(u0)
+        return dxyz / (u1 - u0)[..., np.newaxis]
+
+    def _get_integrated_length(self) -> float:
+        """Returns the curve length by adaptive Gauss-Legendre integration of the path speed.
+
+        The result is cached until the curve geometry or length_tolerance changes.
+        """
+
+        def speed(u):
+            return np.sqrt(np.sum(self._path_derivative_array(u) ** 2, axis=-1))
+
+        tolerance = self.length_tolerance
+        return self._get_cached(
+            ("length", tolerance), lambda: integrate_gauss_legendre(speed, tolerance)
+        )
+
     def get_path(self) -> Callable[[int | float, bool], NDArray3[np.float64]]:
         """Returns curve path function"""
         return self.path
+
+    def _cache_key(self) -> Hashable | None:
+        """Returns a key with the values defining the curve geometry.
+
+        Cached derived geometry is discarded whenever the key changes,
+        e.g. after move, rotate, mirror or mutation of the curve points.
+        Returning None disables caching.
+        """
+        return None
+
+    def _get_cached(self, name: Hashable, fn: Callable[[], Any]) -> Any:
+        """Returns the value of fn, cached under name until the curve geometry changes."""
+        key = self._cache_key()
+        if key is None:
+            return fn()
+        cache = self.__dict__.get("_cache")
+        if cache is None or cache[0] != key:
+            cache = (key, {})
+            self._cache = cache  # pylint: disable=attribute-defined-outside-init
+        values = cache[1]
+        if name not in values:
+            values[name] = fn()
+        return values[name]
@@ -4,7 +4,7 @@ import numpy as np
 
 from pymesh.geo.curves.curve import Curve
 from pymesh.geo.point import Point
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.utils import validate_curve_path_parameters
 
 
@@ -44,7 +44,14 @@ class Line(Curve):
 
     def path(self, u: int | float, flip: bool = False) -> NDArray3[np.float64]:
         u = validate_curve_path_parameters(u, flip)
-        return self.start.xyz + (self.end - self.start) * u
+        return self._path_array(np.array(u))
+
+    def _path_array(self, u: NDArrayN[np.float64]) -> NDArrayNx3[np.float64]:
+        return self.start.xyz + (self.end - self.start) * u[..., np.newaxis]
+
+    def _cache_key(self) -> tuple:
+        s, e = self.start, self.end
+        return (s.x, s.y, s.z, e.x, e.y, e.z)
 
     def copy(self) -> Self:
         return Line(self.start.copy(), self.end.copy())
@@ -6,11 +6,13 @@ import numpy as np
 
 from pymesh.geo.curves.curve import Curve
 from pymesh.geo.point import Point
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArray4x4, NDArrayN, NDArrayNx3
 from pymesh.utils import (
     validate_curve_path_parameters,
-    rotate_point_xyz,
-    mirror_point_xyz,
+    get_mirror_affine,
+    get_rotation_affine,
+    get_translation_affine,
+    transform_points_affine,
 )
 
 NUM_POINTS = 1000
@@ -23,6 +25,11 @@ TOLERANCE = 1e-3
 class UserDefinedCurve(Curve):
     """Generic curve with a user defined path function.
 
+    The user defined path function is kept as is. Transformations by move,
+    rotate and mirror are composed into a single affine matrix, applied once
+    to the path points of every evaluation, such that the evaluation cost does
+    not depend on the number of transformations.
+
     For more information, see Curve documentation.
     """
 
@@ -46,6 +53,8 @@ class UserDefinedCurve(Curve):
                 f"Expected path function to return a numpy ndarray of shape (3,), but got {result.shape}"
             )
         self._path = path
+        # composed affine transformation of the path, None if not transformed
+        self._affine: NDArray4x4[np.float64] | None = None
 
     def __eq__(self, other):
         is_equal = True
@@ -79,31 +88,41 @@ class UserDefinedCurve(Curve):
 
     @property
     def length(self) -> float:
-        distance = 0.0
-        xyz0 = self.path(0)
-        for u in np.linspace(start=0, stop=1, num=NUM_POINTS, endpoint=True):
-            xyz1 = self.path(u)
-            distance += np.sqrt(np.sum((xyz1 - xyz0) ** 2))
-            xyz0 = xyz1
-        return distance
+        return self._get_integrated_length()
 
     def path(self, u: int | float, flip: bool = False) -> NDArray3[np.float64]:
         u = validate_curve_path_parameters(u, flip)
-        return self._path(u)
+        xyz = self._path(u)
+        if self._affine is None:
+            return xyz
+        return transform_points_affine(xyz, self._affine)
+
+    def _path_array(self, u: NDArrayN[np.float64]) -> NDArrayNx3[np.float64]:
+        # user-defined path functions are only guaranteed to accept scalars
+        xyz = np.array([self._path(float(value)) for value in u.ravel()])
+        xyz = np.reshape(xyz, u.shape + (3,))
+        if self._affine is None:
+            return xyz
+        return transform_points_affine(xyz, self._affine)
+
+    def _transform(self, affine: NDArray4x4[np.float64]) -> Self:
+        """Composes affine with the transformation of the path."""
+        self._affine = affine if self._affine is None else affine @ self._affine
+        return self
+
+    def _cache_key(self) -> tuple:
+        affine = None if self._affine is None else self._affine.tobytes()
+        return (self._path, affine)
 
     def copy(self) -> Self:
-        return UserDefinedCurve(copy.copy(self._path))
+        curve = UserDefinedCurve(copy.copy(self._path))
+        curve._affine = self._affine
+        return curve
 
     def move(
         self, dx: int | float = 0.0, dy: int | float = 0.0, dz: int | float = 0.0
     ) -> Self:
-        _path = copy.copy(self._path)
-
-        def moved_path(u):
-            return _path(u) + np.array([dx, dy, dz])
-
-        self._path = moved_path
-        return self
+        return self._transform(get_translation_affine(dx, dy, dz))
 
     def rotate(
         self,
@@ -115,14 +134,7 @@ class UserDefinedCurve(Curve):
         y0: int | float = 0.0,
         z0: int | float = 0.0,
     ) -> Self:
-        _path = copy.copy(self._path)
-
-        def rotated_path(u):
-            x, y, z = _path(u)
-            return rotate_point_xyz(x, y, z, angle, a, b, c, x0, y0, z0)
-
-        self._path = rotated_path
-        return self
+        return self._transform(get_rotation_affine(angle, a, b, c, x0, y0, z0))
 
     def mirror(
         self,
@@ -133,11 +145,4 @@ class UserDefinedCurve(Curve):
         y0: int | float = 0.0,
         z0: int | float = 0.0,
     ) -> Self:
-        _path = copy.copy(self._path)
-
-        def mirored_path(u):
-            x, y, z = _path(u)
-            return mirror_point_xyz(x, y, z, a, b, c, x0, y0, z0)
-
-        self._path = mirored_path
-        return self
+        return self._transform(get_mirror_affine(a, b, c, x0, y0, z0))
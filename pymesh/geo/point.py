@@ -3,7 +3,6 @@ from typing import Self
 
 import numpy as np
 
-from pymesh.descriptors import AsNumber
 from pymesh.typing import NDArray3
 from pymesh.utils import rotate_point_xyz, mirror_point_xyz
 
@@ -11,18 +10,20 @@ from pymesh.utils import rotate_point_xyz, mirror_point_xyz
 class Point:
     """Point class with xyz coordinates in three-dimensional space.
 
+    The coordinates are stored in a single float64 buffer, validated
+    once when set.
+
     Attributes:
         x (int | float): Point x coordinate.
         y (int | float): Point y coordinate.
         z (int | float): Point z coordinate.
-        xyz (NDArray3[float]): Numpy ndarray with x, y and z values.
-            The numpy ndarray has shape (3,) with x at index 0, y at
-            index 1 and z at index 2.
+        xyz (NDArray3[float]): Read-only numpy ndarray view of the x, y
+            and z values. The view has shape (3,) with x at index 0, y at
+            index 1 and z at index 2, and it reflects later changes to
+            the point coordinates.
     """
 
-    x = AsNumber(return_type=float)
-    y = AsNumber(return_type=float)
-    z = AsNumber(return_type=float)
+    __slots__ = ("_xyz", "_xyz_view")
 
     def __init__(self, x: int | float, y: int | float, z: int | float) -> None:
         """Initialization method.
@@ -32,11 +33,58 @@ class Point:
             y: Point y coordinate.
             z: Point z coordinate.
         """
+        self._set_buffer(np.empty(3))
         self.x, self.y, self.z = x, y, z
 
+    @classmethod
+    def _from_buffer(cls, buffer: NDArray3[np.float64]) -> Self:
+        """Returns a point whose coordinates are stored in buffer, without copying."""
+        point = cls.__new__(cls)
+        point._set_buffer(buffer)
+        return point
+
+    def _set_buffer(self, buffer: NDArray3[np.float64]) -> None:
+        """Sets the float64 buffer of shape (3,) holding the point coordinates."""
+        self._xyz = buffer
+        self._xyz_view = buffer.view()
+        self._xyz_view.flags.writeable = False
+
+    @staticmethod
+    def _validate_coordinate(value: int | float) -> float:
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Expected {value!r} to be an int or float")
+        return float(value)
+
+    @property
+    def x(self) -> float:
+        return self._xyz.item(0)
+
+    @x.setter
+    def x(self, value: int | float) -> None:
+        self._xyz[0] = self._validate_coordinate(value)
+
+    @property
+    def y(self) -> float:
+        return self._xyz.item(1)
+
+    @y.setter
+    def y(self, value: int | float) -> None:
+        self._xyz[1] = self._validate_coordinate(value)
+
+    @property
+    def z(self) -> float:
+        return self._xyz.item(2)
+
+    @z.setter
+    def z(self, value: int | float) -> None:
+        self._xyz[2] = self._validate_coordinate(value)
+
     @property
     def xyz(self) -> NDArray3[np.float64]:
-        return np.array([self.x, self.y, self.z])
+        return self._xyz_view
+
+    def __reduce__(self):
+        return (type(self), (self.x, self.y, self.z))
 
     def __eq__(self, other) -> bool:
         DECIMALS = 10
@@ -49,10 +97,10 @@ class Point:
         return not self.__eq__(other)
 
     def __add__(self, other):
-        return self.xyz + other.xyz
+        return self._xyz + other.xyz
 
     def __sub__(self, other):
-        return self.xyz - other.xyz
+        return self._xyz - other.xyz
 
     def __repr__(self):
         return f"{type(self).__name__}(x={self.x:.2f}, y={self.y:.2f}, z={self.z:.2f})"
@@ -72,12 +120,8 @@ class Point:
         Returns:
             (Point): Point with updated xyz coordinates.
         """
-        for val in (dx, dy, dz):
-            if not isinstance(val, (int, float)):
-                raise TypeError(f"Expected {val!r} to be an int or float")
-        self.x += float(dx)
-        self.y += float(dy)
-        self.z += float(dz)
+        dxyz = [self._validate_coordinate(val) for val in (dx, dy, dz)]
+        self._xyz += dxyz
         return self
 
     def rotate(
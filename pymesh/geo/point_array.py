@@ -0,0 +1,161 @@
+from collections.abc import Iterator, Sequence
+import operator
+from typing import Self, overload
+
+import numpy as np
+
+from pymesh.geo.point import Point
+from pymesh.typing import NDArrayNx3
+from pymesh.utils import mirror_points_xyz, rotate_points_xyz
+
+
+class PointArray:
+    """Collection of points with xyz coordinates stored in a single array.
+
+    Transformations are applied to all points at once, which is much
+    faster than transforming many Point instances one by one.
+
+    Indexing and iterating yields Point instances sharing coordinates with
+    the array, such that changes made to these points are reflected in the
+    array and vice versa. Likewise, slicing returns a PointArray sharing
+    coordinates with the array.
+
+    Attributes:
+        xyz (NDArrayNx3[float]): Read-only numpy ndarray view of the point
+            coordinates with shape (N, 3).
+    """
+
+    def __init__(self, points: Sequence[Point] | NDArrayNx3) -> None:
+        """Initialization method.
+
+        Args:
+            points: Points or point coordinates shaped (N, 3).
+                The coordinates are copied into a new array.
+
+        Raises:
+            TypeError: If points is neither a sequence of Point instances
+                nor a numeric ndarray.
+            ValueError: If the point coordinates are not shaped (N, 3).
+        """
+        if isinstance(points, np.ndarray):
+            if points.dtype.kind not in "iuf":
+                raise TypeError(f"Expected {points!r} to have a numeric dtype")
+            xyz = np.array(points, dtype=np.float64)
+        else:
+            for point in points:
+                if not isinstance(point, Point):
+                    raise TypeError(f"Expected {point!r} to be {Point!r}")
+            xyz = np.array([point.xyz for point in points], dtype=np.float64)
+            xyz = xyz.reshape(-1, 3)
+        if xyz.ndim != 2 or xyz.shape[1] != 3:
+            raise ValueError("Expected point coordinates with shape (N, 3)")
+        self._set_buffer(xyz)
+
+    @classmethod
+    def _from_buffer(cls, buffer: NDArrayNx3[np.float64]) -> Self:
+        """Returns a point array whose coordinates are stored in buffer, without copying."""
+        point_array = cls.__new__(cls)
+        point_array._set_buffer(buffer)
+        return point_array
+
+    def _set_buffer(self, buffer: NDArrayNx3[np.float64]) -> None:
+        """Sets the float64 buffer of shape (N, 3) holding the point coordinates."""
+        self._xyz = buffer
+        self._xyz_view = buffer.view()
+        self._xyz_view.flags.writeable = False
+
+    def __reduce__(self):
+        return (type(self), (self._xyz,))
+
+    @property
+    def xyz(self) -> NDArrayNx3[np.float64]:
+        return self._xyz_view
+
+    def __len__(self) -> int:
+        return self._xyz.shape[0]
+
+    @overload
+    def __getitem__(self, index: int) -> Point: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> Point | Self:
+        if isinstance(index, slice):
+            return self._from_buffer(self._xyz[index])
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError(f"Expected {index!r} to be an integer or a slice") from None
+        return Point._from_buffer(self._xyz[index])
+
+    def __iter__(self) -> Iterator[Point]:
+        for row in self._xyz:
+            yield Point._from_buffer(row)
+
+    def __eq__(self, other) -> bool:
+        DECIMALS = 10
+        if not isinstance(other, PointArray) or len(self) != len(other):
+            return False
+        return np.all(
+            np.round(self.xyz, decimals=DECIMALS)
+            == np.round(other.xyz, decimals=DECIMALS)
+        )
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(points={list(self)!r})"
+
+    def copy(self) -> Self:
+        """Returns a copy of point array instance"""
+        return PointArray(self._xyz)
+
+    def move(self, dx: int | float, dy: int | float, dz: int | float) -> Self:
+        """Moves all point coordinates in space.
+
+        Args:
+            dx: Distance moved in the x-direction.
+            dy: Distance moved in the y-direction.
+            dz: Distance moved in the z-direction.
+
+        Returns:
+            (PointArray): Point array with updated xyz coordinates.
+        """
+        dxyz = [Point._validate_coordinate(val) for val in (dx, dy, dz)]
+        self._xyz += dxyz
+        return self
+
+    def rotate(
+        self,
+        angle: int | float,
+        a: int | float,
+        b: int | float,
+        c: int | float,
+        x0: int | float = 0.0,
+        y0: int | float = 0.0,
+        z0: int | float = 0.0,
+    ) -> Self:
+        """Rotates all points around an axis.
+
+        Parameters are passed to [pymesh.utils.rotate_points_xyz][].
+        """
+        self._xyz[:] = rotate_points_xyz(self._xyz, angle, a, b, c, x0, y0, z0)
+        return self
+
+    def mirror(
+        self,
+        a: int | float,
+        b: int | float,
+        c: int | float,
+        x0: int | float = 0.0,
+        y0: int | float = 0.0,
+        z0: int | float = 0.0,
+    ) -> Self:
+        """Mirrors all points in a plane.
+
+        Parameters are passed to [pymesh.utils.mirror_points_xyz][].
+        """
+        self._xyz[:] = mirror_points_xyz(self._xyz, a, b, c, x0, y0, z0)
+        return self
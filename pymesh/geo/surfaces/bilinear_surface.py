@@ -5,7 +5,7 @@ import numpy as np
 from pymesh.descriptors import AsInstanceOf
 from pymesh.geo.point import Point
 from pymesh.geo.surfaces.surface import Surface
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.utils import validate_surface_path_parameters
 
 
@@ -64,6 +64,12 @@ class BilinearSurface(Surface):
         self, u: int | float, w: int | float, uflip: bool = False, wflip: bool = False
     ) -> NDArray3[np.float64]:
         u, w = validate_surface_path_parameters(u, w, uflip, wflip)
+        return self._path_array(np.array(u), np.array(w))
+
+    def _path_array(
+        self, u: NDArrayN[np.float64], w: NDArrayN[np.float64]
+    ) -> NDArrayNx3[np.float64]:
+        u, w = u[..., np.newaxis], w[..., np.newaxis]
         return (
             (1 - u) * w * self.p00.xyz
             + u * w * self.p10.xyz
@@ -80,6 +86,9 @@ class BilinearSurface(Surface):
         length_w = float(np.max((length_w_left, length_w_right)))
         return length_u, length_w
 
+    def _cache_key(self) -> tuple | None:
+        return self._get_points_key(self.p00, self.p10, self.p11, self.p01)
+
     def copy(self) -> Self:
         copy = BilinearSurface(
             self.p00.copy(),
@@ -5,7 +5,7 @@ import numpy as np
 from pymesh.exceptions import CurveIntersectionError
 from pymesh.geo.curves.curve import Curve
 from pymesh.geo.surfaces.surface import Surface
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.utils import validate_surface_path_parameters
 
 # ! Consider using sets instead of list|tuple: enforcing uniquenes !
@@ -102,24 +102,35 @@ class CoonsPatch(Surface):
         self, u: int | float, w: int | float, uflip: bool = False, wflip: bool = False
     ) -> NDArray3[np.float64]:
         u, w = validate_surface_path_parameters(u, w, uflip, wflip)
+        return self._path_array(np.array(u), np.array(w))
+
+    def _path_array(
+        self, u: NDArrayN[np.float64], w: NDArrayN[np.float64]
+    ) -> NDArrayNx3[np.float64]:
         curve_u0, curve_u1, curve_0w, curve_1w = self.curves
         fu0, fu1, f0w, f1w = self._flipped_curves
 
         def path_u0(x):
-            return curve_u0.path(x, flip=fu0)
+            return self._sample_curve(curve_u0, x, flip=fu0)
 
         def path_u1(x):
-            return curve_u1.path(x, flip=fu1)
+            return self._sample_curve(curve_u1, x, flip=fu1)
 
         def path_0w(x):
-            return curve_0w.path(x, flip=f0w)
+            return self._sample_curve(curve_0w, x, flip=f0w)
 
         def path_1w(x):
-            return curve_1w.path(x, flip=f1w)
-
-        p00, p11, p01, p10 = path_u0(0), path_u1(1), path_0w(1), path_1w(0)
-        p1 = (1 - u) * path_0w(w) + u * path_1w(w)
-        p2 = (1 - w) * path_u0(u) + w * path_u1(u)
+            return self._sample_curve(curve_1w, x, flip=f1w)
+
+        p00 = path_u0(np.array(0.0))
+        p11 = path_u1(np.array(1.0))
+        p01 = path_0w(np.array(1.0))
+        p10 = path_1w(np.array(0.0))
+        xyz_u0, xyz_u1 = path_u0(u), path_u1(u)
+        xyz_0w, xyz_1w = path_0w(w), path_1w(w)
+        u, w = u[..., np.newaxis], w[..., np.newaxis]
+        p1 = (1 - u) * xyz_0w + u * xyz_1w
+        p2 = (1 - w) * xyz_u0 + w * xyz_u1
         p3 = (
             (1 - u) * (1 - w) * p00
             + u * (1 - w) * p10
@@ -134,6 +145,10 @@ class CoonsPatch(Surface):
         max_length_w = max(curve_0w.length, curve_1w.length)
         return max_length_u, max_length_w
 
+    def _cache_key(self) -> tuple | None:
+        key = self._get_curves_key(*self.curves)
+        return None if key is None else (key, self._flipped_curves)
+
     def copy(self) -> Self:
         curve_u0, curve_u1, curve_0w, curve_1w = self.curves
         curves_copy = (
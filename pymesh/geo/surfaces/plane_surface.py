@@ -5,7 +5,7 @@ import numpy as np
 from pymesh.descriptors import AsInstanceOf
 from pymesh.geo.point import Point
 from pymesh.geo.surfaces.surface import Surface
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.utils import validate_surface_path_parameters
 
 
@@ -60,6 +60,12 @@ class PlaneSurface(Surface):
     ) -> NDArray3[np.float64]:
         # ! find a way to add np.ndarray to Point using __add__
         u, w = validate_surface_path_parameters(u, w, uflip, wflip)
+        return self._path_array(np.array(u), np.array(w))
+
+    def _path_array(
+        self, u: NDArrayN[np.float64], w: NDArrayN[np.float64]
+    ) -> NDArrayNx3[np.float64]:
+        u, w = u[..., np.newaxis], w[..., np.newaxis]
         xyz0 = self.point0.xyz
         u_point = (self.point1 - self.point0) * u
         w_point = (self.point2 - self.point0) * w
@@ -70,6 +76,9 @@ class PlaneSurface(Surface):
         length_w = float(np.sqrt(np.sum((self.point2 - self.point0) ** 2)))
         return length_u, length_w
 
+    def _cache_key(self) -> tuple | None:
+        return self._get_points_key(self.point0, self.point1, self.point2)
+
     def copy(self) -> Self:
         copy = PlaneSurface(self.point0.copy(), self.point1.copy(), self.point2.copy())
         copy._is_normal_flipped = self._is_normal_flipped
@@ -5,7 +5,7 @@ import numpy as np
 from pymesh.descriptors import AsInstanceOf
 from pymesh.geo.curves.curve import Curve
 from pymesh.geo.surfaces.surface import Surface
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.utils import validate_surface_path_parameters
 
 
@@ -52,7 +52,18 @@ class RuledSurface(Surface):
         self, u: int | float, w: int | float, uflip: bool = False, wflip: bool = False
     ) -> NDArray3[np.float64]:
         u, w = validate_surface_path_parameters(u, w, uflip, wflip)
-        return (1 - w) * self.curve1.path(u) + w * self.curve2.path(u)
+        return self._path_array(np.array(u), np.array(w))
+
+    def _path_array(
+        self, u: NDArrayN[np.float64], w: NDArrayN[np.float64]
+    ) -> NDArrayNx3[np.float64]:
+        xyz1 = self._sample_curve(self.curve1, u)
+        xyz2 = self._sample_curve(self.curve2, u)
+        w = w[..., np.newaxis]
+        return (1 - w) * xyz1 + w * xyz2
+
+    def _cache_key(self) -> tuple | None:
+        return self._get_curves_key(self.curve1, self.curve2)
 
     def copy(self) -> Self:
         copy = RuledSurface(self.curve1.copy(), self.curve2.copy())
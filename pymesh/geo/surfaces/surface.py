@@ -1,16 +1,26 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Self
+from collections.abc import Callable, Hashable
+from typing import Self, TYPE_CHECKING
 
 import numpy as np
 
-from pymesh.typing import NDArray3
+from pymesh import instrumentation
+from pymesh.typing import NDArray3, NDArray3xNxN, NDArrayN, NDArrayNx3
+from pymesh.utils import validate_surface_path_arrays
+
+if TYPE_CHECKING:
+    from pymesh.geo.curves.curve import Curve
+    from pymesh.geo.point import Point
 
 
 class Surface(ABC):
     """Abstract base class used which all surface classes inherit from.
 
+    The public path methods validate their parameters. Internal callers
+    generating the parameters themselves, such as a MeshGenerator, use the
+    unchecked _path_grid and _path_array kernels instead.
+
     Attributes:
         is_normal_flipped (bool): Specifies surface normal direction.
     """
@@ -18,6 +28,11 @@ class Surface(ABC):
     _all_surfaces: list = []
     _is_normal_flipped: bool = False
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "path" in cls.__dict__:
+            cls.path = instrumentation.counted(cls.path)
+
     @property
     def is_normal_flipped(self) -> bool:
         return self._is_normal_flipped
@@ -123,6 +138,29 @@ class Surface(ABC):
             TypeError: If input value are not of type int or float.
         """
 
+    def _cache_key(self) -> Hashable | None:
+        """Returns a key with the values defining the surface geometry.
+
+        The key changes whenever the surface geometry changes, and is None
+        if any of the defining curves has no key. The normal direction is
+        not part of the key.
+        """
+        return None
+
+    @staticmethod
+    def _get_points_key(*points: Point) -> tuple[tuple[float]]:
+        """Returns a key with the coordinates of points."""
+        return tuple((point.x, point.y, point.z) for point in points)
+
+    @staticmethod
+    def _get_curves_key(*curves: Curve) -> tuple | None:
+        """Returns a key with the type and geometry key of curves,
+        or None if any curve does not have a geometry key."""
+        keys = tuple(curve._cache_key() for curve in curves)
+        if any(key is None for key in keys):
+            return None
+        return tuple(zip((type(curve).__name__ for curve in curves), keys))
+
     def get_path(
         self,
     ) -> Callable[[int | float, int | float, bool, bool], NDArray3[np.float64]]:
@@ -153,6 +191,120 @@ class Surface(ABC):
             ValueError: If u or w are not part of the number set [0 1].
         """
 
+    def path_grid(
+        self, u: NDArrayN, w: NDArrayN, uflip: bool = False, wflip: bool = False
+    ) -> NDArray3xNxN[np.float64]:
+        """Evaluates the surface path on the grid spanned by the u and w parameters.
+
+        The whole grid is evaluated using numpy broadcasting, making it the preferred
+        alternative to calling the path method once for every (u, w) combination.
+
+        Args:
+            u: One-dimensional array with Nu normalized path parameters between 0 and 1.
+            w: One-dimensional array with Nw normalized path parameters between 0 and 1.
+            uflip: Defaults to False.
+                If True then u = (1 - u), i.e. the direction is flipped.
+            wflip: Defaults to False.
+                If True then w = (1 - w), i.e. the direction is flipped.
+
+        Returns:
+            (NDArray3xNxN[float]): Numpy ndarray with shape (3, Nu, Nw),
+                where index [:, i, j] holds the point at (u[i], w[j]).
+
+        Raises:
+            TypeError: If u or w do not contain int or float numbers.
+            ValueError: If u or w are not one-dimensional.
+            ValueError: If u or w contain values not part of the number set [0 1].
+        """
+        u, w = validate_surface_path_arrays(u, w, uflip, wflip)
+        if u.ndim != 1 or w.ndim != 1:
+            raise ValueError("Expected u and w to be one-dimensional arrays")
+        return self._path_grid(u, w)
+
+    def _path_grid(
+        self, u: NDArrayN[np.float64], w: NDArrayN[np.float64]
+    ) -> NDArray3xNxN[np.float64]:
+        """Unchecked counterpart of path_grid, part of the trusted evaluation path.
+
+        Args:
+            u: One-dimensional float ndarray with values between 0 and 1.
+            w: One-dimensional float ndarray with values between 0 and 1.
+
+        Returns:
+            (NDArray3xNxN[float]): Numpy ndarray with shape (3, Nu, Nw).
+        """
+        if instrumentation.enabled:
+            instrumentation.count(f"{type(self).__name__}.path_grid")
+        xyz = self._path_array(u[:, np.newaxis], w[np.newaxis, :])
+        return np.moveaxis(xyz, -1, 0)
+
+    def path_pairs(
+        self, u: NDArrayN, w: NDArrayN, uflip: bool = False, wflip: bool = False
+    ) -> NDArrayNx3[np.float64]:
+        """Evaluates the surface path at scattered (u, w) parameter pairs.
+
+        Args:
+            u: One-dimensional array with N normalized path parameters between 0 and 1.
+            w: One-dimensional array with N normalized path parameters between 0 and 1.
+            uflip: Defaults to False.
+                If True then u = (1 - u), i.e. the direction is flipped.
+            wflip: Defaults to False.
+                If True then w = (1 - w), i.e. the direction is flipped.
+
+        Returns:
+            (NDArrayNx3[float]): Numpy ndarray with shape (N, 3),
+                where index [k, :] holds the point at (u[k], w[k]).
+
+        Raises:
+            TypeError: If u or w do not contain int or float numbers.
+            ValueError: If u and w are not one-dimensional and of equal length.
+            ValueError: If u or w contain values not part of the number set [0 1].
+        """
+        if instrumentation.enabled:
+            instrumentation.count(f"{type(self).__name__}.path_pairs")
+        u, w = validate_surface_path_arrays(u, w, uflip, wflip)
+        if u.ndim != 1 or u.shape != w.shape:
+            raise ValueError("Expected u and w to be one-dimensional and equal length")
+        return self._path_array(u, w)
+
+    def _path_array(
+        self, u: NDArrayN[np.float64], w: NDArrayN[np.float64]
+    ) -> NDArrayNx3[np.float64]:
+        """Vectorized surface path function used by path_grid and path_pairs.
+
+        Part of the trusted evaluation path: the parameters are not validated,
+        and must be float ndarrays with values between 0 and 1. Falls back to
+        calling path once for every (u, w) pair. Subclasses with a closed-form
+        expression should override this method, sampling their curves with
+        _sample_curve, which stays on the trusted path.
+
+        Args:
+            u: Float ndarray with values between 0 and 1.
+            w: Float ndarray with values between 0 and 1, broadcastable against u.
+
+        Returns:
+            (NDArrayNx3[float]): Numpy ndarray with shape (*S, 3),
+                where S is the broadcast shape of u and w.
+        """
+        u, w = np.broadcast_arrays(u, w)
+        xyz = [self.path(float(u_), float(w_)) for u_, w_ in zip(u.ravel(), w.ravel())]
+        return np.reshape(xyz, u.shape + (3,))
+
+    @staticmethod
+    def _sample_curve(
+        curve, u: NDArrayN[np.float64], flip: bool = False
+    ) -> NDArrayNx3[np.float64]:
+        """Returns curve path points for each value in u, shaped (*u.shape, 3).
+
+        Part of the trusted evaluation path: u is not validated, and must be
+        a float ndarray with values between 0 and 1.
+        """
+        if instrumentation.enabled:
+            instrumentation.count(f"{type(curve).__name__}.path_array")
+        if flip:
+            u = 1.0 - u
+        return curve._path_array(u.ravel()).reshape(u.shape + (3,))
+
     @abstractmethod
     def get_max_lengths(self) -> tuple[float]:
         """Returns a tuple of shape (2,) with the longest surface
@@ -5,7 +5,7 @@ import numpy as np
 from pymesh.descriptors import AsInstanceOf
 from pymesh.geo.curves.curve import Curve
 from pymesh.geo.surfaces.surface import Surface
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayN, NDArrayNx3
 from pymesh.utils import validate_surface_path_parameters
 
 
@@ -47,8 +47,18 @@ class SweptSurface(Surface):
         self, u: int | float, w: int | float, uflip: bool = False, wflip: bool = False
     ) -> NDArray3[np.float64]:
         u, w = validate_surface_path_parameters(u, w, uflip, wflip)
-        sweep = self.sweeper.path(w) - self.sweeper.path(0)
-        return self.curve.path(u) + sweep
+        return self._path_array(np.array(u), np.array(w))
+
+    def _path_array(
+        self, u: NDArrayN[np.float64], w: NDArrayN[np.float64]
+    ) -> NDArrayNx3[np.float64]:
+        sweep = self._sample_curve(self.sweeper, w) - self._sample_curve(
+            self.sweeper, np.array(0.0)
+        )
+        return self._sample_curve(self.curve, u) + sweep
+
+    def _cache_key(self) -> tuple | None:
+        return self._get_curves_key(self.curve, self.sweeper)
 
     def copy(self) -> Self:
         copy = SweptSurface(self.curve.copy(), self.sweeper.copy())
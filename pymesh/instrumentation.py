@@ -0,0 +1,188 @@
+"""Opt-in instrumentation of the meshing pipeline.
+
+Records the time spent in each stage of the pipeline and counts calls to the
+curve and surface path methods. Instrumentation is disabled by default, in which
+case every hook reduces to a check of the module-level enabled flag.
+
+Stages:
+    - curve_length: boundary curve lengths computed when adding surfaces
+    - distribution_sampling: sampling of the mesh distributions
+    - surface_evaluation: evaluation of the surface mesh point grids
+    - instancing: transformation of mesh point grids of surface instances
+    - panel_assembly: assembly of panels from the mesh point grids
+    - formatting: formatting of panel lines when writing GDF files
+    - parsing: parsing of panel lines when reading GDF files
+    - io: writing panels to file
+
+Counters are named '<ClassName>.<method>', e.g. 'Bezier.path_array'.
+
+Examples:
+    >>> from pymesh import instrumentation
+    >>> with instrumentation.collect():
+    ...     GDFWriter(mesh).write(Path("mesh.gdf"))
+    >>> print(instrumentation.report_json(indent=2))
+
+Note:
+    Only the calling process is instrumented. Surfaces meshed in worker
+    processes, see [pymesh.mesh.mesh_generator.MeshGenerator.get_panel_array][],
+    are not recorded.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import functools
+import json
+import threading
+import time
+
+CURVE_LENGTH = "curve_length"
+DISTRIBUTION_SAMPLING = "distribution_sampling"
+SURFACE_EVALUATION = "surface_evaluation"
+INSTANCING = "instancing"
+PANEL_ASSEMBLY = "panel_assembly"
+FORMATTING = "formatting"
+PARSING = "parsing"
+IO = "io"
+
+enabled = False
+"""True if instrumentation is enabled. Checked by every hook before recording."""
+
+_lock = threading.Lock()
+_timers: dict[str, list[int | float]] = {}
+_counters: dict[str, int] = {}
+
+
+class _Timer:
+    """Context manager adding the elapsed time to a named stage."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        add_time(self.name, time.perf_counter() - self.start)
+
+
+class _NullTimer:
+    """Context manager doing nothing, returned by timer while disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def enable() -> None:
+    """Enables instrumentation."""
+    global enabled  # pylint: disable=global-statement
+    enabled = True
+
+
+def disable() -> None:
+    """Disables instrumentation. Recorded results are kept until reset."""
+    global enabled  # pylint: disable=global-statement
+    enabled = False
+
+
+def reset() -> None:
+    """Discards all recorded timers and counters."""
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+@contextmanager
+def collect() -> Iterator[None]:
+    """Context manager resetting and enabling instrumentation for its duration.
+
+    The enabled state is restored on exit, while the results are kept.
+    """
+    previous = enabled
+    reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not previous:
+            disable()
+
+
+def timer(name: str) -> _Timer | _NullTimer:
+    """Returns a context manager timing a stage.
+
+    Args:
+        name: Stage name, e.g. [SURFACE_EVALUATION][pymesh.instrumentation.SURFACE_EVALUATION].
+
+    Returns:
+        Context manager adding its elapsed time to the stage if enabled,
+            and doing nothing otherwise.
+    """
+    return _Timer(name) if enabled else _NULL_TIMER
+
+
+def add_time(name: str, seconds: float) -> None:
+    """Adds one call lasting seconds to a stage."""
+    with _lock:
+        entry = _timers.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+
+def count(name: str, n: int = 1) -> None:
+    """Increments a counter by n."""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def counted(method: Callable) -> Callable:
+    """Decorates a method, counting its calls as '<ClassName>.<method>' while enabled.
+
+    Applied by the Curve and Surface base classes to the path method of
+    every subclass, such that new classes are counted without further changes.
+    Only the outermost call is counted: calls through super() from an
+    overriding method in a subclass are not counted again.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if enabled and getattr(type(self), name, None) is wrapper:
+            count(f"{type(self).__name__}.{name}")
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def report() -> dict:
+    """Returns the recorded timers and counters.
+
+    Returns:
+        (dict): Dictionary with the keys 'timers' and 'counters'. Timers map each
+            stage name to its number of calls and total and mean time in seconds.
+            Counters map each counter name to its count.
+    """
+    with _lock:
+        timers = {name: tuple(entry) for name, entry in _timers.items()}
+        counters = dict(_counters)
+    return {
+        "timers": {
+            name: {"calls": calls, "total": total, "mean": total / calls}
+            for name, (calls, total) in sorted(timers.items())
+        },
+        "counters": dict(sorted(counters.items())),
+    }
+
+
+def report_json(**kwargs) -> str:
+    """Returns the report as a JSON string. Keyword arguments are passed to json.dumps."""
+    return json.dumps(report(), **kwargs)
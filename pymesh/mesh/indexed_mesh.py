@@ -0,0 +1,244 @@
+"""Module containing IndexedMesh class"""
+
+from collections.abc import Iterator, Sequence
+import itertools
+from typing import Self
+
+import numpy as np
+
+from pymesh.typing import NDArrayN, NDArrayNx2, NDArrayNx3, NDArrayNx4, NDArrayNx4x3
+
+DEFAULT_TOLERANCE = 1e-8
+"""Default grid spacing used when merging coincident vertices."""
+
+
+class IndexedMesh:
+    """Quadrilateral panel mesh stored as unique vertices and panel connectivity.
+
+    Compared to storing twelve coordinates per panel, vertices shared by
+    neighbouring panels, also across surface seams, are only stored once.
+
+    Attributes:
+        vertices (NDArrayNx3[float]): Float ndarray with shape (M, 3)
+            holding the unique vertex xyz coordinates.
+        faces (NDArrayNx4[int32]): Int32 ndarray with shape (N, 4),
+            where index [k, n] holds the vertex index of vertex n in panel k.
+    """
+
+    def __init__(self, vertices: NDArrayNx3, faces: NDArrayNx4) -> None:
+        """Initialization method.
+
+        Args:
+            vertices: Vertex xyz coordinates with shape (M, 3).
+            faces: Vertex indices of each quadrilateral panel with shape (N, 4).
+
+        Raises:
+            TypeError: If vertices are not numeric or faces are not integers.
+            ValueError: If vertices or faces have the wrong shape,
+                or if faces refer to vertices that do not exist.
+        """
+        vertices, faces = np.asarray(vertices), np.asarray(faces)
+        if vertices.dtype.kind not in "iuf":
+            raise TypeError(f"Expected {vertices!r} to have a numeric dtype")
+        if faces.dtype.kind not in "iu":
+            raise TypeError(f"Expected {faces!r} to have an integer dtype")
+        if vertices.ndim != 2 or vertices.shape[1] != 3:
+            raise ValueError("Expected vertices with shape (M, 3)")
+        if faces.ndim != 2 or faces.shape[1] != 4:
+            raise ValueError("Expected faces with shape (N, 4)")
+        if faces.size and (faces.min() < 0 or faces.max() >= len(vertices)):
+            raise ValueError("Expected faces to refer to existing vertices")
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+        self.faces = np.ascontiguousarray(faces, dtype=np.int32)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(num_vertices={self.num_vertices}, "
+            f"num_panels={self.num_panels})"
+        )
+
+    @classmethod
+    def from_panels(
+        cls, panels: NDArrayNx4x3, tolerance: int | float = DEFAULT_TOLERANCE
+    ) -> Self:
+        """Creates an indexed mesh from panels, merging coincident vertices.
+
+        Vertex coordinates are binned into grid cells with size tolerance,
+        centred on multiples of tolerance. The vertices in each cell are merged
+        into the first vertex of that cell or of a neighbouring cell, whichever
+        appears first, considering only neighbouring cells whose first vertex
+        differs by at most tolerance in each coordinate. Coincident vertices
+        straddling a cell boundary are thereby merged too, while merges are
+        not chained across cells, such that vertices several tolerances apart
+        are never merged. Vertices differing by floating-point noise only,
+        such as vertices on edges shared by two surfaces, are stored once.
+
+        The cells are looked up by sorting their keys rather than through a
+        hash table, which numpy does not provide in vectorized form, so the
+        run time is O(N log N) for N panels.
+
+        Args:
+            panels: Float ndarray with shape (N, 4, 3) as returned by
+                [get_panel_array][pymesh.mesh.mesh_generator.MeshGenerator.get_panel_array].
+            tolerance: Grid cell size used for merging vertices.
+
+        Returns:
+            (IndexedMesh): Indexed mesh with the same panels.
+
+        Raises:
+            TypeError: If tolerance is not an int or float.
+            ValueError: If tolerance is not positive or panels have the wrong shape.
+        """
+        if not isinstance(tolerance, (int, float)):
+            raise TypeError(f"Expected {tolerance!r} to be int or float")
+        if tolerance <= 0:
+            raise ValueError(f"Expected {tolerance!r} to be positive")
+        panels = np.asarray(panels, dtype=np.float64)
+        if panels.ndim != 3 or panels.shape[1:] != (4, 3):
+            raise ValueError("Expected panels with shape (N, 4, 3)")
+        xyz = panels.reshape(-1, 3)
+        first, vertex_index = _merge_vertices(xyz, tolerance)
+        return cls(xyz[first], vertex_index.reshape(-1, 4))
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def num_panels(self) -> int:
+        return len(self.faces)
+
+    def to_panels(self) -> NDArrayNx4x3[np.float64]:
+        """Returns the panels expanded to a float ndarray with shape (N, 4, 3)."""
+        return self.vertices[self.faces]
+
+    def get_panel_array(self) -> NDArrayNx4x3[np.float64]:
+        """Returns the panels expanded to a float ndarray with shape (N, 4, 3).
+
+        Allows an indexed mesh to be written by [GDFWriter][pymesh.writers.gdf_writer.GDFWriter]
+        in place of a [MeshGenerator][pymesh.mesh.mesh_generator.MeshGenerator].
+        """
+        return self.to_panels()
+
+    def get_num_panels(self) -> int:
+        """Returns the number of panels."""
+        return self.num_panels
+
+    def iter_panel_blocks(
+        self, max_panels: int | None = None
+    ) -> Iterator[NDArrayNx4x3[np.float64]]:
+        """Yields the panels expanded in blocks, bounding the memory use.
+
+        Args:
+            max_panels: Maximum number of panels per block.
+                By default, all panels are yielded in a single block.
+
+        Yields:
+            panels: Float ndarray with shape (N, 4, 3) with a block of panels.
+
+        Raises:
+            TypeError: If max_panels is not an int.
+            ValueError: If max_panels is less than one.
+        """
+        if max_panels is not None:
+            if not isinstance(max_panels, int):
+                raise TypeError(f"Expected {max_panels!r} to be an int")
+            if max_panels < 1:
+                raise ValueError(f"Expected {max_panels!r} to be at least 1")
+        step = max(1, self.num_panels) if max_panels is None else max_panels
+        for start in range(0, self.num_panels, step):
+            yield self.vertices[self.faces[start : start + step]]
+
+    def get_edges(self) -> tuple[NDArrayNx2[np.int32], NDArrayNx2[np.int64]]:
+        """Returns the unique panel edges and the number of panels sharing each edge.
+
+        Edges between coincident vertices, found in degenerate panels, are left out.
+
+        Returns:
+            edges: Int32 ndarray with shape (E, 2) holding the vertex indices
+                of each edge, with the lowest index first.
+            counts: Int ndarray with shape (E,) holding the number of panels
+                sharing each edge.
+        """
+        edges = np.stack((self.faces, np.roll(self.faces, -1, axis=1)), axis=2)
+        edges = np.sort(edges.reshape(-1, 2), axis=1)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        edges, counts = np.unique(edges, axis=0, return_counts=True)
+        return edges, counts
+
+    def get_boundary_edges(self) -> NDArrayNx2[np.int32]:
+        """Returns the edges belonging to a single panel, i.e. the open mesh boundary.
+
+        Returns:
+            edges: Int32 ndarray with shape (E, 2) holding the vertex indices of each edge.
+        """
+        edges, counts = self.get_edges()
+        return edges[counts == 1]
+
+
+# offsets to half of the 26 neighbouring cells, the other half is covered in reverse
+_NEIGHBOUR_OFFSETS = [
+    offset for offset in itertools.product((-1, 0, 1), repeat=3) if offset > (0, 0, 0)
+]
+
+
+def _merge_vertices(
+    xyz: NDArrayNx3[np.float64], tolerance: int | float
+) -> tuple[NDArrayN[np.intp], NDArrayN[np.intp]]:
+    """Merges vertices in the same or neighbouring grid cells, see from_panels.
+
+    Each of the N vertices is assigned a cell key, and the M unique keys are
+    found by sorting in O(N log N). The keys of the neighbouring cells are
+    then searched in sorted order, once for each of 13 offsets.
+
+    Args:
+        xyz: Vertex coordinates with shape (N, 3).
+        tolerance: Grid cell size used for merging vertices.
+
+    Returns:
+        first: Indices of the merged vertices in xyz, in order of first appearance.
+        vertex_index: Index into first of the merged vertex of each vertex.
+    """
+    cells = np.round(xyz / tolerance).astype(np.int64)
+    values, ranks = zip(*(np.unique(column, return_inverse=True) for column in cells.T))
+    keys, first, inverse = np.unique(
+        _get_cell_keys(ranks, values), return_index=True, return_inverse=True
+    )
+    cells, ranks = cells[first], [rank[first] for rank in ranks]
+    # label each cell by the first vertex among itself and the neighbouring
+    # cells whose first vertices lie within tolerance, without chaining labels,
+    # searched in order as the keys of neighbouring cells are sorted as well
+    labels = first.copy()
+    for offset in _NEIGHBOUR_OFFSETS:
+        neighbour_ranks, exists = [], True
+        for cell, value, rank, step in zip(cells.T, values, ranks, offset):
+            rank = (rank + step).clip(0, len(value) - 1)
+            exists = exists & (value[rank] == cell + step)
+            neighbour_ranks.append(rank)
+        neighbour_keys = _get_cell_keys(neighbour_ranks, values)
+        index = np.searchsorted(keys, neighbour_keys).clip(max=len(keys) - 1)
+        found = np.flatnonzero(exists & (keys[index] == neighbour_keys))
+        index = index[found]
+        distance = np.abs(xyz[first[found]] - xyz[first[index]])
+        close = np.all(distance <= tolerance, axis=1)
+        found, index = found[close], index[close]
+        labels[found] = np.minimum(labels[found], first[index])
+        labels[index] = np.minimum(labels[index], first[found])
+    first, vertex_index = np.unique(labels, return_inverse=True)
+    return first, vertex_index[inverse.reshape(-1)]
+
+
+def _get_cell_keys(
+    ranks: Sequence[NDArrayN[np.intp]], values: Sequence[NDArrayN[np.int64]]
+) -> NDArrayN[np.int64] | NDArrayN[np.complex128]:
+    """Returns scalar keys of cells, ordered like their index rows.
+
+    The ranks of the cell indices along the three axes are combined in a
+    single integer, which numpy sorts and searches much faster than rows of
+    indices. If the integer could overflow, the ranks are combined in a
+    complex number instead, which numpy orders lexicographically.
+    """
+    n1, n2 = len(values[1]), len(values[2])
+    if len(values[0]) * n1 * n2 < 2**63:
+        return (ranks[0] * n1 + ranks[1]) * n2 + ranks[2]
+    return ranks[0] * n1 + ranks[1] + 1j * ranks[2]
@@ -0,0 +1,226 @@
+"""Module containing MeshCache class"""
+
+from collections.abc import Hashable
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+import time
+
+import numpy as np
+
+from pymesh.typing import NDArray3xNxN
+
+CACHE_VERSION = 1
+"""Version of the cached data layout, part of every cache key."""
+
+DEFAULT_MAX_SIZE = 2**30
+"""Default maximum total size in bytes of the cached files."""
+
+LOCK_TIMEOUT = 60.0
+"""Age in seconds after which a lock file is considered stale and removed."""
+
+TEMPORARY_TIMEOUT = 600.0
+"""Age in seconds after which a temporary file, left behind by a killed writer,
+is considered stale and removed."""
+
+LOCK_FILENAME = "cache.lock"
+
+PRIMITIVE_TYPES = (str, bytes, bool, int, float, type(None))
+
+
+class MeshCache:
+    """Persistent, content-addressed cache of surface mesh points.
+
+    Mesh points are stored as '.npy' files in a cache directory, named by the
+    sha256 hash of the surface type and geometry, the number of mesh points and
+    the mesh distributions. A cache hit skips evaluation of the surface entirely.
+    The normal direction is not part of the key, as it only affects how panels
+    are assembled from the mesh points.
+
+    The cache directory may be shared by several processes. Files are written
+    atomically, and the least recently used files are evicted when the total
+    size exceeds max_size, guarded by a lock file. Temporary files count
+    towards the total size, and are removed once stale.
+
+    Surfaces without a geometry key made of plain numbers and strings,
+    e.g. surfaces defined by a UserDefinedCurve, are never cached.
+
+    Attributes:
+        directory (Path): Cache directory.
+        max_size (int): Maximum total size in bytes of the cached files.
+    """
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialization method.
+
+        Args:
+            directory: Cache directory, created if it does not exist.
+            max_size: Maximum total size in bytes of the cached files.
+
+        Raises:
+            TypeError: If directory is not of type Path or max_size is not an int.
+            ValueError: If max_size is negative.
+        """
+        if not isinstance(directory, Path):
+            raise TypeError("directory must be of type 'Path'")
+        if not isinstance(max_size, int):
+            raise TypeError("max_size must be of type 'int'")
+        if max_size < 0:
+            raise ValueError("max_size must be zero or positive")
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.max_size = max_size
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directory={self.directory!r}, max_size={self.max_size!r})"
+
+    @staticmethod
+    def get_key(data: dict) -> str | None:
+        """Returns the hash identifying the mesh points of a surface dictionary.
+
+        Args:
+            data: Surface dictionary as found in MeshGenerator.surfaces.
+
+        Returns:
+            (str | None): Hexadecimal sha256 hash, or None if the surface
+                cannot be cached.
+        """
+        surface = data["surface"]
+        surface_key = surface._cache_key()
+        if surface_key is None:
+            return None
+        key = (
+            CACHE_VERSION,
+            type(surface).__name__,
+            surface_key,
+            data["num_points"],
+            tuple(distribution._cache_key() for distribution in data["distributions"]),
+        )
+        if not is_primitive(key):
+            return None
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+    def get_mesh_points(self, data: dict) -> NDArray3xNxN[np.float64] | None:
+        """Returns the cached mesh points of a surface dictionary, or None if not cached.
+
+        Cached files not holding float mesh points with shape (3, Nu, Nw),
+        e.g. corrupt files, are treated as not cached.
+        """
+        key = self.get_key(data)
+        if key is None:
+            return None
+        filename = self._get_filename(key)
+        try:
+            mesh_points = np.load(filename, allow_pickle=False)
+        except (OSError, ValueError, EOFError):
+            return None
+        if (
+            mesh_points.shape != (3, *data["num_points"])
+            or mesh_points.dtype.kind != "f"
+        ):
+            return None
+        try:
+            os.utime(filename)  # marks the file as recently used
+        except OSError:
+            pass
+        return mesh_points
+
+    def set_mesh_points(
+        self, data: dict, mesh_points: NDArray3xNxN[np.float64]
+    ) -> None:
+        """Stores the mesh points of a surface dictionary, if it can be cached."""
+        key = self.get_key(data)
+        if key is None:
+            return
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            try:
+                np.save(file, mesh_points, allow_pickle=False)
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+        os.replace(file.name, self._get_filename(key))
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes all cached files and stale temporary files."""
+        for filename in self.directory.glob("*.npy"):
+            filename.unlink(missing_ok=True)
+        self._remove_stale_temporary_files()
+
+    def get_size(self) -> int:
+        """Returns the total size in bytes of the cached and temporary files."""
+        return sum(entry.stat().st_size for entry in self._scan(".npy", ".tmp"))
+
+    def _get_filename(self, key: str) -> Path:
+        return self.directory / f"{key}.npy"
+
+    def _scan(self, *suffixes: str) -> list[os.DirEntry]:
+        suffixes = suffixes or (".npy",)
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(suffixes)]
+
+    def _remove_stale_temporary_files(self) -> int:
+        """Removes temporary files older than TEMPORARY_TIMEOUT.
+
+        Returns:
+            (int): Total size in bytes of the remaining temporary files,
+                which are being written by other processes.
+        """
+        size = 0
+        now = time.time()
+        for entry in self._scan(".tmp"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > TEMPORARY_TIMEOUT:
+                Path(entry.path).unlink(missing_ok=True)
+            else:
+                size += stat.st_size
+        return size
+
+    def _evict(self) -> None:
+        """Removes least recently used files until the total size is within max_size.
+
+        Eviction is skipped if another process holds the lock.
+        """
+        lock = self.directory / LOCK_FILENAME
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime > LOCK_TIMEOUT:
+                    lock.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            return
+        try:
+            files = []
+            for entry in self._scan():
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+            size = sum(file[1] for file in files) + self._remove_stale_temporary_files()
+            for _, file_size, path in sorted(files):
+                if size <= self.max_size:
+                    break
+                Path(path).unlink(missing_ok=True)
+                size -= file_size
+        finally:
+            lock.unlink(missing_ok=True)
+
+
+def is_primitive(value: Hashable) -> bool:
+    """Returns True if value only consists of tuples, strings, bytes and numbers.
+
+    Such values have a repr that is stable between processes.
+    """
+    if isinstance(value, tuple):
+        return all(is_primitive(item) for item in value)
+    return isinstance(value, PRIMITIVE_TYPES)
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 import math
 from typing import Self
 
+import numpy as np
+
 from pymesh.descriptors import AsNumber
+from pymesh.typing import NDArrayN
+from pymesh.utils import validate_curve_path_array
 
 
 class MeshDistribution(ABC):
@@ -35,11 +40,72 @@ class MeshDistribution(ABC):
     def copy(self) -> Self:
         """Returns a copy of self"""
 
+    def _cache_key(self) -> tuple:
+        """Returns a key with the distribution type and parameters."""
+        return (type(self).__name__,) + tuple(sorted(vars(self).items()))
+
     @abstractmethod
-    def get_dist_fn(self, flip_direction: bool):
+    def _evaluate(
+        self, u: float | NDArrayN[np.float64]
+    ) -> float | NDArrayN[np.float64]:
+        """Evaluates the distribution expression without validation or flipping.
+
+        Works for both float inputs and float ndarrays.
+        """
+
+    def get_dist_fn(self) -> Callable[[int | float, bool], float]:
         """Returns distribution function which takes a single float from 0 to 1
         and returns a float between 0 and 1 according to the distribution type.
         """
+        flip = True if self.flip_direction else False  # breaks ref to self
+
+        def fn(u: int | float, flip_direction: bool = flip) -> float:
+            u = self.validate_fn_input(u=u, flip_direction=flip_direction)
+            exp = self._evaluate(u)
+            return self.flip_exp(exp, flip_direction)
+
+        return fn
+
+    def __call__(self, u: NDArrayN) -> NDArrayN[np.float64]:
+        """Evaluates the distribution for an array of values from 0 to 1.
+
+        The input is validated once, and the whole array is evaluated at once.
+
+        Args:
+            u: Array-like of values between 0 and 1.
+
+        Returns:
+            (NDArrayN[float]): New float ndarray with values between 0 and 1
+                and the same shape as the input.
+
+        Raises:
+            TypeError: If u does not contain int or float numbers.
+            ValueError: If any value in u is not part of the number set [0 1].
+        """
+        u = validate_curve_path_array(u, self.flip_direction)
+        return self.flip_exp(self._evaluate(u), self.flip_direction)
+
+    def sample(self, num_points: int) -> NDArrayN[np.float64]:
+        """Returns num_points distributed values from 0 to 1, both included.
+
+        Args:
+            num_points: Number of values.
+
+        Returns:
+            (NDArrayN[float]): Float ndarray with shape (num_points,).
+
+        Raises:
+            TypeError: If num_points is not an int.
+            ValueError: If num_points is less than one.
+        """
+        if not isinstance(num_points, int):
+            raise TypeError(f"Expected {num_points!r} to be an int")
+        if num_points < 1:
+            raise ValueError(f"Expected {num_points!r} to be at least 1")
+        u = np.linspace(0, 1, num=num_points, endpoint=True)
+        if self.flip_direction:
+            u = 1.0 - u
+        return self.flip_exp(self._evaluate(u), self.flip_direction)
 
     @staticmethod
     def flip_exp(exp, flip_direction: bool):
@@ -77,15 +143,10 @@ class LinearDistribution(MeshDistribution):
     def copy(self) -> Self:
         return LinearDistribution(self.flip_direction)
 
-    def get_dist_fn(self):
-        flip = True if self.flip_direction else False  # breaks ref to self
-
-        def fn(u: int | float, flip_direction: bool = flip) -> float:
-            u = self.validate_fn_input(u=u, flip_direction=flip_direction)
-            exp = u
-            return self.flip_exp(exp, flip_direction)
-
-        return fn
+    def _evaluate(
+        self, u: float | NDArrayN[np.float64]
+    ) -> float | NDArrayN[np.float64]:
+        return u
 
 
 class CosineDistribution(MeshDistribution):
@@ -101,15 +162,10 @@ class CosineDistribution(MeshDistribution):
     def copy(self) -> Self:
         return CosineDistribution(self.flip_direction)
 
-    def get_dist_fn(self):
-        flip = True if self.flip_direction else False  # breaks ref to self
-
-        def fn(u: int | float, flip_direction: bool = flip) -> float:
-            u = self.validate_fn_input(u=u, flip_direction=flip_direction)
-            exp = math.cos((u - 1.0) * math.pi / 2)
-            return self.flip_exp(exp, flip_direction)
-
-        return fn
+    def _evaluate(
+        self, u: float | NDArrayN[np.float64]
+    ) -> float | NDArrayN[np.float64]:
+        return np.cos((u - 1.0) * math.pi / 2)
 
 
 class ExponentialDistribution(MeshDistribution):
@@ -128,15 +184,11 @@ class ExponentialDistribution(MeshDistribution):
     def copy(self) -> Self:
         return ExponentialDistribution(self.ratio, self.flip_direction)
 
-    def get_dist_fn(self):
-        flip = True if self.flip_direction else False  # breaks ref to self
-
-        def fn(u: int | float, flip_direction: bool = flip) -> float:
-            u = self.validate_fn_input(u=u, flip_direction=flip_direction)
-            exp = (math.exp(self.ratio * u) - 1.0) / (math.exp(self.ratio * 1.0) - 1.0)
-            return self.flip_exp(exp, flip_direction)
-
-        return fn
+    def _evaluate(
+        self, u: float | NDArrayN[np.float64]
+    ) -> float | NDArrayN[np.float64]:
+        denominator = math.exp(self.ratio * 1.0) - 1.0  # once per array
+        return (np.exp(self.ratio * u) - 1.0) / denominator
 
 
 class PowerDistribution(MeshDistribution):
@@ -156,12 +208,7 @@ class PowerDistribution(MeshDistribution):
     def copy(self) -> Self:
         return PowerDistribution(self.power, self.flip_direction)
 
-    def get_dist_fn(self):
-        flip = True if self.flip_direction else False  # breaks ref to self
-
-        def fn(u: int | float, flip_direction: bool = flip) -> float:
-            u = self.validate_fn_input(u=u, flip_direction=flip_direction)
-            exp = u**self.power
-            return self.flip_exp(exp, flip_direction)
-
-        return fn
+    def _evaluate(
+        self, u: float | NDArrayN[np.float64]
+    ) -> float | NDArrayN[np.float64]:
+        return u**self.power
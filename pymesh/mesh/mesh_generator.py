@@ -1,35 +1,92 @@
+import collections
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+import itertools
+import threading
+
 import numpy as np
 
+from pymesh import instrumentation
 from pymesh.geo.surfaces.surface import Surface
 
+from pymesh.mesh.indexed_mesh import IndexedMesh, DEFAULT_TOLERANCE
+from pymesh.mesh.mesh_cache import MeshCache
 from pymesh.mesh.mesh_distributions import MeshDistribution, LinearDistribution
-from pymesh.typing import NDArray3xNxN
+from pymesh.typing import NDArray3xNxN, NDArray4x4, NDArrayN, NDArrayNx4x3
+from pymesh.utils import validate_affine
+
+PANEL_VERTEX_ORDER = (0, 1, 2, 3)
+"""Panel vertex order with the surface normal as given by the surface."""
+
+PANEL_VERTEX_ORDER_FLIPPED = (3, 2, 1, 0)
+"""Panel vertex order with the surface normal flipped."""
 
 
 class MeshGenerator:
     """Mesh generator class.
 
+    Each generator instance holds its own list of surfaces, such that
+    several independent meshes can be built side by side.
+
+    Panels are memoized in memory per surface, keyed by the surface geometry,
+    number of points, distributions and normal direction. Repeated calls to
+    get_panel_array therefore return the same read-only array, and changing
+    one surface only re-evaluates that surface.
+
+    Thread safety:
+        A single generator may be shared between threads. add_surface and
+        get_panel_array/get_panels are safe to call concurrently, with panels
+        generated from a snapshot of the surfaces added before the call.
+        Surface and curve objects may be shared between generators, but
+        must not be transformed (moved, rotated or mirrored) while a mesh
+        is being generated from them.
+
     Attributes:
         surfaces: List of surface dictionaries with mesh information.
+        cache: Optional persistent cache of surface mesh points.
     """
 
-    surfaces: list[dict] = []
+    surfaces: list[dict]
     """List of surface dictionaries with mesh information.
 
     Each surface dictionary follows the structure:
 
     .. code-block:: python3
         surface = {
+            "surface": Surface,
             "path": Callable[[float], NDArray3],
             "flipped_normal": bool,
             "num_points": tuple[int],
             "distributions": tuple[MeshDistribution],
+            "transform": NDArray4x4 | None,
         }
 
+    The transform is None for surfaces added by add_surface, and holds the
+    affine matrix applied to the surface mesh points for instances added by
+    add_instance.
+
     Note:
         Above code block works in Visual Studio Code.
     """
 
+    def __init__(self, cache: MeshCache | None = None) -> None:
+        """Initialization method.
+
+        Args:
+            cache: Persistent cache of surface mesh points, shared between
+                generators and processes. By default, nothing is cached.
+
+        Raises:
+            TypeError: If cache is not of type MeshCache.
+        """
+        if cache is not None and not isinstance(cache, MeshCache):
+            raise TypeError(f"Expected {cache!r} to be {MeshCache!r}")
+        self.surfaces = []
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._memo: dict[tuple, NDArrayNx4x3[np.float64]] = {}
+        self._memo_panels: tuple[tuple, NDArrayNx4x3[np.float64]] | None = None
+
     def add_surface(
         self,
         surface: Surface,
@@ -68,16 +125,109 @@ class MeshGenerator:
             Above example code block style works with MkDocs, but does not look nice
             in Visual Studio Code.
         """
-        length_u, length_w = surface.get_max_lengths()
+        data = self._make_surface_data(
+            surface,
+            density_u,
+            density_w,
+            distribution_u,
+            distribution_w,
+            flipped_normal=surface.is_normal_flipped,
+            transform=None,
+        )
+        with self._lock:
+            self.surfaces.append(data)
+
+    def add_instance(
+        self,
+        surface: Surface,
+        transform: NDArray4x4,
+        density_u: int | float = 0.2,
+        density_w: int | float = 0.2,
+        distribution_u: MeshDistribution = LinearDistribution(),
+        distribution_w: MeshDistribution = LinearDistribution(),
+    ) -> None:
+        """Adds a transformed instance of a surface to the mesh.
+
+        The instance is meshed by applying the affine transform to the mesh
+        points of the source surface, in a single matrix multiplication. The
+        source surface is evaluated once per call to get_panel_array for all of
+        its instances with the same density and distributions, including the
+        source itself if added with add_surface, or read from the cache.
+        Surfaces with rotational or mirror symmetry are thereby only evaluated
+        for one symmetric part.
+
+        The transform must be rigid, such that the panel density computed from
+        the source surface applies to the instance as well. Transforms including
+        a mirror, i.e. with a negative determinant, flip the instance normal
+        relative to the source surface normal, such that the normal keeps its
+        direction relative to the mirrored geometry.
+
+        Args:
+            surface: Source surface object, which is not modified.
+            transform: Affine matrix with shape (4, 4), e.g. composed from
+                [pymesh.utils.get_rotation_affine][] and [pymesh.utils.get_mirror_affine][].
+            density_u: Panel density along the u dimension.
+                Integer values represent the number of panels,
+                while float values represent panel size.
+            density_w: Panel density along the w dimension.
+                Integer values represent the number of panels,
+                while float values represent panel size.
+            distribution_u: Distribution type along the u dimension.
+            distribution_w: Distribution type along the w dimension.
+
+        Raises:
+            TypeError: If transform does not contain int or float numbers.
+            ValueError: If transform is not a valid rigid affine matrix.
+
+        Examples:
+            Mesh a quarter of a circular plate once, and add the three other
+            quarters as rotated instances.
+
+            >>> quarter = PlaneSurface(Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0))
+            >>> mesh = MeshGenerator()
+            >>> mesh.add_surface(quarter)
+            >>> for angle in (90, 180, 270):
+            ...     rotation = get_rotation_affine(angle * math.pi / 180, a=0, b=0, c=1)
+            ...     mesh.add_instance(quarter, rotation)
+        """
+        transform = validate_affine(transform)
+        mirrored = np.linalg.det(transform[:3, :3]) < 0
+        data = self._make_surface_data(
+            surface,
+            density_u,
+            density_w,
+            distribution_u,
+            distribution_w,
+            flipped_normal=surface.is_normal_flipped != mirrored,
+            transform=transform,
+        )
+        with self._lock:
+            self.surfaces.append(data)
+
+    def _make_surface_data(
+        self,
+        surface: Surface,
+        density_u: int | float,
+        density_w: int | float,
+        distribution_u: MeshDistribution,
+        distribution_w: MeshDistribution,
+        flipped_normal: bool,
+        transform: NDArray4x4 | None,
+    ) -> dict:
+        """Returns the surface dictionary of a surface or surface instance,
+        see the surfaces attribute."""
+        with instrumentation.timer(instrumentation.CURVE_LENGTH):
+            length_u, length_w = surface.get_max_lengths()
         num_points_u = self.get_num_points(length_u, density_u)
         num_points_w = self.get_num_points(length_w, density_w)
-        data = {
+        return {
+            "surface": surface,
             "path": surface.get_path(),
-            "flipped_normal": surface.is_normal_flipped,
+            "flipped_normal": flipped_normal,
             "num_points": (num_points_u, num_points_w),
             "distributions": (distribution_u, distribution_w),
+            "transform": transform,
         }
-        self.surfaces.append(data)
 
     @staticmethod
     def get_num_points(length: float, density: int | float) -> int:
@@ -98,69 +248,354 @@ class MeshGenerator:
         return num_points
 
     @staticmethod
-    def _generate_mesh_points(mesh) -> NDArray3xNxN[np.float64]:
-        """Generates mesh points"""
-        path = mesh["path"]
+    def _generate_mesh_points(
+        mesh, rows: slice = slice(None)
+    ) -> NDArray3xNxN[np.float64]:
+        """Generates mesh points.
+
+        The u and w spacings are sampled once per surface, and the whole
+        surface grid is evaluated at once. Distribution samples always lie
+        between 0 and 1, so the grid is evaluated on the trusted path,
+        skipping the parameter validation of Surface.path_grid.
+        Only the w points selected by rows are evaluated.
+        """
+        surface = mesh["surface"]
         num_points_u, num_points_w = mesh["num_points"]
         distribution_u, distribution_w = mesh["distributions"]
-        ufn = distribution_u.get_dist_fn()
-        wfn = distribution_w.get_dist_fn()
-        mp = np.zeros((3, num_points_u, num_points_w))
-        for i, u in enumerate(np.linspace(0, 1, num=num_points_u, endpoint=True)):
-            for j, w in enumerate(np.linspace(0, 1, num=num_points_w, endpoint=True)):
-                mp[:, i, j] = path(ufn(u), wfn(w))
-        return mp
+        with instrumentation.timer(instrumentation.DISTRIBUTION_SAMPLING):
+            u = distribution_u.sample(num_points_u)
+            w = distribution_w.sample(num_points_w)[rows]
+        with instrumentation.timer(instrumentation.SURFACE_EVALUATION):
+            return surface._path_grid(u, w)
+
+    @staticmethod
+    def _transform_mesh_points(
+        mesh_points: NDArray3xNxN[np.float64], transform: NDArray4x4 | None
+    ) -> NDArray3xNxN[np.float64]:
+        """Returns mesh points transformed by an affine matrix, or as is if None."""
+        if transform is None:
+            return mesh_points
+        with instrumentation.timer(instrumentation.INSTANCING):
+            # contracts the xyz axis directly, avoiding strided (Nu, Nw, 3) views
+            matrix, translation = transform[:3, :3], transform[:3, 3]
+            return (
+                np.tensordot(matrix, mesh_points, axes=1) + translation[:, None, None]
+            )
 
     @staticmethod
     def _generate_panels(
         mesh_points: NDArray3xNxN[np.float64], flipped_normal: bool
-    ) -> list[list[float]]:
-        """Returns list of quadrilateral panels.
+    ) -> NDArrayNx4x3[np.float64]:
+        """Returns array of quadrilateral panels.
 
-        Each panel is defined as a list of 12 floating numbers,
-        representing the xyz coordinates of the four panel vertices:
-        panel = [x0, y0, z0, x1, y1, z1, x2, y2, z2, x3, y3, z3]
+        Panels are assembled by slicing the mesh point grid, with panels
+        ordered along the u dimension first. Index [k, n, :] holds the
+        xyz coordinates of vertex n in panel k. Flipping the normal
+        reverses the vertex order.
         """
-        panels = []
-        mp = mesh_points
-        for j in range(0, mp.shape[2] - 1):
-            for i in range(0, mp.shape[1] - 1):
-                xyz1 = mp[:, i, j]
-                xyz2 = mp[:, i + 1, j]
-                xyz3 = mp[:, i + 1, j + 1]
-                xyz4 = mp[:, i, j + 1]
-                if flipped_normal:
-                    xyz1, xyz2, xyz3, xyz4 = xyz4, xyz3, xyz2, xyz1
-                panels.append(
-                    [
-                        xyz1[0],
-                        xyz1[1],
-                        xyz1[2],
-                        xyz2[0],
-                        xyz2[1],
-                        xyz2[2],
-                        xyz3[0],
-                        xyz3[1],
-                        xyz3[2],
-                        xyz4[0],
-                        xyz4[1],
-                        xyz4[2],
-                    ]
+        with instrumentation.timer(instrumentation.PANEL_ASSEMBLY):
+            xyz = mesh_points.transpose(2, 1, 0)  # shape (Nw, Nu, 3)
+            vertices = (xyz[:-1, :-1], xyz[:-1, 1:], xyz[1:, 1:], xyz[1:, :-1])
+            order = PANEL_VERTEX_ORDER_FLIPPED if flipped_normal else PANEL_VERTEX_ORDER
+            panels = np.stack([vertices[n] for n in order], axis=2)
+            return panels.reshape(-1, 4, 3)
+
+    def get_panel_array(
+        self, workers: int | None = None, executor: Executor | None = None
+    ) -> NDArrayNx4x3[np.float64]:
+        """Generates and returns panels for each item in the surfaces attribute list.
+
+        Surfaces are meshed independently of each other, and can therefore be
+        meshed in parallel. Panels are always returned in the order the surfaces
+        were added, and are identical to panels generated serially.
+
+        Args:
+            workers: Number of worker processes used for meshing surfaces.
+                By default, surfaces are meshed in the calling process.
+            executor: Executor used for meshing surfaces, e.g. a
+                ProcessPoolExecutor reused between calls or a ThreadPoolExecutor.
+                Takes precedence over workers.
+
+        Returns:
+            panels: Contiguous, read-only float ndarray with shape (N, 4, 3),
+                where index [k, n, :] holds the xyz coordinates of
+                vertex n in quadrilateral panel k.
+
+        Raises:
+            TypeError: If workers is not an int.
+            ValueError: If workers is less than one.
+
+        Note:
+            Surfaces are pickled when meshed in worker processes,
+            which does not work for e.g. a UserDefinedCurve defined by a lambda.
+        """
+        if workers is not None:
+            if not isinstance(workers, int):
+                raise TypeError(f"Expected {workers!r} to be an int")
+            if workers < 1:
+                raise ValueError(f"Expected {workers!r} to be at least 1")
+        with self._lock:
+            surfaces = list(self.surfaces)
+            memo = dict(self._memo)
+            memo_panels = self._memo_panels
+        keys = tuple(self._get_memo_key(data) for data in surfaces)
+        if memo_panels is not None and memo_panels[0] == keys:
+            return memo_panels[1]
+        indices = [i for i, key in enumerate(keys) if key is None or key not in memo]
+        panels = dict(
+            zip(
+                indices,
+                self._mesh_surfaces([surfaces[i] for i in indices], workers, executor),
+            )
+        )
+        for i, key in enumerate(keys):
+            if i in panels:
+                panels[i].flags.writeable = False
+                if key is not None:
+                    memo[key] = panels[i]
+            else:
+                panels[i] = memo[key]
+        panel_array = np.concatenate(
+            [np.empty((0, 4, 3))] + [panels[i] for i in range(len(keys))], axis=0
+        )
+        panel_array.flags.writeable = False
+        with self._lock:
+            self._memo = {key: memo[key] for key in keys if key is not None}
+            if None not in keys:
+                self._memo_panels = (keys, panel_array)
+        return panel_array
+
+    def get_num_panels(self) -> int:
+        """Returns the total number of panels, without generating them."""
+        with self._lock:
+            surfaces = list(self.surfaces)
+        return sum(_get_num_panels(data) for data in surfaces)
+
+    def get_surface_ids(self) -> NDArrayN[np.int32]:
+        """Returns the index of the surface each panel belongs to, without generating panels.
+
+        Returns:
+            surface_ids: Integer ndarray with shape (N,), where index [k] holds
+                the index in the surfaces attribute list of panel k.
+        """
+        with self._lock:
+            surfaces = list(self.surfaces)
+        counts = [_get_num_panels(data) for data in surfaces]
+        return np.repeat(np.arange(len(surfaces), dtype=np.int32), counts)
+
+    def iter_panel_blocks(
+        self, max_panels: int | None = None
+    ) -> Iterator[NDArrayNx4x3[np.float64]]:
+        """Generates and yields panels block by block.
+
+        The blocks hold the same panels in the same order as
+        [get_panel_array][pymesh.mesh.mesh_generator.MeshGenerator.get_panel_array],
+        but only one block is generated at a time, bounding the memory use for
+        very large meshes. Memoized panels are reused, but new panels are not memoized.
+        Mesh points are read from cache, if any, and stored in cache for surfaces
+        fitting in a single block. Like get_panel_array, surfaces sharing the same
+        mesh points, such as instances of a surface, are evaluated once: the
+        untransformed mesh points are kept until the last of them is yielded.
+
+        Args:
+            max_panels: Maximum number of panels per block. By default, each
+                block holds the panels of one surface. Otherwise, surfaces are
+                split into blocks of whole rows of panels, with at least one
+                row per block.
+
+        Yields:
+            panels: Float ndarray with shape (N, 4, 3) with a block of panels.
+
+        Raises:
+            TypeError: If max_panels is not an int.
+            ValueError: If max_panels is less than one.
+        """
+        if max_panels is not None:
+            if not isinstance(max_panels, int):
+                raise TypeError(f"Expected {max_panels!r} to be an int")
+            if max_panels < 1:
+                raise ValueError(f"Expected {max_panels!r} to be at least 1")
+        with self._lock:
+            surfaces = list(self.surfaces)
+            memo = dict(self._memo)
+        memoized = [memo.get(self._get_memo_key(data)) for data in surfaces]
+        # number of surfaces left to mesh per group sharing the same mesh points
+        remaining = collections.Counter(
+            self._get_group_key(data)
+            for data, panels in zip(surfaces, memoized)
+            if panels is None
+        )
+        shared: dict[tuple, NDArray3xNxN[np.float64] | None] = {}
+        for data, panels in zip(surfaces, memoized):
+            num_points_u, num_points_w = data["num_points"]
+            if panels is not None:
+                if max_panels is None:
+                    yield panels
+                    continue
+                num_rows = max(1, max_panels // (num_points_u - 1))
+                for start in range(0, num_points_w - 1, num_rows):
+                    stop = min(start + num_rows, num_points_w - 1)
+                    yield panels[start * (num_points_u - 1) : stop * (num_points_u - 1)]
+                continue
+            group_key = self._get_group_key(data)
+            remaining[group_key] -= 1
+            if group_key in shared:
+                mesh_points = shared[group_key]
+            else:
+                mesh_points = self._get_cached_mesh_points(data, max_panels)
+                if mesh_points is None and (
+                    max_panels is None or remaining[group_key] > 0
+                ):
+                    mesh_points = self._generate_mesh_points(data)
+                shared[group_key] = mesh_points
+            if remaining[group_key] == 0:
+                del shared[group_key]
+            if max_panels is None:
+                mesh_points = self._transform_mesh_points(
+                    mesh_points, data["transform"]
                 )
+                yield self._generate_panels(mesh_points, data["flipped_normal"])
+                continue
+            num_rows = max(1, max_panels // (num_points_u - 1))
+            for start in range(0, num_points_w - 1, num_rows):
+                stop = min(start + num_rows, num_points_w - 1)
+                rows = slice(start, stop + 1)
+                if mesh_points is None:
+                    block = self._generate_mesh_points(data, rows)
+                else:
+                    block = mesh_points[:, :, rows]
+                block = self._transform_mesh_points(block, data["transform"])
+                yield self._generate_panels(block, data["flipped_normal"])
+
+    def _get_cached_mesh_points(
+        self, data: dict, max_panels: int | None
+    ) -> NDArray3xNxN[np.float64] | None:
+        """Returns the untransformed mesh points of a surface dictionary from cache.
+
+        On a cache miss, the mesh points are generated and stored in cache
+        if the surface fits in a single block of max_panels panels, or if
+        max_panels is None. Returns None if there is no cache or the surface
+        is too large.
+        """
+        if self.cache is None:
+            return None
+        mesh_points = self.cache.get_mesh_points(data)
+        if mesh_points is None and (
+            max_panels is None or _get_num_panels(data) <= max_panels
+        ):
+            mesh_points = self._generate_mesh_points(data)
+            self.cache.set_mesh_points(data, mesh_points)
+        return mesh_points
+
+    def _mesh_surfaces(
+        self, surfaces: list[dict], workers: int | None, executor: Executor | None
+    ) -> list[NDArrayNx4x3[np.float64]]:
+        """Returns the panels of each surface dictionary, in the same order.
+
+        Surface dictionaries sharing the same mesh points, such as instances of
+        a surface, are meshed together, evaluating the mesh points once.
+        """
+        caches = itertools.repeat(self.cache)
+        if not surfaces:
+            return []
+        groups: dict[tuple, list[int]] = {}
+        for i, data in enumerate(surfaces):
+            groups.setdefault(self._get_group_key(data), []).append(i)
+        batches = [[surfaces[i] for i in indices] for indices in groups.values()]
+        if executor is not None:
+            results = list(executor.map(_mesh_surface_group, batches, caches))
+        elif workers is not None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_mesh_surface_group, batches, caches))
+        else:
+            results = list(map(_mesh_surface_group, batches, caches))
+        panels = [None] * len(surfaces)
+        for indices, result in zip(groups.values(), results):
+            for i, surface_panels in zip(indices, result):
+                panels[i] = surface_panels
         return panels
 
+    @staticmethod
+    def _get_group_key(data: dict) -> tuple:
+        """Returns the key of surface dictionaries sharing the same mesh points."""
+        return (
+            id(data["surface"]),
+            data["num_points"],
+            tuple(distribution._cache_key() for distribution in data["distributions"]),
+        )
+
+    @staticmethod
+    def _get_memo_key(data: dict) -> tuple | None:
+        """Returns the key identifying the panels of a surface dictionary,
+        or None if the surface geometry has no key."""
+        surface = data["surface"]
+        surface_key = surface._cache_key()
+        if surface_key is None:
+            return None
+        return (
+            type(surface).__name__,
+            surface_key,
+            data["num_points"],
+            tuple(distribution._cache_key() for distribution in data["distributions"]),
+            data["flipped_normal"],
+            None if data["transform"] is None else data["transform"].tobytes(),
+        )
+
+    def get_indexed_mesh(
+        self, tolerance: int | float = DEFAULT_TOLERANCE
+    ) -> IndexedMesh:
+        """Generates and returns panels as an indexed mesh with unique vertices.
+
+        Coincident vertices, e.g. on edges shared by neighbouring surfaces, are merged.
+
+        Args:
+            tolerance: Grid spacing used for merging vertices,
+                see [IndexedMesh.from_panels][pymesh.mesh.indexed_mesh.IndexedMesh.from_panels].
+
+        Returns:
+            (IndexedMesh): Indexed mesh with the panels of all surfaces.
+        """
+        return IndexedMesh.from_panels(self.get_panel_array(), tolerance)
+
     def get_panels(self) -> list[list[float]]:
         """Generates and returns panels for each item in the surfaces attribute list.
 
+        Prefer [get_panel_array][pymesh.mesh.mesh_generator.MeshGenerator.get_panel_array]
+        for large meshes, as this method converts the panels to Python lists.
+
         Returns:
             panels: List of quadrilateral panels.
                 Each panel is defined as a list of 12 floating numbers,
                 representing the xyz coordinates of the four panel vertices:
                 panel = [x0, y0, z0, x1, y1, z1, x2, y2, z2, x3, y3, z3].
         """
-        panels = []
-        for data in self.surfaces:
-            mesh_points = self._generate_mesh_points(data)
-            surface_panels = self._generate_panels(mesh_points, data["flipped_normal"])
-            panels += surface_panels
-        return panels
+        return self.get_panel_array().reshape(-1, 12).tolist()
+
+
+def _mesh_surface_group(
+    group: list[dict], cache: MeshCache | None = None
+) -> list[NDArrayNx4x3[np.float64]]:
+    """Returns the panels of surface dictionaries sharing the same mesh points.
+
+    The untransformed mesh points are evaluated once, or read from cache,
+    and transformed for each surface dictionary.
+    """
+    data = group[0]
+    mesh_points = None if cache is None else cache.get_mesh_points(data)
+    if mesh_points is None:
+        mesh_points = MeshGenerator._generate_mesh_points(data)
+        if cache is not None:
+            cache.set_mesh_points(data, mesh_points)
+    return [
+        MeshGenerator._generate_panels(
+            MeshGenerator._transform_mesh_points(mesh_points, data["transform"]),
+            data["flipped_normal"],
+        )
+        for data in group
+    ]
+
+
+def _get_num_panels(data: dict) -> int:
+    """Returns the number of panels of a single surface dictionary."""
+    num_points_u, num_points_w = data["num_points"]
+    return (num_points_u - 1) * (num_points_w - 1)
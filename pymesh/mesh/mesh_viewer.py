@@ -6,7 +6,7 @@ from matplotlib import pyplot as plt
 from matplotlib import style as mpl_style
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArrayNx4x3
 from pymesh.mesh.mesh_generator import MeshGenerator
 
 
@@ -14,7 +14,7 @@ class MeshViewer:
     """Plots surface panels and normals using matplotlib with seaborn-v0_8 style"""
 
     def __init__(self, mesh: MeshGenerator) -> None:
-        self.panels = mesh.get_panels()
+        self.panels = mesh.get_panel_array()
         self.include_vertex_annotation = False
         self.facecolor = "#0072BD"
         self.edgecolor = "black"
@@ -64,47 +64,44 @@ class MeshViewer:
         self._xyzlim = np.ceil(value)
 
     def _plot_panels(self) -> None:
-        for panel in self.panels:
-            xyz = np.array([panel[0:3], panel[3:6], panel[6:9], panel[9:12]])
-            self.__update_axis_limits(xyz)
-            if self.include_vertex_annotation:
-                self.ax.scatter(xyz[:, 0], xyz[:, 1], xyz[:, 2], color="blue")
-                for i in range(0, xyz.shape[0]):
-                    self.ax.text(xyz[i, 0], xyz[i, 1], xyz[i, 2], f"{i+1}", color="k")
-            if self.include_normals:
-                self._plot_normals(panel, colors=self.normalcolor)
-            verts = [list(zip(panel[0::3], panel[1::3], panel[2::3]))]
-            self.ax.add_collection3d(
-                Poly3DCollection(
-                    verts,
-                    facecolors=self.facecolor,
-                    linewidths=self.linewidth,
-                    edgecolors=self.edgecolor,
-                    alpha=self.alpha,
-                )
+        """Plots all panels as a single collection, with normals in a single quiver call."""
+        if len(self.panels) == 0:
+            return
+        self.__update_axis_limits(self.panels)
+        if self.include_vertex_annotation:
+            xyz = self.panels.reshape(-1, 3)
+            self.ax.scatter(xyz[:, 0], xyz[:, 1], xyz[:, 2], color="blue")
+            for panel in self.panels:
+                for i in range(0, panel.shape[0]):
+                    self.ax.text(*panel[i], f"{i+1}", color="k")
+        if self.include_normals:
+            self._plot_normals(self.panels, colors=self.normalcolor)
+        self.ax.add_collection3d(
+            Poly3DCollection(
+                self.panels,
+                facecolors=self.facecolor,
+                linewidths=self.linewidth,
+                edgecolors=self.edgecolor,
+                alpha=self.alpha,
             )
+        )
 
-    def __update_axis_limits(self, xyz):
-        x = np.max(np.abs(xyz[:, 0]))
-        y = np.max(np.abs(xyz[:, 1]))
-        z = np.max(np.abs(xyz[:, 2]))
-        xyzlim = np.max([self.xyzlim, np.array([x, y, z])], axis=0)
-        self.xyzlim = xyzlim
-
-    def _plot_normals(self, panel: list, colors: str) -> None:
-        panel = np.array(panel)
-        xyz1, xyz2, xyz3, xyz4 = panel[0:3], panel[3:6], panel[6:9], panel[9:12]
-        point = np.average([xyz1, xyz2, xyz3, xyz4], axis=0)
-        cross_product = np.cross(xyz2 - xyz1, xyz4 - xyz1)
-        x, y, z = point[0], point[1], point[2]
-        u, v, w = cross_product[0], cross_product[1], cross_product[2]
+    def __update_axis_limits(self, panels: NDArrayNx4x3) -> None:
+        xyz = np.max(np.abs(panels), axis=(0, 1))
+        self.xyzlim = np.maximum(self.xyzlim, xyz)
+
+    def _plot_normals(self, panels: NDArrayNx4x3, colors: str) -> None:
+        points = np.mean(panels, axis=1)
+        cross_products = np.cross(
+            panels[:, 1] - panels[:, 0], panels[:, 3] - panels[:, 0]
+        )
         self.ax.quiver(
-            x,
-            y,
-            z,
-            u,
-            v,
-            w,
+            points[:, 0],
+            points[:, 1],
+            points[:, 2],
+            cross_products[:, 0],
+            cross_products[:, 1],
+            cross_products[:, 2],
             length=self.normallength,
             normalize=True,
             colors=colors,
@@ -0,0 +1,153 @@
+"""Module containing GDFReader class"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
+
+import numpy as np
+
+from pymesh import instrumentation
+from pymesh.typing import NDArrayNx4x3
+
+
+class GDFReader:
+    """Reads surface panels from a file with the extension 'gdf'.
+
+    For information regarding the file formatting, refer to Section 6.1
+    in the [WAMIT Manual](https://www.wamit.com/manual7.x/v75_manual.pdf).
+
+    Only the header is read on initialization. Panels are parsed in bulk by
+    numpy when requested, either all at once or block by block, such that very
+    large files can be streamed with a bounded memory use. Panel lines may hold
+    the coordinates of one or more vertices, as long as all lines hold the same
+    number of coordinates. A reader can be used in place of a
+    [MeshGenerator][pymesh.mesh.mesh_generator.MeshGenerator], e.g. to
+    convert the panels with a
+    [PanelStoreWriter][pymesh.writers.panel_store_writer.PanelStoreWriter].
+
+    Attributes:
+        filename (Path): GDF filename.
+        panels (NDArrayNx4x3[float]): all panels, parsed on access
+        ulen (float): unit length
+        grav (float): gravitational constant
+        isx (bool): symmetry in x=0.
+        isy (bool): symmetry in y=0.
+        header (str): header line in the file
+        npan (int): number of panels
+    """
+
+    def __init__(self, filename: Path) -> None:
+        """Initialization method.
+
+        Args:
+            filename: GDF filename.
+
+        Raises:
+            TypeError: If filename is not a Path with the extension '.gdf'.
+            ValueError: If the file header is malformed.
+        """
+        if not isinstance(filename, Path):
+            raise TypeError("filename must be of type 'Path'")
+        if filename.suffix.lower() != ".gdf":
+            raise TypeError("filename must have the extension '.gdf'")
+        with open(filename, encoding="utf-8") as file:
+            self.header = file.readline().rstrip("\r\n")
+            try:
+                ulen, grav = file.readline().split()[:2]
+                isx, isy = file.readline().split()[:2]
+                npan = file.readline().split()[0]
+                self.ulen, self.grav = float(ulen), float(grav)
+                self.isx, self.isy = bool(int(isx)), bool(int(isy))
+                self.npan = int(npan)
+            except (ValueError, IndexError) as error:
+                raise ValueError(f"{filename} has a malformed GDF header") from error
+            self._data_offset = file.tell()
+            self._values_per_line = _get_values_per_line(file)
+        if self._values_per_line not in (3, 6, 12):
+            raise ValueError(
+                f"{filename} has {self._values_per_line} coordinates per line, "
+                "expected 3, 6 or 12"
+            )
+        self.filename = filename
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(filename={self.filename!r})"
+
+    @property
+    def panels(self) -> NDArrayNx4x3[np.float64]:
+        return self.get_panel_array()
+
+    def get_num_panels(self) -> int:
+        """Returns the number of panels given in the file header."""
+        return self.npan
+
+    def get_panel_array(self) -> NDArrayNx4x3[np.float64]:
+        """Parses and returns all panels.
+
+        Returns:
+            panels: Float ndarray with shape (N, 4, 3), where index [k, n, :]
+                holds the xyz coordinates of vertex n in quadrilateral panel k.
+
+        Raises:
+            ValueError: If the file holds fewer panels than given in the header,
+                or if a panel line is malformed.
+        """
+        with self._open() as file:
+            return self._read_panels(file, self.npan)
+
+    def iter_panel_blocks(
+        self, max_panels: int | None = None
+    ) -> Iterator[NDArrayNx4x3[np.float64]]:
+        """Parses and yields the panels block by block, bounding the memory use.
+
+        Args:
+            max_panels: Maximum number of panels per block.
+                By default, all panels are yielded in a single block.
+
+        Yields:
+            panels: Float ndarray with shape (N, 4, 3) with a block of panels.
+
+        Raises:
+            TypeError: If max_panels is not an int.
+            ValueError: If max_panels is less than one, if the file holds fewer
+                panels than given in the header, or if a panel line is malformed.
+        """
+        if max_panels is not None:
+            if not isinstance(max_panels, int):
+                raise TypeError(f"Expected {max_panels!r} to be an int")
+            if max_panels < 1:
+                raise ValueError(f"Expected {max_panels!r} to be at least 1")
+        step = max(1, self.npan) if max_panels is None else max_panels
+        with self._open() as file:
+            for start in range(0, self.npan, step):
+                yield self._read_panels(file, min(step, self.npan - start))
+
+    def _open(self) -> TextIO:
+        """Opens the file, positioned at the first panel line."""
+        file = open(self.filename, encoding="utf-8")
+        file.seek(self._data_offset)
+        return file
+
+    def _read_panels(self, file: TextIO, num_panels: int) -> NDArrayNx4x3[np.float64]:
+        """Parses the next num_panels panels from file."""
+        if num_panels == 0:
+            return np.empty((0, 4, 3))
+        num_lines = num_panels * 12 // self._values_per_line
+        with instrumentation.timer(instrumentation.PARSING):
+            coords = np.loadtxt(file, dtype=np.float64, max_rows=num_lines, ndmin=2)
+        if coords.size != num_panels * 12:
+            raise ValueError(
+                f"Expected {self.npan} panels in {self.filename}, "
+                "but the file ended early"
+            )
+        return coords.reshape(num_panels, 4, 3)
+
+
+def _get_values_per_line(file: TextIO) -> int:
+    """Returns the number of values on the next non-blank line, without consuming it."""
+    offset = file.tell()
+    line = file.readline()
+    while line and not line.split():
+        line = file.readline()
+    file.seek(offset)
+    return len(line.split()) or 12
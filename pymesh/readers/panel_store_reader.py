@@ -0,0 +1,170 @@
+"""Module containing PanelStoreReader class"""
+
+from collections.abc import Iterator
+import json
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+
+from pymesh.readers.gdf_reader import GDFReader
+from pymesh.typing import NDArrayN, NDArrayNx4x3
+from pymesh.writers.gdf_writer import GDFWriter
+from pymesh.writers.panel_store_writer import (
+    MAGIC,
+    PANEL_DTYPE,
+    STORE_VERSION,
+    SURFACE_ID_DTYPE,
+    PanelStoreWriter,
+)
+
+
+class PanelStoreReader:
+    """Opens a binary panel store written by a
+    [PanelStoreWriter][pymesh.writers.panel_store_writer.PanelStoreWriter].
+
+    Panels and surface ids are memory mapped without copying, such that a
+    panel store opens instantly regardless of its size, and only the parts
+    accessed are read from disk. A reader can be used in place of a
+    [MeshGenerator][pymesh.mesh.mesh_generator.MeshGenerator], e.g. to
+    write the panels with a [GDFWriter][pymesh.writers.gdf_writer.GDFWriter].
+
+    Attributes:
+        filename (Path): Panel store filename.
+        panels (NDArrayNx4x3[float]): Read-only, memory mapped float ndarray with
+            shape (N, 4, 3), where index [k, n, :] holds the xyz coordinates of
+            vertex n in quadrilateral panel k.
+        surface_ids (NDArrayN[int32]): Read-only, memory mapped int ndarray
+            with shape (N,) holding the surface index of each panel.
+        ulen (float): unit length
+        grav (float): gravitational constant
+        isx (bool): symmetry in x=0.
+        isy (bool): symmetry in y=0.
+        header (str): header line stored in the file
+    """
+
+    def __init__(self, filename: Path) -> None:
+        """Initialization method.
+
+        Args:
+            filename: Panel store filename.
+
+        Raises:
+            TypeError: If filename is not of type Path.
+            ValueError: If the file is not a panel store of a supported version.
+        """
+        if not isinstance(filename, Path):
+            raise TypeError("filename must be of type 'Path'")
+        with open(filename, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{filename} is not a panel store")
+            length = int.from_bytes(file.read(4), "little")
+            header = json.loads(file.read(length).decode("utf-8"))
+        if header.get("version") != STORE_VERSION:
+            raise ValueError(
+                f"{filename} has unsupported panel store version {header.get('version')!r}"
+            )
+        self.filename = filename
+        self.ulen = header["ulen"]
+        self.grav = header["grav"]
+        self.isx = header["isx"]
+        self.isy = header["isy"]
+        self.header = header["header"]
+        npan = header["npan"]
+        self.panels = _memmap(
+            filename, PANEL_DTYPE, header["panels_offset"], (npan, 4, 3)
+        )
+        self.surface_ids = _memmap(
+            filename, SURFACE_ID_DTYPE, header["surface_ids_offset"], (npan,)
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(filename={self.filename!r})"
+
+    @classmethod
+    def from_gdf(cls, gdf_filename: Path, filename: Path) -> Self:
+        """Converts a GDF file to a panel store and opens it.
+
+        Panels are streamed from the GDF file block by block.
+
+        Args:
+            gdf_filename: Filename of the GDF file to convert.
+            filename: Filename of the panel store, with the extension '.pmesh'.
+
+        Returns:
+            (PanelStoreReader): Reader of the written panel store.
+        """
+        gdf = GDFReader(gdf_filename)
+        PanelStoreWriter(
+            gdf,
+            ulen=gdf.ulen,
+            grav=gdf.grav,
+            isx=gdf.isx,
+            isy=gdf.isy,
+            header=gdf.header,
+        ).write(filename)
+        return cls(filename)
+
+    def to_gdf(self, filename: Path) -> None:
+        """Writes the panels and metadata to a GDF file.
+
+        Args:
+            filename: Filename with the extension '.gdf'.
+        """
+        GDFWriter(
+            self,
+            ulen=self.ulen,
+            grav=self.grav,
+            isx=self.isx,
+            isy=self.isy,
+            header=self.header,
+        ).write(filename)
+
+    def get_num_panels(self) -> int:
+        """Returns the number of panels."""
+        return len(self.panels)
+
+    def get_panel_array(self) -> NDArrayNx4x3[np.float64]:
+        """Returns the memory mapped panels, without copying."""
+        return self.panels
+
+    def get_surface_ids(self) -> NDArrayN[np.int32]:
+        """Returns the memory mapped surface index of each panel, without copying."""
+        return self.surface_ids
+
+    def iter_panel_blocks(
+        self, max_panels: int | None = None
+    ) -> Iterator[NDArrayNx4x3[np.float64]]:
+        """Yields views of the memory mapped panels in blocks.
+
+        Args:
+            max_panels: Maximum number of panels per block.
+                By default, all panels are yielded in a single block.
+
+        Yields:
+            panels: Float ndarray with shape (N, 4, 3) with a block of panels.
+
+        Raises:
+            TypeError: If max_panels is not an int.
+            ValueError: If max_panels is less than one.
+        """
+        if max_panels is not None:
+            if not isinstance(max_panels, int):
+                raise TypeError(f"Expected {max_panels!r} to be an int")
+            if max_panels < 1:
+                raise ValueError(f"Expected {max_panels!r} to be at least 1")
+        npan = len(self.panels)
+        step = max(1, npan) if max_panels is None else max_panels
+        for start in range(0, npan, step):
+            yield self.panels[start : start + step]
+
+
+def _memmap(
+    filename: Path, dtype: np.dtype, offset: int, shape: tuple[int, ...]
+) -> np.ndarray:
+    """Returns a read-only memory map of a block in filename, or an empty array."""
+    if not np.prod(shape):
+        array = np.empty(shape, dtype=dtype)
+        array.flags.writeable = False
+        return array
+    return np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=shape)
@@ -1,4 +1,5 @@
-from typing import Annotated, Literal, TypeVar
+from collections.abc import Iterator
+from typing import Annotated, Literal, Protocol, TypeVar
 
 import numpy as np
 import numpy.typing as npt
@@ -9,8 +10,47 @@ DType = TypeVar("DType", bound=np.generic)
 NDArray3 = Annotated[npt.NDArray[DType], Literal[3]]
 """Numpy ndarray with shape (3, )."""
 
+NDArray3x3 = Annotated[npt.NDArray[DType], Literal[3, 3]]
+"""Numpy ndarray with shape (3, 3)."""
+
+NDArray4x4 = Annotated[npt.NDArray[DType], Literal[4, 4]]
+"""Numpy ndarray with shape (4, 4)."""
+
 NDArray3xNxN = Annotated[npt.NDArray[DType], Literal[3, "N", "N"]]
 """Numpy ndarray with shape (3, N, N)."""
 
+NDArrayN = Annotated[npt.NDArray[DType], Literal["N"]]
+"""Numpy ndarray with shape (N, )."""
+
+NDArrayNx2 = Annotated[npt.NDArray[DType], Literal["N", 2]]
+"""Numpy ndarray with shape (N, 2)."""
+
+NDArrayNx3 = Annotated[npt.NDArray[DType], Literal["N", 3]]
+"""Numpy ndarray with shape (N, 3)."""
+
+NDArrayNx4 = Annotated[npt.NDArray[DType], Literal["N", 4]]
+"""Numpy ndarray with shape (N, 4)."""
+
+NDArrayNx4x3 = Annotated[npt.NDArray[DType], Literal["N", 4, 3]]
+"""Numpy ndarray with shape (N, 4, 3)."""
+
+NDArrayNx12 = Annotated[npt.NDArray[DType], Literal["N", 12]]
+"""Numpy ndarray with shape (N, 12)."""
+
 # un-used but interesting type suggestions
 type number = int | float
+
+
+class PanelSource(Protocol):
+    """Object providing quadrilateral panels, e.g. a MeshGenerator or an IndexedMesh."""
+
+    def get_num_panels(self) -> int:
+        """Returns the total number of panels."""
+
+    def get_panel_array(self) -> NDArrayNx4x3[np.float64]:
+        """Returns all panels as a float ndarray with shape (N, 4, 3)."""
+
+    def iter_panel_blocks(
+        self, max_panels: int | None = None
+    ) -> Iterator[NDArrayNx4x3[np.float64]]:
+        """Yields the panels in blocks of at most max_panels panels."""
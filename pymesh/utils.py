@@ -1,23 +1,43 @@
 """Package utility functions.
 
 Geometry helper functions:
+    - get_rotation_matrix
+    - get_mirror_matrix
     - rotate_point_xyz
     - mirror_point_xyz
+    - rotate_points_xyz
+    - mirror_points_xyz
+    - get_translation_affine
+    - get_rotation_affine
+    - get_mirror_affine
+    - transform_points_affine
 
 Validation functions:
     - validate_curve_path_parameters
     - validate_surface_path_parameters
+    - validate_curve_path_array
+    - validate_surface_path_arrays
+    - validate_affine
+
+Numerical functions:
+    - integrate_gauss_legendre
 
 Benchmark functions:
     - time_it
 """
 
+from collections.abc import Callable
 import math
 import time
 
 import numpy as np
 
-from pymesh.typing import NDArray3
+from pymesh.typing import NDArray3, NDArray3x3, NDArray4x4, NDArrayN, NDArrayNx3
+
+GAUSS_LEGENDRE_ORDER = 8
+GAUSS_LEGENDRE_MAX_DEPTH = 30
+GAUSS_LEGENDRE_MAX_INTERVALS = 1024
+AFFINE_TOLERANCE = 1e-8
 
 
 def time_it(func):
@@ -35,6 +55,256 @@ def time_it(func):
     return wrapper
 
 
+def validate_numbers(*values: int | float) -> None:
+    """Validates that all values are of type int or float.
+
+    Raises:
+        TypeError: If any value is not of type int or float.
+    """
+    for val in values:
+        if not isinstance(val, (int, float)):
+            raise TypeError(f"Expected {val!r} to be int or float")
+
+
+def get_rotation_matrix(
+    angle: int | float, a: int | float, b: int | float, c: int | float
+) -> NDArray3x3[np.float64]:
+    """Returns the matrix rotating points around an axis through the origin.
+
+    Implementation based on [WikiPedia](https://en.wikipedia.org/wiki/Rodrigues%27_rotation_formula#Matrix_notation).
+
+    Args:
+        angle (int | float): Angle in radians
+            Poitive direction defined as counter-clockwise,
+            based on the right-hand rule.
+        a (int | float): Axis vector x direction.
+        b (int | float): Axis vector y direction.
+        c (int | float): Axis vector z direction.
+
+    Returns:
+        (NDArray3x3): Rotation matrix given as a numpy array shaped (3, 3)
+
+    Raises:
+        TypeError: If input value are not of type int or float.
+    """
+    validate_numbers(angle, a, b, c)
+    abc = np.array([a, b, c], dtype=np.float64)
+    a, b, c = abc / math.sqrt(np.sum(abc**2))
+    cross_product_matrix = np.array([[0, -c, b], [c, 0, -a], [-b, a, 0]])
+    return (
+        math.cos(angle) * np.eye(3)
+        + math.sin(angle) * cross_product_matrix
+        + (1 - math.cos(angle)) * np.outer([a, b, c], [a, b, c])
+    )
+
+
+def get_mirror_matrix(
+    a: int | float, b: int | float, c: int | float
+) -> NDArray3x3[np.float64]:
+    """Returns the matrix mirroring points in a plane through the origin.
+
+    Implementation based on formulation by [Jean Marie](https://math.stackexchange.com/questions/3927881/reflection-over-planes-in-3d).
+
+    Args:
+        a (int | float): Plane normal vector x dimension.
+        b (int | float): Plane normal vector y dimension.
+        c (int | float): Plane normal vector z dimension.
+
+    Returns:
+        (NDArray3x3): Mirror matrix given as a numpy array shaped (3, 3)
+
+    Raises:
+        TypeError: If input value are not of type int or float.
+    """
+    validate_numbers(a, b, c)
+    abc = np.array([a, b, c], dtype=np.float64)
+    a, b, c = abc / math.sqrt(np.sum(abc**2))
+    return np.array(
+        [
+            [1 - 2 * a * a, -2 * a * b, -2 * a * c],
+            [-2 * a * b, 1 - 2 * b * b, -2 * b * c],
+            [-2 * a * c, -2 * b * c, 1 - 2 * c * c],
+        ]
+    )
+
+
+def rotate_points_xyz(
+    xyz: NDArrayNx3,
+    angle: int | float,
+    a: int | float,
+    b: int | float,
+    c: int | float,
+    x0: int | float = 0.0,
+    y0: int | float = 0.0,
+    z0: int | float = 0.0,
+) -> NDArrayNx3[np.float64]:
+    """Rotates many points around an axis using a single matrix multiplication.
+
+    Args:
+        xyz (NDArrayNx3): Point xyz coordinates given as an ndarray shaped (N, 3)
+            or (3,).
+        angle (int | float): Angle in radians
+            Poitive direction defined as counter-clockwise,
+            based on the right-hand rule.
+        a (int | float): Axis vector x direction.
+        b (int | float): Axis vector y direction.
+        c (int | float): Axis vector z direction.
+        x0 (int | float, optional): Axis base x coordinate
+            Default is origin of coordinate system.
+        y0 (int | float, optional): Axis base y coordinate
+            Default is origin of coordinate system.
+        z0 (int | float, optional): Axis base z coordinate
+            Default is origin of coordinate system.
+
+    Returns:
+        (NDArrayNx3): New ndarray with rotated point xyz coordinates,
+            shaped as the input.
+
+    Raises:
+        TypeError: If input value are not of type int or float.
+    """
+    validate_numbers(x0, y0, z0)
+    matrix = get_rotation_matrix(angle, a, b, c)
+    xyz0 = np.array([x0, y0, z0], dtype=np.float64)
+    return (np.asarray(xyz) - xyz0) @ matrix.T + xyz0
+
+
+def mirror_points_xyz(
+    xyz: NDArrayNx3,
+    a: int | float,
+    b: int | float,
+    c: int | float,
+    x0: int | float = 0.0,
+    y0: int | float = 0.0,
+    z0: int | float = 0.0,
+) -> NDArrayNx3[np.float64]:
+    """Mirrors many points in a plane using a single matrix multiplication.
+
+    Args:
+        xyz (NDArrayNx3): Point xyz coordinates given as an ndarray shaped (N, 3)
+            or (3,).
+        a (int | float): Plane normal vector x dimension.
+        b (int | float): Plane normal vector y dimension.
+        c (int | float): Plane normal vector z dimension.
+        x0 (int | float, optional): Plane normal vector base x coordinate
+            Default is origin of coordinate system.
+        y0 (int | float, optional): Plane normal vector base y coordinate
+            Default is origin of coordinate system.
+        z0 (int | float, optional): Plane normal vector base z coordinate
+            Default is origin of coordinate system.
+
+    Returns:
+        (NDArrayNx3): New ndarray with mirrored point xyz coordinates,
+            shaped as the input.
+
+    Raises:
+        TypeError: If input value are not of type int or float.
+    """
+    validate_numbers(x0, y0, z0)
+    matrix = get_mirror_matrix(a, b, c)
+    xyz0 = np.array([x0, y0, z0], dtype=np.float64)
+    return (np.asarray(xyz) - xyz0) @ matrix.T + xyz0
+
+
+def get_translation_affine(
+    dx: int | float, dy: int | float, dz: int | float
+) -> NDArray4x4[np.float64]:
+    """Returns the affine matrix moving points in space.
+
+    Affine matrices act on homogeneous coordinates (x, y, z, 1), such that
+    a chain of transformations is composed into a single matrix by matrix
+    multiplication, e.g. `get_mirror_affine(...) @ get_translation_affine(...)`
+    first moves and then mirrors points.
+
+    Args:
+        dx (int | float): Distance moved in the x-direction.
+        dy (int | float): Distance moved in the y-direction.
+        dz (int | float): Distance moved in the z-direction.
+
+    Returns:
+        (NDArray4x4): Affine matrix given as a numpy array shaped (4, 4)
+
+    Raises:
+        TypeError: If input value are not of type int or float.
+    """
+    validate_numbers(dx, dy, dz)
+    affine = np.eye(4)
+    affine[:3, 3] = dx, dy, dz
+    return affine
+
+
+def get_rotation_affine(
+    angle: int | float,
+    a: int | float,
+    b: int | float,
+    c: int | float,
+    x0: int | float = 0.0,
+    y0: int | float = 0.0,
+    z0: int | float = 0.0,
+) -> NDArray4x4[np.float64]:
+    """Returns the affine matrix rotating points around an axis.
+
+    Parameters are the same as for [pymesh.utils.rotate_points_xyz][].
+
+    Returns:
+        (NDArray4x4): Affine matrix given as a numpy array shaped (4, 4)
+
+    Raises:
+        TypeError: If input value are not of type int or float.
+    """
+    validate_numbers(x0, y0, z0)
+    return _get_affine(get_rotation_matrix(angle, a, b, c), (x0, y0, z0))
+
+
+def get_mirror_affine(
+    a: int | float,
+    b: int | float,
+    c: int | float,
+    x0: int | float = 0.0,
+    y0: int | float = 0.0,
+    z0: int | float = 0.0,
+) -> NDArray4x4[np.float64]:
+    """Returns the affine matrix mirroring points in a plane.
+
+    Parameters are the same as for [pymesh.utils.mirror_points_xyz][].
+
+    Returns:
+        (NDArray4x4): Affine matrix given as a numpy array shaped (4, 4)
+
+    Raises:
+        TypeError: If input value are not of type int or float.
+    """
+    validate_numbers(x0, y0, z0)
+    return _get_affine(get_mirror_matrix(a, b, c), (x0, y0, z0))
+
+
+def _get_affine(
+    matrix: NDArray3x3[np.float64], xyz0: tuple[int | float, ...]
+) -> NDArray4x4[np.float64]:
+    """Returns the affine matrix applying matrix to points relative to xyz0."""
+    xyz0 = np.array(xyz0, dtype=np.float64)
+    affine = np.eye(4)
+    affine[:3, :3] = matrix
+    affine[:3, 3] = xyz0 - matrix @ xyz0
+    return affine
+
+
+def transform_points_affine(
+    xyz: NDArrayNx3, affine: NDArray4x4
+) -> NDArrayNx3[np.float64]:
+    """Transforms many points using a single matrix multiplication.
+
+    Args:
+        xyz (NDArrayNx3): Point xyz coordinates given as an ndarray shaped (..., 3).
+        affine (NDArray4x4): Affine matrix shaped (4, 4).
+
+    Returns:
+        (NDArrayNx3): New ndarray with transformed point xyz coordinates,
+            shaped as the input.
+    """
+    return np.asarray(xyz) @ affine[:3, :3].T + affine[:3, 3]
+
+
 def rotate_point_xyz(
     x: int | float,
     y: int | float,
@@ -72,18 +342,8 @@ def rotate_point_xyz(
     Raises:
         TypeError: If input value are not of type int or float.
     """
-    for val in (x, y, z, angle, a, b, c, x0, y0, z0):
-        if not isinstance(val, (int, float)):
-            raise TypeError(f"Expected {val!r} to be int or float")
-    xyz = np.array([x, y, z])
-    xyz0 = np.array([x0, y0, z0])
-    abc = np.array([a, b, c])
-    avec = abc / math.sqrt(np.sum(abc**2))
-    pvec = xyz - xyz0
-    part1 = pvec * math.cos(angle)
-    part2 = np.cross(avec, pvec) * math.sin(angle)
-    part3 = avec * np.dot(avec, pvec) * (1 - math.cos(angle))
-    return xyz0 + part1 + part2 + part3
+    validate_numbers(x, y, z)
+    return rotate_points_xyz(np.array([x, y, z]), angle, a, b, c, x0, y0, z0)
 
 
 def mirror_point_xyz(
@@ -122,21 +382,8 @@ def mirror_point_xyz(
     Raises:
         TypeError: If input value are not of type int or float.
     """
-    for val in (x, y, z, a, b, c, x0, y0, z0):
-        if not isinstance(val, (int, float)):
-            raise TypeError(f"Expected {val!r} to be int or float")
-    xyz = np.array([x, y, z])
-    xyz0 = np.array([x0, y0, z0])
-    abc = np.array([a, b, c])
-    a, b, c = abc / math.sqrt(np.sum(abc**2))
-    transformation_matrix = np.array(
-        [
-            [1 - 2 * a * a, -2 * a * b, -2 * a * c],
-            [-2 * a * b, 1 - 2 * b * b, -2 * b * c],
-            [-2 * a * c, -2 * b * c, 1 - 2 * c * c],
-        ]
-    )
-    return transformation_matrix.dot(xyz - xyz0) + xyz0
+    validate_numbers(x, y, z)
+    return mirror_points_xyz(np.array([x, y, z]), a, b, c, x0, y0, z0)
 
 
 def validate_curve_path_parameters(u: int | float, flip: bool = False) -> float:
@@ -190,3 +437,159 @@ def validate_surface_path_parameters(
         validate_curve_path_parameters(u, uflip),
         validate_curve_path_parameters(w, wflip),
     )
+
+
+def validate_curve_path_array(u: NDArrayN, flip: bool = False) -> NDArrayN[np.float64]:
+    """Validates an array of normalized curve path parameters.
+
+    Array counterpart of [pymesh.utils.validate_curve_path_parameters][],
+    validating all parameters in a single vectorized pass.
+
+    Args:
+        u (NDArrayN): Array-like of normalized path parameters between 0 and 1.
+        flip (bool, optional): Default is False. If True,
+            then u = (1 - u), i.e. the direction is flipped.
+
+    Returns:
+        u (NDArrayN[float]): New float ndarray with normalized path parameters
+            between 0 and 1 and the same shape as the input.
+
+    Raises:
+        TypeError: If u does not contain int or float numbers.
+        ValueError: If any value in u is not part of the number set [0 1].
+    """
+    u = np.asarray(u)
+    if u.dtype.kind not in "iuf":
+        raise TypeError(f"Expected an array of int or float numbers, but got {u!r}")
+    u = u.astype(np.float64)
+    if not np.all((u >= 0.0) & (u <= 1.0)):
+        raise ValueError(f"Expected values between 0 and 1 but got {u!r}")
+    if flip:
+        u = 1.0 - u
+    return u
+
+
+def validate_surface_path_arrays(
+    u: NDArrayN, w: NDArrayN, uflip: bool = False, wflip: bool = False
+) -> tuple[NDArrayN[np.float64], NDArrayN[np.float64]]:
+    """Validates arrays of normalized surface path parameters.
+
+    Args:
+        u (NDArrayN): Array-like of normalized path parameters between 0 and 1.
+        w (NDArrayN): Array-like of normalized path parameters between 0 and 1.
+        uflip (bool, optional): Default is False. If True,
+            then u = (1 - u), i.e. the direction is flipped.
+        wflip (bool, optional): Default is False. If True,
+            then w = (1 - w), i.e. the direction is flipped.
+
+    Returns:
+        (tuple): Tuple (u, w) with float ndarrays of normalized parameters
+            between 0 and 1.
+
+    Raises:
+        TypeError: If u or w does not contain int or float numbers.
+        ValueError: If any value in u or w is not part of the number set [0 1].
+    """
+    return (
+        validate_curve_path_array(u, uflip),
+        validate_curve_path_array(w, wflip),
+    )
+
+
+def validate_affine(affine: NDArray4x4) -> NDArray4x4[np.float64]:
+    """Validates a rigid affine transformation matrix.
+
+    Rigid affine matrices are composed of translations, rotations and mirrors,
+    which preserve lengths, such that their upper-left 3x3 block is orthonormal
+    up to AFFINE_TOLERANCE.
+
+    Args:
+        affine (NDArray4x4): Array-like affine matrix with shape (4, 4),
+            e.g. as returned by [pymesh.utils.get_rotation_affine][].
+
+    Returns:
+        (NDArray4x4): Read-only float ndarray copy of the affine matrix.
+
+    Raises:
+        TypeError: If affine does not contain int or float numbers.
+        ValueError: If affine is not shaped (4, 4), is not finite,
+            its last row is not (0, 0, 0, 1) or it is not rigid.
+    """
+    affine = np.array(affine)
+    if affine.dtype.kind not in "iuf":
+        raise TypeError(f"Expected {affine!r} to contain int or float numbers")
+    affine = affine.astype(np.float64)
+    if affine.shape != (4, 4):
+        raise ValueError(
+            f"Expected an affine matrix with shape (4, 4), got {affine.shape}"
+        )
+    if not np.all(np.isfinite(affine)):
+        raise ValueError("Expected an affine matrix with finite values")
+    if not np.array_equal(affine[3], [0.0, 0.0, 0.0, 1.0]):
+        raise ValueError(
+            "Expected the last row of the affine matrix to be (0, 0, 0, 1)"
+        )
+    matrix = affine[:3, :3]
+    if not np.allclose(matrix @ matrix.T, np.eye(3), rtol=0.0, atol=AFFINE_TOLERANCE):
+        raise ValueError(
+            "Expected a rigid affine matrix composed of translations, "
+            "rotations and mirrors, got a scaling or shearing matrix"
+        )
+    affine.flags.writeable = False
+    return affine
+
+
+def integrate_gauss_legendre(
+    fn: Callable[[NDArrayN[np.float64]], NDArrayN[np.float64]],
+    tolerance: int | float = 1e-8,
+    order: int = GAUSS_LEGENDRE_ORDER,
+    max_depth: int = GAUSS_LEGENDRE_MAX_DEPTH,
+    max_intervals: int = GAUSS_LEGENDRE_MAX_INTERVALS,
+) -> float:
+    """Integrates fn from 0 to 1 using adaptive Gauss-Legendre quadrature.
+
+    Each interval is compared against the sum of its two halves and split until
+    the difference is within its share of the tolerance. All intervals at a given
+    subdivision level are evaluated in one vectorized call to fn.
+
+    Args:
+        fn: Vectorized integrand, taking an ndarray of values between 0 and 1
+            and returning an ndarray of the same shape.
+        tolerance: Relative tolerance of the integral.
+        order: Number of Gauss-Legendre points per interval.
+        max_depth: Maximum number of interval subdivisions.
+        max_intervals: Maximum number of intervals evaluated at one subdivision level.
+            Bounds the cost when the tolerance cannot be reached, e.g. due to
+            numerical noise in fn, in which case the current estimate is returned.
+
+    Returns:
+        (float): Integral of fn from 0 to 1.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+
+    def integrate(a, b):
+        half = (b - a)[:, np.newaxis] / 2
+        x = (a + b)[:, np.newaxis] / 2 + half * nodes
+        return np.sum(half * weights * fn(x), axis=1)
+
+    a, b = np.array([0.0]), np.array([1.0])
+    coarse = integrate(a, b)
+    scale = abs(coarse[0])
+    total = 0.0
+    for _ in range(max_depth):
+        mid = (a + b) / 2
+        left, right = integrate(a, mid), integrate(mid, b)
+        fine = left + right
+        scale = max(scale, abs(total + np.sum(fine)))
+        refine = np.abs(fine - coarse) > tolerance * scale * (b - a)
+        if 2 * np.count_nonzero(refine) > max_intervals:
+            refine[:] = False
+        total += np.sum(fine[~refine])
+        a, mid, b = a[refine], mid[refine], b[refine]
+        if len(a) == 0:
+            break
+        a, b = np.concatenate((a, mid)), np.concatenate((mid, b))
+        coarse = np.concatenate((left[refine], right[refine]))
+    else:
+        total += np.sum(coarse)
+    return float(total)
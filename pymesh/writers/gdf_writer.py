@@ -1,20 +1,37 @@
 """Module containing GDFWriter class"""
 
 from pathlib import Path
-import os
 
-from pymesh.mesh.mesh_generator import MeshGenerator
+import numpy as np
+
+from pymesh import instrumentation
+from pymesh.typing import NDArrayNx12
+from pymesh.writers.writer import Writer
 
 # ! fix typing of NDArray cases
 
+PANEL_LINE_FORMAT = " ".join(["%+.4e"] * 12) + "\n"
+"""printf-style format of a panel line with twelve vertex coordinates."""
+
+PANELS_PER_CHUNK = 8192
+"""Number of panels formatted and written to file at a time."""
+
 
-class GDFWriter:
+class GDFWriter(Writer):
     """Writes surface panels to filename with the extension 'gdf'.
 
     For information regarding the file formatting, refer to Section 6.1
     in the [WAMIT Manual](https://www.wamit.com/manual7.x/v75_manual.pdf).
 
+    Panels are streamed from the mesh when writing, one block at a time,
+    such that the memory use is bounded by a single block of panels.
+    The file is written to a temporary file first, which replaces filename
+    once all panels are written.
+
     Attributes:
+        mesh (PanelSource): mesh providing the panels, e.g. a MeshGenerator
+            or an IndexedMesh
+        panels (NDArrayNx4x3[float]): all mesh panels, generated on access
         ulen (float): unit length
         grav (float): gravitational constant
         isx (bool): symmetry in x=0.
@@ -26,107 +43,49 @@ class GDFWriter:
         header (str): header line in output file
     """
 
-    def __init__(
-        self,
-        mesh: MeshGenerator,
-        ulen: float = 1.0,
-        grav: float = 9.816,
-        isx: bool = False,
-        isy: bool = False,
-        header: str = None,
-    ) -> None:
-        self.panels = mesh.get_panels()
-        self.ulen = ulen
-        self.grav = grav
-        self.isx = isx
-        self.isy = isy
-        if header is None:
-            header = "auto-generated using the pymesh package"
-        self.header = header
-
-    @property
-    def header(self) -> str:
-        return self._header
-
-    @header.setter
-    def header(self, value: str) -> None:
-        if not isinstance(value, str):
-            raise TypeError("header must be of type 'str'")
-        if len(value) > 72:
-            raise ValueError("header text string is more than 72 characters")
-        self._header = value
-
-    @property
-    def ulen(self) -> float:
-        return self._ulen
-
-    @ulen.setter
-    def ulen(self, value: float) -> None:
-        if not isinstance(value, float):
-            raise TypeError("ulen must be of type 'float'")
-        if value <= 0:
-            raise ValueError("ulen must be positive")
-        self._ulen = value
-
-    @property
-    def grav(self) -> float:
-        return self._grav
-
-    @grav.setter
-    def grav(self, value: float) -> None:
-        if not isinstance(value, float):
-            raise TypeError("grav must be of type 'float'")
-        if value <= 0:
-            raise ValueError("grav must be positive")
-        self._grav = value
-
-    @property
-    def isx(self) -> bool:
-        return self._isx
-
-    @isx.setter
-    def isx(self, value: bool) -> None:
-        if not isinstance(value, bool):
-            raise TypeError("isx must be of type 'bool'")
-        self._isx = value
-
-    @property
-    def isy(self) -> bool:
-        return self._isy
-
-    @isy.setter
-    def isy(self, value: bool) -> None:
-        if not isinstance(value, bool):
-            raise TypeError("isy must be of type 'bool'")
-        self._isy = value
+    extension = ".gdf"
 
     def write(self, filename: Path):
         """Writes surface panels to file.
 
         Args:
             filename (Path): Filename path without extention.
+
+        Raises:
+            RuntimeError: If the mesh changed while writing, in which case
+                filename is left untouched.
         """
-        self.__validate_filename(filename)
-        with open(filename, "w+", encoding="utf-8") as file:
+        self._validate_filename(filename)
+        with self._open_replacing(filename, "w+", encoding="utf-8") as file:
             file.write(f"{self.header}\n")
             file.write(f"{self.ulen:f} {self.grav:f}\n")
             file.write(f"{self.isx:.0f} {self.isy:.0f}\n")
-            npan = len(self.panels)
+            npan = self.mesh.get_num_panels()
             file.write(f"{npan:.0f}\n")
-            for panel in self.panels:
-                txt = ""
-                for i, coord in enumerate(panel):
-                    txt_space = "" if i == 0 else " "
-                    txt += f"{txt_space}{coord:+.4e}"
-                file.write(f"{txt}\n")
-
-    def __validate_filename(self, filename: Path) -> None:
-        if not isinstance(filename, Path):
-            raise TypeError("filename musth be of type 'Path'")
-        if not self.__is_gdf(filename):
-            raise TypeError("filename must have the extension '.gdf'")
-
-    def __is_gdf(self, filename) -> bool:
-        _, extension = os.path.splitext(filename)
-        extension = extension.lower()
-        return extension == ".gdf"
+            num_written = 0
+            for panels in self.mesh.iter_panel_blocks(max_panels=PANELS_PER_CHUNK):
+                coords = panels.reshape(-1, 12)
+                for start in range(0, len(coords), PANELS_PER_CHUNK):
+                    with instrumentation.timer(instrumentation.FORMATTING):
+                        text = format_panels(coords[start : start + PANELS_PER_CHUNK])
+                    with instrumentation.timer(instrumentation.IO):
+                        file.write(text)
+                num_written += len(coords)
+            if num_written != npan:
+                raise RuntimeError(
+                    f"Expected {npan} panels but wrote {num_written}, "
+                    "as the mesh changed while writing"
+                )
+
+
+def format_panels(coords: NDArrayNx12[np.float64]) -> str:
+    """Formats panel coordinates as GDF panel lines in a single operation.
+
+    Args:
+        coords: Float ndarray with shape (N, 12), one row per panel.
+
+    Returns:
+        (str): N panel lines, each with twelve coordinates formatted as '%+.4e'
+            and separated by a single space.
+    """
+    return (PANEL_LINE_FORMAT * len(coords)) % tuple(coords.ravel().tolist())
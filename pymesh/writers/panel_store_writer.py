@@ -0,0 +1,125 @@
+"""Module containing PanelStoreWriter class"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from pymesh import instrumentation
+from pymesh.writers.writer import Writer
+
+MAGIC = b"PYMESHPS"
+"""File signature at the start of every panel store file."""
+
+STORE_VERSION = 1
+"""Version of the panel store file layout."""
+
+ALIGNMENT = 64
+"""Byte alignment of the panel and surface id blocks."""
+
+PANEL_DTYPE = np.dtype("<f8")
+SURFACE_ID_DTYPE = np.dtype("<i4")
+
+PANELS_PER_CHUNK = 65536
+"""Number of panels generated and written to file at a time."""
+
+
+class PanelStoreWriter(Writer):
+    """Writes surface panels to a binary panel store with the extension 'pmesh'.
+
+    The panel store is a native binary format that can be opened instantly,
+    regardless of its size, by memory mapping it with a
+    [PanelStoreReader][pymesh.readers.panel_store_reader.PanelStoreReader].
+    The file consists of:
+
+    1. the 8 byte signature 'PYMESHPS',
+    2. the byte length of the JSON header as a little-endian uint32,
+    3. a UTF-8 encoded JSON header with the file version, the number of panels,
+       the metadata ulen, grav, isx, isy and header, and the byte offsets of
+       the panel and surface id blocks,
+    4. the panels as a raw little-endian float64 block with shape (N, 4, 3),
+    5. the surface id of each panel as a raw little-endian int32 block with shape (N,).
+
+    Both blocks start at a multiple of 64 bytes. Surface ids are taken from the
+    mesh if it provides them, e.g. a MeshGenerator, and are zero otherwise.
+
+    Attributes:
+        mesh (PanelSource): mesh providing the panels, e.g. a MeshGenerator
+            or an IndexedMesh
+        panels (NDArrayNx4x3[float]): all mesh panels, generated on access
+        ulen (float): unit length
+        grav (float): gravitational constant
+        isx (bool): symmetry in x=0.
+        isy (bool): symmetry in y=0.
+        header (str): header line stored in the output file
+    """
+
+    extension = ".pmesh"
+
+    def write(self, filename: Path) -> None:
+        """Writes surface panels to file.
+
+        Args:
+            filename (Path): Filename path with the extension '.pmesh'.
+
+        Raises:
+            TypeError: If filename is not a Path with the extension '.pmesh'.
+            RuntimeError: If the mesh changed while writing, in which case
+                filename is left untouched.
+        """
+        self._validate_filename(filename)
+        npan = self.mesh.get_num_panels()
+        if hasattr(self.mesh, "get_surface_ids"):
+            surface_ids = np.asarray(self.mesh.get_surface_ids())
+        else:
+            surface_ids = np.zeros(npan, dtype=SURFACE_ID_DTYPE)
+        if len(surface_ids) != npan:
+            raise RuntimeError(
+                f"Expected {npan} surface ids but got {len(surface_ids)}, "
+                "as the mesh changed while writing"
+            )
+        prefix = self._get_prefix(npan)
+        with self._open_replacing(filename, "wb") as file:
+            file.write(prefix)
+            num_written = 0
+            for panels in self.mesh.iter_panel_blocks(max_panels=PANELS_PER_CHUNK):
+                with instrumentation.timer(instrumentation.IO):
+                    file.write(np.ascontiguousarray(panels, dtype=PANEL_DTYPE).data)
+                num_written += len(panels)
+            if num_written != npan:
+                raise RuntimeError(
+                    f"Expected {npan} panels but wrote {num_written}, "
+                    "as the mesh changed while writing"
+                )
+            file.write(bytes(-file.tell() % ALIGNMENT))
+            file.write(np.ascontiguousarray(surface_ids, dtype=SURFACE_ID_DTYPE).data)
+
+    def _get_prefix(self, npan: int) -> bytes:
+        """Returns the signature and JSON header, padded to the panel block offset."""
+        header = {
+            "version": STORE_VERSION,
+            "npan": npan,
+            "ulen": self.ulen,
+            "grav": self.grav,
+            "isx": self.isx,
+            "isy": self.isy,
+            "header": self.header,
+            "panels_offset": 0,
+            "surface_ids_offset": 0,
+        }
+        while True:
+            text = json.dumps(header).encode("utf-8")
+            panels_offset = _align(len(MAGIC) + 4 + len(text))
+            if panels_offset == header["panels_offset"]:
+                break
+            header["panels_offset"] = panels_offset
+            header["surface_ids_offset"] = _align(
+                panels_offset + npan * 12 * PANEL_DTYPE.itemsize
+            )
+        text = text.ljust(panels_offset - len(MAGIC) - 4)
+        return MAGIC + len(text).to_bytes(4, "little") + text
+
+
+def _align(offset: int) -> int:
+    """Returns the smallest multiple of ALIGNMENT not less than offset."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
@@ -0,0 +1,146 @@
+"""Module containing Writer class"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+import os
+from typing import IO
+import uuid
+
+import numpy as np
+
+from pymesh.typing import NDArrayNx4x3, PanelSource
+
+
+class Writer(ABC):
+    """Base class for writers of surface panels to file.
+
+    Holds the mesh and the WAMIT geometry metadata shared by all file formats.
+    For information regarding the metadata, refer to Section 6.1
+    in the [WAMIT Manual](https://www.wamit.com/manual7.x/v75_manual.pdf).
+
+    Attributes:
+        mesh (PanelSource): mesh providing the panels, e.g. a MeshGenerator
+            or an IndexedMesh
+        panels (NDArrayNx4x3[float]): all mesh panels, generated on access
+        ulen (float): unit length
+        grav (float): gravitational constant
+        isx (bool): symmetry in x=0.
+            If True, the x = 0 plane is a geometric plane of symmetry.
+            If False, the x = 0 plane is *not* a geometric plane of symmetry.
+        isy (bool): symmetry in y=0.
+            If True, the y = 0 plane is a geometric plane of symmetry.
+            If False, the y = 0 plane is *not* a geometric plane of symmetry.
+        header (str): header line in output file
+    """
+
+    extension: str = ""
+    """Required filename extension, including the leading dot."""
+
+    def __init__(
+        self,
+        mesh: PanelSource,
+        ulen: float = 1.0,
+        grav: float = 9.816,
+        isx: bool = False,
+        isy: bool = False,
+        header: str = None,
+    ) -> None:
+        self.mesh = mesh
+        self.ulen = ulen
+        self.grav = grav
+        self.isx = isx
+        self.isy = isy
+        if header is None:
+            header = "auto-generated using the pymesh package"
+        self.header = header
+
+    @property
+    def panels(self) -> NDArrayNx4x3[np.float64]:
+        return self.mesh.get_panel_array()
+
+    @property
+    def header(self) -> str:
+        return self._header
+
+    @header.setter
+    def header(self, value: str) -> None:
+        if not isinstance(value, str):
+            raise TypeError("header must be of type 'str'")
+        if len(value) > 72:
+            raise ValueError("header text string is more than 72 characters")
+        self._header = value
+
+    @property
+    def ulen(self) -> float:
+        return self._ulen
+
+    @ulen.setter
+    def ulen(self, value: float) -> None:
+        if not isinstance(value, float):
+            raise TypeError("ulen must be of type 'float'")
+        if value <= 0:
+            raise ValueError("ulen must be positive")
+        self._ulen = value
+
+    @property
+    def grav(self) -> float:
+        return self._grav
+
+    @grav.setter
+    def grav(self, value: float) -> None:
+        if not isinstance(value, float):
+            raise TypeError("grav must be of type 'float'")
+        if value <= 0:
+            raise ValueError("grav must be positive")
+        self._grav = value
+
+    @property
+    def isx(self) -> bool:
+        return self._isx
+
+    @isx.setter
+    def isx(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("isx must be of type 'bool'")
+        self._isx = value
+
+    @property
+    def isy(self) -> bool:
+        return self._isy
+
+    @isy.setter
+    def isy(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError("isy must be of type 'bool'")
+        self._isy = value
+
+    @abstractmethod
+    def write(self, filename: Path) -> None:
+        """Writes surface panels to file."""
+
+    def _validate_filename(self, filename: Path) -> None:
+        if not isinstance(filename, Path):
+            raise TypeError("filename musth be of type 'Path'")
+        _, extension = os.path.splitext(filename)
+        if extension.lower() != self.extension:
+            raise TypeError(f"filename must have the extension '{self.extension}'")
+
+    @staticmethod
+    @contextmanager
+    def _open_replacing(filename: Path, mode: str, **kwargs) -> Iterator[IO]:
+        """Opens a temporary file next to filename, which replaces filename on success.
+
+        If writing fails, the temporary file is removed and an existing file
+        at filename is left untouched, such that no truncated file remains.
+        Keyword arguments are passed to open.
+        """
+        temporary = filename.with_name(f".{filename.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temporary, mode, **kwargs) as file:
+                yield file
+            os.replace(temporary, filename)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
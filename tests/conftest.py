@@ -5,7 +5,7 @@ import math
 import pytest
 import numpy as np
 
-from pymesh import Point, Line
+from pymesh import Point, Line, BilinearSurface, MeshGenerator
 
 
 @pytest.fixture
@@ -48,6 +48,18 @@ def p11() -> Point:
     return Point(1, 1, 0)
 
 
+@pytest.fixture
+def surface(p00, p01, p11, p10) -> BilinearSurface:
+    return BilinearSurface(p00, p01, p11, p10)
+
+
+@pytest.fixture
+def mesh(surface) -> MeshGenerator:
+    mesh = MeshGenerator()
+    mesh.add_surface(surface, density_u=3, density_w=2)
+    return mesh
+
+
 @pytest.fixture
 def point1() -> Point:
     return Point(0, 0, 0)
@@ -152,6 +164,27 @@ def assert_curve_path_rounded():
     return fn
 
 
+@pytest.fixture
+def assert_curve_path_array():
+    """Asserts that path_array agrees with the scalar path method"""
+
+    def fn(curve, decimals=DECIMALS) -> None:
+        u = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+        for flip in (False, True):
+            result = curve.path_array(u, flip)
+            assert result.shape == (len(u), 3)
+            for k, uk in enumerate(u):
+                expected = curve.path(uk, flip)
+                assert np.all(np.round(result[k] - expected, decimals=decimals) == 0)
+        assert curve.path_array(np.array([])).shape == (0, 3)
+        with pytest.raises(ValueError):
+            curve.path_array(np.array([0.5, 1.5]))
+        with pytest.raises(TypeError):
+            curve.path_array(np.array(["u"]))
+
+    return fn
+
+
 @pytest.fixture
 def test_surface_path():
     """Works for all surfaces as long as they generate a plane surface"""
@@ -185,3 +218,33 @@ def test_surface_path():
         assert_point(surface, 0, 1, True, False, p11)
 
     return func
+
+
+@pytest.fixture
+def assert_surface_path_arrays():
+    """Asserts that path_grid and path_pairs agree with the scalar path method"""
+
+    def func(surface, decimals=DECIMALS):
+        u = np.array([0.0, 0.3, 0.5, 1.0])
+        w = np.array([0.0, 0.2, 0.9])
+        for uflip, wflip in ((False, False), (True, False), (False, True)):
+            grid = surface.path_grid(u, w, uflip, wflip)
+            assert grid.shape == (3, len(u), len(w))
+            for i, ui in enumerate(u):
+                for j, wj in enumerate(w):
+                    expected = surface.path(ui, wj, uflip, wflip)
+                    result = grid[:, i, j]
+                    assert np.all(np.round(result - expected, decimals=decimals) == 0)
+        pairs = surface.path_pairs(u[:3], w)
+        assert pairs.shape == (3, 3)
+        for k in range(3):
+            expected = surface.path(u[k], w[k])
+            assert np.all(np.round(pairs[k] - expected, decimals=decimals) == 0)
+        with pytest.raises(ValueError):
+            surface.path_grid(np.array([0.0, 1.5]), w)
+        with pytest.raises(TypeError):
+            surface.path_grid(np.array(["u"]), w)
+        with pytest.raises(ValueError):
+            surface.path_pairs(u, w)
+
+    return func
@@ -127,6 +127,10 @@ def test_path(
     )
 
 
+def test_path_array(assert_curve_path_array, curve1) -> None:
+    assert_curve_path_array(curve1)
+
+
 def test_copy(assert_copy, curve1) -> None:
     assert_copy(curve1)
 
@@ -149,3 +153,15 @@ def test_mirror() -> None:
     assert Arc3P(Point(0, 0, 0), Point(-1, 0, 0), Point(0, 1, 0)).mirror(
         1, 0, 0
     ) == Arc3P(Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0))
+
+
+def test_cached_geometry(curve1: Arc3P, point2: Point) -> None:
+    normal = curve1.plane_unit_normal
+    assert curve1.plane_unit_normal is normal
+    with pytest.raises(ValueError):
+        normal[0] = 1.0
+    curve1.rotate(math.pi / 2, 1, 0, 0)
+    assert np.allclose(curve1.plane_unit_normal, [0, -1, 0])
+    assert np.allclose(curve1.path(1), [0, 0, 1])
+    point2.move(1, 0, 0)
+    assert curve1.radius == 2.0
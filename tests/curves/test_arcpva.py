@@ -130,6 +130,10 @@ def test_path(assert_curve_path_rounded, point, angle, abc) -> None:
     )
 
 
+def test_path_array(assert_curve_path_array, curve1) -> None:
+    assert_curve_path_array(curve1)
+
+
 def test_copy(assert_copy, curve1) -> None:
     assert_copy(curve1)
 
@@ -146,3 +150,13 @@ def test_mirror() -> None:
     assert ArcPVA(Point(-1, 0, 0), -math.pi / 2, 0, 0, 1).mirror(1, 0, 0) == ArcPVA(
         Point(0, 0, 0), math.pi / 2, 0, 0, 1
     )
+
+
+def test_cached_geometry(curve1, point) -> None:
+    assert curve1.radius == 1.0
+    assert np.allclose(curve1.path(1), [0, 1, 0])
+    curve1.move(0, 0, 1)
+    assert np.allclose(curve1.path(1), [0, 1, 1])
+    point.move(1, 0, 0)
+    assert curve1.radius == 2.0
+    assert np.allclose(curve1.path(1), [0, 2, 1])
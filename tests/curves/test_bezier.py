@@ -1,5 +1,8 @@
 """Module for testing the Bezier class functionality"""
 
+import math
+
+import numpy as np
 import pytest
 
 from pymesh import Point, Bezier
@@ -73,6 +76,10 @@ def test_path(assert_curve_path_rounded, points) -> None:
     assert_curve_path_rounded(curve, 1.0, False, points[2].xyz, DECIMALS)
 
 
+def test_path_array(assert_curve_path_array, curve1) -> None:
+    assert_curve_path_array(curve1)
+
+
 def test_copy(assert_copy, curve1) -> None:
     assert_copy(curve1)
 
@@ -83,3 +90,54 @@ def test_move(assert_move, curve1, curve1_moved, dx, dy, dz) -> None:
 
 def test_rotate(assert_rotate, curve1, curve1_rotated, angle) -> None:
     assert_rotate(curve1, curve1_rotated, a=0, b=0, c=1, angle=angle)
+
+
+def test_path_high_degree() -> None:
+    points = [Point(i, (-1) ** i, 0.1 * i) for i in range(15)]
+    curve = Bezier(points)
+    u = 0.3
+    xyz = [point.xyz for point in points]
+    while len(xyz) > 1:  # de Casteljau reference
+        xyz = [(1 - u) * p0 + u * p1 for p0, p1 in zip(xyz[:-1], xyz[1:])]
+    assert np.allclose(curve.path(u), xyz[0], rtol=0, atol=1e-12)
+
+
+def test_control_points(curve1, points) -> None:
+    xyz = curve1.control_points
+    assert xyz.shape == (3, 3)
+    assert np.all(xyz == np.array([point.xyz for point in points]))
+    curve1.move(1, 0, 0)
+    assert np.all(curve1.control_points[:, 0] == np.array([1, 2, 3]))
+    assert points[0].x == 0.0
+    curve1.points[0].move(1, 0, 0)
+    assert curve1.control_points[0, 0] == 2.0
+
+
+def test_points_copied(points) -> None:
+    curve = Bezier(points)
+    points[1].move(0, 1, 0)
+    assert curve.points[1] == Point(1, 0, 0)
+    curve.points[1].move(0, 0, 1)
+    assert curve.points[1] == Point(1, 0, 1)
+    assert points[1] == Point(1, 1, 0)
+
+
+def test_length_cached(curve1) -> None:
+    assert curve1.length is curve1.length
+    curve1.rotate(math.pi / 2, 0, 0, 1)
+    assert math.isclose(curve1.length, 2.0)
+    curve1.points[-1].move(2, 0, 0)
+    assert math.isclose(curve1.length, curve1.copy().length)
+    assert curve1.length > 2.0
+
+
+def test_length_tolerance() -> None:
+    curve = Bezier([Point(0, 0, 0), Point(1, 2, 0), Point(2, -1, 1), Point(3, 0, 0)])
+    u = np.linspace(0, 1, 100001)
+    expected = np.sum(
+        np.sqrt(np.sum(np.diff(curve.path_array(u), axis=0) ** 2, axis=1))
+    )
+    curve.length_tolerance = 1e-12
+    assert math.isclose(curve.length, expected, rel_tol=1e-8)
+    with pytest.raises(ValueError):
+        curve.length_tolerance = -1
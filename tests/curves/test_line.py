@@ -58,6 +58,10 @@ def test_get_path(point1: Point, point2: Point) -> None:
     )
 
 
+def test_path_array(assert_curve_path_array, line1) -> None:
+    assert_curve_path_array(line1)
+
+
 def test_copy(assert_copy, line1) -> None:
     assert_copy(line1)
 
@@ -6,6 +6,7 @@ import pytest
 
 from pymesh import Point, UserDefinedCurve
 from pymesh.typing import NDArray3
+from pymesh.utils import mirror_points_xyz, rotate_points_xyz
 
 
 TOLERANCE = 0.0001
@@ -69,6 +70,10 @@ def test_get_path(user_path_fn) -> None:
     assert np.isclose(path(1), user_path_fn(1)).all()
 
 
+def test_path_array(assert_curve_path_array, curve1) -> None:
+    assert_curve_path_array(curve1)
+
+
 def test_copy(assert_copy, curve1) -> None:
     assert_copy(curve1)
 
@@ -91,3 +96,48 @@ def test_mirror() -> None:
     curve = UserDefinedCurve(lambda u: np.array([u, u, 0]))
     curve_mirrored_in_xz_plane = UserDefinedCurve(lambda u: np.array([u, -u, 0]))
     assert curve.mirror(0, 1, 0) == curve_mirrored_in_xz_plane
+
+
+def test_transform_chain(user_path_fn, angle) -> None:
+    calls = []
+
+    def path(u):
+        calls.append(u)
+        return user_path_fn(u)
+
+    curve = UserDefinedCurve(path)
+    for _ in range(10):
+        curve.move(1, 2, 3).rotate(angle, 0, 0, 1, x0=1).mirror(1, 1, 0, y0=2)
+    u = np.linspace(0, 1, 5)
+    xyz = np.column_stack([u, u, np.zeros_like(u)])
+    for _ in range(10):
+        xyz = xyz + [1, 2, 3]
+        xyz = rotate_points_xyz(xyz, angle, 0, 0, 1, x0=1)
+        xyz = mirror_points_xyz(xyz, 1, 1, 0, y0=2)
+    calls.clear()
+    assert np.allclose(curve.path_array(u), xyz)
+    assert len(calls) == len(u)
+    assert np.allclose(curve.path(0.5), xyz[2])
+
+
+def test_copy_transformed(curve1, dx, dy, dz) -> None:
+    curve = curve1.move(dx, dy, dz)
+    curve_copy = curve.copy()
+    curve_copy.move(1, 0, 0)
+    assert np.allclose(curve.path(0), [dx, dy, dz])
+    assert np.allclose(curve_copy.path(0), [dx + 1, dy, dz])
+
+
+def test_length_cached(user_path_fn, dx, dy, dz) -> None:
+    curve = UserDefinedCurve(user_path_fn)
+    length = curve.length
+    assert curve.length is length
+    curve.move(dx, dy, dz)
+    assert curve.length is not length
+    assert np.isclose(curve.length, math.sqrt(2), atol=TOLERANCE)
+
+
+def test_length_unreachable_tolerance() -> None:
+    curve = UserDefinedCurve(lambda u: np.array([u, math.sin(math.pi * u), 0]))
+    curve.length_tolerance = 0.0
+    assert np.isclose(curve.length, 2.3048926613, atol=1e-9)
@@ -60,6 +60,10 @@ def test_path(p00, p01, p10, p11, test_surface_path) -> None:
     test_surface_path(surface, p00, p01, p10, p11)
 
 
+def test_path_arrays(surface1, assert_surface_path_arrays) -> None:
+    assert_surface_path_arrays(surface1)
+
+
 def test_rotate(assert_rotate) -> None:
     angle = 90 * math.pi / 180
     surface = BilinearSurface(
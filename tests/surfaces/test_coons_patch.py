@@ -73,6 +73,10 @@ def test_path(p00, p01, p10, p11, valid_lines, test_surface_path) -> None:
     test_surface_path(surface, p00, p01, p10, p11)
 
 
+def test_path_arrays(valid_lines, assert_surface_path_arrays) -> None:
+    assert_surface_path_arrays(CoonsPatch(valid_lines))
+
+
 def test_rotate() -> None:
     DECIMALS = 4
     line_u0 = Line(Point(0, 0, 0), Point(1, 0, 0))
@@ -81,6 +81,10 @@ def test_path(point0, point1, point2, test_surface_path) -> None:
     test_surface_path(surface, p00, p01, p10, p11)
 
 
+def test_path_arrays(surface1, assert_surface_path_arrays) -> None:
+    assert_surface_path_arrays(surface1)
+
+
 def test_rotate(assert_rotate) -> None:
     angle = 90 * math.pi / 180
     surface = PlaneSurface(Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0))
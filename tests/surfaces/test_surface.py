@@ -0,0 +1,56 @@
+"""Module for testing the Surface base class functionality"""
+
+import numpy as np
+import pytest
+
+from pymesh import MeshGenerator
+from pymesh.geo.surfaces.surface import Surface
+
+
+class ParaboloidSurface(Surface):
+    """User-defined surface implementing only the abstract methods."""
+
+    def __init__(self, height: float) -> None:
+        self.height = height
+
+    def path(self, u, w, uflip=False, wflip=False):
+        u, w = 1 - u if uflip else u, 1 - w if wflip else w
+        return np.array([u, w, self.height * (u**2 + w**2)])
+
+    def copy(self):
+        return ParaboloidSurface(self.height)
+
+    def move(self, dx=0.0, dy=0.0, dz=0.0):
+        raise NotImplementedError
+
+    def rotate(self, angle, a, b, c, x0=0.0, y0=0.0, z0=0.0):
+        raise NotImplementedError
+
+    def mirror(self, a, b, c, x0=0.0, y0=0.0, z0=0.0):
+        raise NotImplementedError
+
+    def get_max_lengths(self):
+        return 1.0, 1.0
+
+
+@pytest.fixture
+def paraboloid() -> ParaboloidSurface:
+    return ParaboloidSurface(height=2.0)
+
+
+def test_path_array_fallback(paraboloid) -> None:
+    u, w = np.array([0.0, 0.5, 1.0]), np.array([0.25, 1.0])
+    xyz = paraboloid.path_grid(u, w)
+    assert xyz.shape == (3, 3, 2)
+    for i, j in np.ndindex(3, 2):
+        assert np.all(xyz[:, i, j] == paraboloid.path(u[i], w[j]))
+    pairs = paraboloid.path_pairs(u[:2], w)
+    assert np.all(pairs[1] == paraboloid.path(0.5, 1.0))
+
+
+def test_path_array_fallback_mesh(paraboloid) -> None:
+    mesh = MeshGenerator()
+    mesh.add_surface(paraboloid, density_u=2, density_w=3)
+    panels = mesh.get_panel_array()
+    assert panels.shape == (6, 4, 3)
+    assert np.all(panels[..., 2] == 2.0 * (panels[..., 0] ** 2 + panels[..., 1] ** 2))
@@ -60,6 +60,10 @@ def test_path(p00, p10, p01, p11, curve, sweeper, test_surface_path) -> None:
     test_surface_path(surface, p00, p01, p10, p11)
 
 
+def test_path_arrays(curve, sweeper, assert_surface_path_arrays) -> None:
+    assert_surface_path_arrays(SweptSurface(curve, sweeper))
+
+
 def test_rotate(assert_rotate, curve, sweeper) -> None:
     angle = 90 * math.pi / 180
     surface = SweptSurface(curve, sweeper)
@@ -0,0 +1,109 @@
+"""Module for testing the GDFReader class functionality"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pymesh import GDFReader, GDFWriter, MeshGenerator
+
+
+@pytest.fixture
+def filename(mesh, tmp_path) -> Path:
+    filename = tmp_path / "mesh.gdf"
+    GDFWriter(mesh, ulen=2.0, grav=9.81, isy=True, header="hull").write(filename)
+    return filename
+
+
+def test_header(filename) -> None:
+    reader = GDFReader(filename)
+    assert reader.header == "hull"
+    assert (reader.ulen, reader.grav, reader.isx, reader.isy) == (
+        2.0,
+        9.81,
+        False,
+        True,
+    )
+    assert reader.get_num_panels() == 6
+
+
+def test_get_panel_array(mesh, filename) -> None:
+    panels = GDFReader(filename).get_panel_array()
+    assert panels.shape == (6, 4, 3)
+    assert panels.dtype == np.float64
+    assert np.allclose(panels, mesh.get_panel_array(), atol=1e-4)
+
+
+@pytest.mark.parametrize("max_panels", [None, 1, 4, 100])
+def test_iter_panel_blocks(filename, max_panels) -> None:
+    reader = GDFReader(filename)
+    blocks = list(reader.iter_panel_blocks(max_panels))
+    if max_panels is not None:
+        assert all(len(block) <= max_panels for block in blocks)
+    assert np.concatenate(blocks).tobytes() == reader.get_panel_array().tobytes()
+
+
+def test_one_vertex_per_line(mesh, filename, tmp_path) -> None:
+    panels = GDFReader(filename).get_panel_array()
+    lines = filename.read_text(encoding="utf-8").splitlines()
+    vertex_lines = [
+        " ".join(f"{c:+.4e}" for c in vertex) for vertex in panels.reshape(-1, 3)
+    ]
+    vertex_filename = tmp_path / "vertex.gdf"
+    vertex_filename.write_text(
+        "\n".join(lines[:4] + vertex_lines) + "\n", encoding="utf-8"
+    )
+    reader = GDFReader(vertex_filename)
+    assert reader.get_panel_array().tobytes() == panels.tobytes()
+    blocks = list(reader.iter_panel_blocks(4))
+    assert np.concatenate(blocks).tobytes() == panels.tobytes()
+
+
+def test_write_read_roundtrip(filename, tmp_path) -> None:
+    reader = GDFReader(filename)
+    GDFWriter(
+        reader,
+        ulen=reader.ulen,
+        grav=reader.grav,
+        isx=reader.isx,
+        isy=reader.isy,
+        header=reader.header,
+    ).write(tmp_path / "copy.gdf")
+    assert (tmp_path / "copy.gdf").read_bytes() == filename.read_bytes()
+
+
+def test_empty(tmp_path) -> None:
+    filename = tmp_path / "empty.gdf"
+    GDFWriter(MeshGenerator()).write(filename)
+    reader = GDFReader(filename)
+    assert reader.get_panel_array().shape == (0, 4, 3)
+    assert list(reader.iter_panel_blocks(10)) == []
+
+
+def test_invalid(filename, tmp_path) -> None:
+    with pytest.raises(TypeError):
+        GDFReader(str(filename))
+    with pytest.raises(TypeError):
+        GDFReader(tmp_path / "mesh.txt")
+    lines = filename.read_text(encoding="utf-8").splitlines()
+    truncated = tmp_path / "truncated.gdf"
+    truncated.write_text("\n".join(lines[:-1]) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        GDFReader(truncated).get_panel_array()
+    malformed = tmp_path / "malformed.gdf"
+    malformed.write_text("\n".join(lines[:1] + ["1.0"] + lines[2:]), encoding="utf-8")
+    with pytest.raises(ValueError):
+        GDFReader(malformed)
+    values = " ".join(lines[4:]).split()
+    for values_per_line in (1, 2, 4):
+        rows = [values[i : i + values_per_line] for i in range(0, 12, values_per_line)]
+        misaligned = tmp_path / "misaligned.gdf"
+        misaligned.write_text(
+            "\n".join(lines[:4] + [" ".join(row) for row in rows]), encoding="utf-8"
+        )
+        with pytest.raises(ValueError, match="expected 3, 6 or 12"):
+            GDFReader(misaligned)
+    with pytest.raises(TypeError):
+        next(GDFReader(filename).iter_panel_blocks(1.0))
+    with pytest.raises(ValueError):
+        next(GDFReader(filename).iter_panel_blocks(0))
@@ -0,0 +1,72 @@
+"""Module for testing the GDFWriter class functionality"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pymesh import GDFWriter
+from pymesh.writers.gdf_writer import format_panels
+
+
+def test_format_panels() -> None:
+    rng = np.random.default_rng(0)
+    coords = rng.normal(scale=1e3, size=(5, 12))
+    coords[0, :4] = [0.0, -0.0, 1e-300, -1e300]
+    expected = "".join(
+        " ".join(f"{coord:+.4e}" for coord in panel) + "\n" for panel in coords
+    )
+    assert format_panels(coords) == expected
+
+
+def test_write(mesh, tmp_path) -> None:
+    filename = tmp_path / "mesh.gdf"
+    GDFWriter(mesh).write(filename)
+    lines = filename.read_text(encoding="utf-8").splitlines()
+    assert lines[:4] == [
+        "auto-generated using the pymesh package",
+        "1.000000 9.816000",
+        "0 0",
+        "6",
+    ]
+    assert len(lines) == 4 + 6
+    assert lines[4] == " ".join(f"{coord:+.4e}" for coord in mesh.get_panels()[0])
+
+
+def test_write_invalid(mesh) -> None:
+    with pytest.raises(TypeError):
+        GDFWriter(mesh).write("mesh.gdf")
+    with pytest.raises(TypeError):
+        GDFWriter(mesh).write(Path("mesh.txt"))
+
+
+def test_write_chunked(mesh, tmp_path, monkeypatch) -> None:
+    GDFWriter(mesh).write(tmp_path / "mesh.gdf")
+    monkeypatch.setattr("pymesh.writers.gdf_writer.PANELS_PER_CHUNK", 4)
+    GDFWriter(mesh).write(tmp_path / "mesh_chunked.gdf")
+    expected = (tmp_path / "mesh.gdf").read_bytes()
+    assert (tmp_path / "mesh_chunked.gdf").read_bytes() == expected
+
+
+def test_write_mesh_changed(mesh, tmp_path, monkeypatch) -> None:
+    filename = tmp_path / "mesh.gdf"
+    filename.write_text("previous", encoding="utf-8")
+    monkeypatch.setattr(mesh, "get_num_panels", lambda: 7)
+    with pytest.raises(RuntimeError):
+        GDFWriter(mesh).write(filename)
+    assert filename.read_text(encoding="utf-8") == "previous"
+    assert list(tmp_path.iterdir()) == [filename]
+
+
+def test_write_indexed_mesh(mesh, tmp_path) -> None:
+    GDFWriter(mesh).write(tmp_path / "mesh.gdf")
+    GDFWriter(mesh.get_indexed_mesh()).write(tmp_path / "indexed_mesh.gdf")
+    expected = (tmp_path / "mesh.gdf").read_bytes()
+    assert (tmp_path / "indexed_mesh.gdf").read_bytes() == expected
+
+
+def test_panels(mesh) -> None:
+    writer = GDFWriter(mesh)
+    assert writer.panels.shape == (6, 4, 3)
+    mesh.add_surface(mesh.surfaces[0]["surface"], density_u=1, density_w=1)
+    assert writer.panels.shape == (7, 4, 3)
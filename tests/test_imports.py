@@ -0,0 +1,53 @@
+"""Module for testing that importing pymesh stays cheap"""
+
+from pathlib import Path
+import subprocess
+import sys
+import textwrap
+
+IMPORT_TIME_BUDGET = 1.0
+"""Maximum time in seconds allowed for a headless import of pymesh."""
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_headless() -> None:
+    output = run_python(
+        """
+        import sys
+        import time
+        start = time.perf_counter()
+        import pymesh
+        print(time.perf_counter() - start)
+        print("matplotlib" in sys.modules)
+        """
+    )
+    import_time, matplotlib_imported = output.splitlines()
+    assert matplotlib_imported == "False"
+    assert float(import_time) < IMPORT_TIME_BUDGET
+
+
+def test_import_lazy() -> None:
+    output = run_python(
+        """
+        import sys
+        import pymesh
+        from pymesh import MeshViewer
+        print(MeshViewer is pymesh.mesh.mesh_viewer.MeshViewer)
+        print("matplotlib" in sys.modules)
+        print("MeshViewer" in dir(pymesh))
+        namespace = {}
+        exec("from pymesh import *", namespace)
+        print("MeshViewer" in namespace)
+        """
+    )
+    assert output.splitlines() == ["True", "True", "True", "True"]
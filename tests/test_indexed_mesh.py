@@ -0,0 +1,117 @@
+"""Module for testing the IndexedMesh class functionality"""
+
+import math
+
+import numpy as np
+import pytest
+
+from pymesh import (
+    Point,
+    Line,
+    ArcPVA,
+    SweptSurface,
+    IndexedMesh,
+    MeshGenerator,
+)
+
+
+@pytest.fixture
+def mesh(mesh, surface) -> MeshGenerator:
+    mesh.add_surface(surface.copy().move(1, 0, 0), density_u=3, density_w=2)
+    return mesh
+
+
+@pytest.fixture
+def cylinder() -> MeshGenerator:
+    circle = ArcPVA(Point(1, 0, -1), 2 * math.pi, a=0, b=0, c=1)
+    mesh = MeshGenerator()
+    mesh.add_surface(SweptSurface(circle, Line(Point(0, 0, -1), Point(0, 0, 0))), 8, 2)
+    return mesh
+
+
+def test_init_invalid() -> None:
+    with pytest.raises(TypeError):
+        IndexedMesh(np.zeros((4, 3)), np.zeros((1, 4)))
+    with pytest.raises(ValueError):
+        IndexedMesh(np.zeros((4, 2)), np.zeros((1, 4), dtype=int))
+    with pytest.raises(ValueError):
+        IndexedMesh(np.zeros((4, 3)), np.array([[0, 1, 2, 4]]))
+
+
+def test_from_panels(mesh) -> None:
+    indexed_mesh = mesh.get_indexed_mesh()
+    assert indexed_mesh.faces.dtype == np.int32
+    assert indexed_mesh.num_panels == 12
+    assert indexed_mesh.num_vertices == 4 * 5  # shared seam is merged
+    assert np.allclose(indexed_mesh.to_panels(), mesh.get_panel_array(), atol=1e-8)
+    assert np.all(indexed_mesh.get_panel_array() == indexed_mesh.to_panels())
+
+
+def test_from_panels_invalid(mesh) -> None:
+    panels = mesh.get_panel_array()
+    with pytest.raises(TypeError):
+        IndexedMesh.from_panels(panels, tolerance="0.1")
+    with pytest.raises(ValueError):
+        IndexedMesh.from_panels(panels, tolerance=0.0)
+    with pytest.raises(ValueError):
+        IndexedMesh.from_panels(panels.reshape(-1, 12))
+
+
+def test_get_edges(mesh) -> None:
+    edges, counts = mesh.get_indexed_mesh().get_edges()
+    assert len(edges) == 3 * 5 + 4 * 4
+    assert np.all(edges[:, 0] < edges[:, 1])
+    assert set(counts.tolist()) == {1, 2}
+    assert np.sum(counts == 1) == 2 * (3 + 4)
+    assert len(mesh.get_indexed_mesh().get_boundary_edges()) == 2 * (3 + 4)
+
+
+def test_seams_merged(cylinder) -> None:
+    indexed_mesh = cylinder.get_indexed_mesh()
+    boundary_edges = indexed_mesh.get_boundary_edges()
+    assert indexed_mesh.num_vertices == 8 * 3  # start and end of the circle merged
+    assert len(boundary_edges) == 2 * 8  # only the top and bottom rims are open
+    z = indexed_mesh.vertices[boundary_edges][..., 2]
+    assert np.all(np.isclose(z, 0.0) | np.isclose(z, -1.0))
+
+
+@pytest.mark.parametrize("boundary", [0.5, 1.0, -3.0])
+def test_from_panels_straddling_vertices(boundary) -> None:
+    tolerance = 1e-3
+    x0, x1 = (boundary - 1e-5) * tolerance, (boundary + 1e-5) * tolerance
+    panels = np.array(
+        [
+            [[-1, 0, 0], [x0, 0, 0], [x0, 1, 0], [-1, 1, 0]],
+            [[x1, 0, 0], [1, 0, 0], [1, 1, 0], [x1, 1, 0]],
+        ]
+    )
+    indexed_mesh = IndexedMesh.from_panels(panels, tolerance=tolerance)
+    assert indexed_mesh.num_vertices == 6
+    assert np.all(indexed_mesh.faces[1, [0, 3]] == indexed_mesh.faces[0, [1, 2]])
+    assert np.all(indexed_mesh.vertices[indexed_mesh.faces[1, 0]] == [x0, 0, 0])
+
+
+def test_from_panels_distinct_vertices() -> None:
+    panels = np.array([[[0, 0, 0], [0.9, 0, 0], [2.1, 0, 0], [2.9, 0.5, 0]]])
+    indexed_mesh = IndexedMesh.from_panels(panels, tolerance=1.0)
+    assert indexed_mesh.num_vertices == 2
+    assert np.all(indexed_mesh.faces == [[0, 0, 1, 1]])
+    assert np.all(indexed_mesh.vertices == [[0, 0, 0], [2.1, 0, 0]])
+
+
+def test_from_panels_chained_vertices() -> None:
+    panels = np.array([[[0, 0, 0], [0.9, 0, 0], [1.8, 0, 0], [2.7, 0, 0]]])
+    indexed_mesh = IndexedMesh.from_panels(panels, tolerance=1.0)
+    assert indexed_mesh.num_vertices == 3
+    assert np.all(indexed_mesh.faces == [[0, 0, 1, 2]])
+    distance = indexed_mesh.to_panels() - panels
+    assert np.all(np.abs(distance) <= 1.0)
+
+
+def test_iter_panel_blocks(mesh) -> None:
+    indexed_mesh = mesh.get_indexed_mesh()
+    assert indexed_mesh.get_num_panels() == 12
+    blocks = list(indexed_mesh.iter_panel_blocks(max_panels=5))
+    assert [len(block) for block in blocks] == [5, 5, 2]
+    assert np.all(np.concatenate(blocks) == indexed_mesh.to_panels())
+    assert len(list(indexed_mesh.iter_panel_blocks())) == 1
@@ -0,0 +1,103 @@
+"""Module for testing the instrumentation module functionality"""
+
+import json
+
+import numpy as np
+import pytest
+
+from pymesh import GDFWriter, Line, MeshGenerator, instrumentation
+from pymesh.utils import get_translation_affine
+
+
+@pytest.fixture(autouse=True)
+def restore_instrumentation():
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default(mesh, tmp_path) -> None:
+    assert not instrumentation.enabled
+    GDFWriter(mesh).write(tmp_path / "mesh.gdf")
+    assert instrumentation.report() == {"timers": {}, "counters": {}}
+
+
+def test_collect(surface, tmp_path) -> None:
+    with instrumentation.collect():
+        mesh = MeshGenerator()
+        mesh.add_surface(surface, density_u=3, density_w=2)
+        GDFWriter(mesh).write(tmp_path / "mesh.gdf")
+    assert not instrumentation.enabled
+    report = instrumentation.report()
+    assert set(report["timers"]) == {
+        instrumentation.CURVE_LENGTH,
+        instrumentation.DISTRIBUTION_SAMPLING,
+        instrumentation.SURFACE_EVALUATION,
+        instrumentation.PANEL_ASSEMBLY,
+        instrumentation.FORMATTING,
+        instrumentation.IO,
+    }
+    timer = report["timers"][instrumentation.SURFACE_EVALUATION]
+    assert timer["calls"] == 1
+    assert timer["mean"] == timer["total"] >= 0.0
+    assert report["counters"] == {"BilinearSurface.path_grid": 1}
+    assert json.loads(instrumentation.report_json()) == report
+
+
+def test_curve_length_instance(surface) -> None:
+    mesh = MeshGenerator()
+    with instrumentation.collect():
+        mesh.add_surface(surface)
+        mesh.add_instance(surface, get_translation_affine(0, 0, 1))
+    timer = instrumentation.report()["timers"][instrumentation.CURVE_LENGTH]
+    assert timer["calls"] == 2
+
+
+def test_counters(p00, p11) -> None:
+    line = Line(p00, p11)
+    instrumentation.enable()
+    line.path(0.5)
+    line.path(1.0)
+    line.path_array([0.0, 1.0])
+    instrumentation.count("custom", 3)
+    assert instrumentation.report()["counters"] == {
+        "Line.path": 2,
+        "Line.path_array": 1,
+        "custom": 3,
+    }
+    instrumentation.reset()
+    assert instrumentation.report()["counters"] == {}
+
+
+def test_counters_subclass(p00, p11) -> None:
+    class MidpointLine(Line):
+        def path(self, u, flip=False):
+            return (self.start.xyz + self.end.xyz) / 2
+
+    class NamedLine(Line):
+        pass
+
+    class ReversedLine(Line):
+        def path(self, u, flip=False):
+            return super().path(u, not flip)
+
+    instrumentation.enable()
+    MidpointLine(p00, p11).path(0.0)
+    NamedLine(p00, p11).path(0.0)
+    NamedLine(p00, p11).path(1.0)
+    assert np.all(ReversedLine(p00, p11).path(0.0) == p11.xyz)
+    assert instrumentation.report()["counters"] == {
+        "MidpointLine.path": 1,
+        "NamedLine.path": 2,
+        "ReversedLine.path": 1,
+    }
+    assert MidpointLine.path.__name__ == "path"
+
+
+def test_timer_disabled() -> None:
+    with instrumentation.timer("stage"):
+        pass
+    instrumentation.enable()
+    with instrumentation.timer("stage"):
+        pass
+    assert instrumentation.report()["timers"]["stage"]["calls"] == 1
@@ -0,0 +1,171 @@
+"""Module for testing the MeshCache class functionality"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from pymesh import (
+    Point,
+    Line,
+    Arc3P,
+    RuledSurface,
+    UserDefinedCurve,
+    ExponentialDistribution,
+    MeshCache,
+    MeshGenerator,
+    GDFWriter,
+)
+from pymesh.mesh.mesh_cache import TEMPORARY_TIMEOUT
+from pymesh.utils import get_translation_affine
+
+
+@pytest.fixture
+def cache(tmp_path) -> MeshCache:
+    return MeshCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def ruled_surface() -> RuledSurface:
+    arc = Arc3P(Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0))
+    line = Line(Point(1, 0, 1), Point(0, 1, 1))
+    return RuledSurface(arc, line)
+
+
+def get_data(surface, cache=None, **kwargs) -> dict:
+    mesh = MeshGenerator(cache)
+    mesh.add_surface(surface, **kwargs)
+    return mesh.surfaces[0]
+
+
+def test_init_invalid(tmp_path) -> None:
+    with pytest.raises(TypeError):
+        MeshCache("cache")
+    with pytest.raises(ValueError):
+        MeshCache(tmp_path, max_size=-1)
+    with pytest.raises(TypeError):
+        MeshGenerator(cache="cache")
+
+
+def test_get_key(surface, ruled_surface) -> None:
+    key = MeshCache.get_key(get_data(surface))
+    assert key == MeshCache.get_key(get_data(surface.copy()))
+    assert key == MeshCache.get_key(get_data(surface.copy().flip_normal()))
+    assert key != MeshCache.get_key(get_data(surface.copy().move(1, 0, 0)))
+    assert key != MeshCache.get_key(get_data(surface, density_u=3))
+    dist = ExponentialDistribution()
+    assert key != MeshCache.get_key(get_data(surface, distribution_u=dist))
+    assert MeshCache.get_key(get_data(ruled_surface)) is not None
+
+
+def test_get_key_uncacheable(surface) -> None:
+    curve = UserDefinedCurve(lambda u: np.array([u, 0, 0]))
+    line = Line(Point(0, 1, 0), Point(1, 1, 0))
+    data = get_data(RuledSurface(curve, line))
+    assert MeshCache.get_key(data) is None
+
+
+def test_mesh_points(cache, ruled_surface) -> None:
+    data = get_data(ruled_surface)
+    assert cache.get_mesh_points(data) is None
+    mesh_points = MeshGenerator._generate_mesh_points(data)
+    cache.set_mesh_points(data, mesh_points)
+    assert cache.get_mesh_points(data).tobytes() == mesh_points.tobytes()
+    cache.clear()
+    assert cache.get_mesh_points(data) is None
+
+
+def test_mesh_points_invalid(cache, ruled_surface) -> None:
+    data = get_data(ruled_surface)
+    cache.set_mesh_points(data, np.zeros((3, 2, 2)))
+    assert cache.get_mesh_points(data) is None
+    cache._get_filename(cache.get_key(data)).write_bytes(b"corrupt")
+    assert cache.get_mesh_points(data) is None
+
+
+def test_temporary_files(tmp_path, surface) -> None:
+    cache = MeshCache(tmp_path, max_size=4096)
+    stale, fresh = tmp_path / "stale.tmp", tmp_path / "fresh.tmp"
+    stale.write_bytes(bytes(1000))
+    fresh.write_bytes(bytes(4000))
+    mtime = time.time() - TEMPORARY_TIMEOUT - 1
+    os.utime(stale, (mtime, mtime))
+    assert cache.get_size() == 5000
+    data = get_data(surface, density_u=1, density_w=1)
+    cache.set_mesh_points(data, np.zeros((3, 2, 2)))
+    assert not stale.exists()
+    assert fresh.exists()
+    assert cache.get_mesh_points(data) is None  # evicted, as fresh exceeds max_size
+    os.utime(fresh, (mtime, mtime))
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_panel_array(cache, surface, ruled_surface, monkeypatch) -> None:
+    mesh = MeshGenerator(cache)
+    mesh.add_surface(surface)
+    mesh.add_surface(ruled_surface.flip_normal())
+    panels = mesh.get_panel_array()
+    assert len(list(cache.directory.glob("*.npy"))) == 2
+
+    def fail(data):
+        raise AssertionError("surface evaluated despite cache hit")
+
+    monkeypatch.setattr(MeshGenerator, "_generate_mesh_points", fail)
+    mesh_cached = MeshGenerator(cache)
+    mesh_cached.add_surface(surface)
+    mesh_cached.add_surface(ruled_surface)
+    assert mesh_cached.get_panel_array().tobytes() == panels.tobytes()
+
+
+def test_get_panel_array_instance(cache, surface, monkeypatch) -> None:
+    mesh = MeshGenerator(cache)
+    mesh.add_surface(surface)
+    panels = mesh.get_panel_array()
+
+    def fail(data):
+        raise AssertionError("surface evaluated despite cache hit")
+
+    monkeypatch.setattr(MeshGenerator, "_generate_mesh_points", fail)
+    mesh_cached = MeshGenerator(cache)
+    mesh_cached.add_instance(surface, get_translation_affine(0, 0, 1))
+    panels_cached = mesh_cached.get_panel_array()
+    assert np.allclose(panels_cached[..., :2], panels[..., :2])
+    assert np.allclose(panels_cached[..., 2], panels[..., 2] + 1)
+    assert len(list(cache.directory.glob("*.npy"))) == 1
+
+
+def test_iter_panel_blocks(
+    cache, surface, ruled_surface, tmp_path, monkeypatch
+) -> None:
+    mesh = MeshGenerator(cache)
+    mesh.add_surface(surface, density_u=4, density_w=3)
+    mesh.add_surface(ruled_surface)
+    GDFWriter(mesh).write(tmp_path / "mesh.gdf")
+    assert len(list(cache.directory.glob("*.npy"))) == 2
+
+    def fail(data, rows=slice(None)):
+        raise AssertionError("surface evaluated despite cache hit")
+
+    monkeypatch.setattr(MeshGenerator, "_generate_mesh_points", fail)
+    mesh_cached = MeshGenerator(cache)
+    mesh_cached.add_surface(surface, density_u=4, density_w=3)
+    mesh_cached.add_surface(ruled_surface)
+    GDFWriter(mesh_cached).write(tmp_path / "mesh_cached.gdf")
+    expected = (tmp_path / "mesh.gdf").read_bytes()
+    assert (tmp_path / "mesh_cached.gdf").read_bytes() == expected
+    blocks = list(mesh_cached.iter_panel_blocks(max_panels=4))
+    assert [len(block) for block in blocks[:3]] == [4, 4, 4]
+    assert np.all(np.concatenate(blocks) == mesh.get_panel_array())
+
+
+def test_evict(tmp_path, surface) -> None:
+    cache = MeshCache(tmp_path, max_size=2 * (3 * 10 * 12 * 8 + 128))
+    data = [get_data(surface, density_u=n, density_w=9) for n in (9, 10, 11)]
+    for item in data:
+        cache.set_mesh_points(item, np.zeros((3, *item["num_points"])))
+    assert cache.get_size() <= cache.max_size
+    assert cache.get_mesh_points(data[0]) is None
+    assert cache.get_mesh_points(data[2]) is not None
+    assert not (tmp_path / "cache.lock").exists()
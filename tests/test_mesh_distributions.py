@@ -0,0 +1,54 @@
+"""Module for testing the MeshDistribution classes functionality"""
+
+import numpy as np
+import pytest
+
+from pymesh import (
+    LinearDistribution,
+    CosineDistribution,
+    ExponentialDistribution,
+    PowerDistribution,
+)
+
+
+@pytest.fixture(params=[False, True], ids=["default", "flipped"])
+def distributions(request) -> list:
+    flip = request.param
+    return [
+        LinearDistribution(flip),
+        CosineDistribution(flip),
+        ExponentialDistribution(2.0, flip),
+        PowerDistribution(3.0, flip),
+    ]
+
+
+def test_call(distributions) -> None:
+    u = np.linspace(0, 1, num=11)
+    for distribution in distributions:
+        fn = distribution.get_dist_fn()
+        expected = np.array([fn(val) for val in u])
+        assert np.allclose(distribution(u), expected, rtol=0, atol=1e-15)
+
+
+def test_call_invalid(distributions) -> None:
+    for distribution in distributions:
+        with pytest.raises(TypeError):
+            distribution(np.array(["u"]))
+        with pytest.raises(ValueError):
+            distribution(np.array([0.5, 1.5]))
+
+
+def test_sample(distributions) -> None:
+    for distribution in distributions:
+        u = distribution.sample(6)
+        assert u.shape == (6,)
+        assert np.allclose(u, distribution(np.linspace(0, 1, num=6)))
+        assert np.allclose(u[[0, -1]], [0.0, 1.0])
+
+
+def test_sample_invalid(distributions) -> None:
+    for distribution in distributions:
+        with pytest.raises(TypeError):
+            distribution.sample(2.0)
+        with pytest.raises(ValueError):
+            distribution.sample(0)
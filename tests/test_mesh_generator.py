@@ -1,10 +1,20 @@
 """Module for testing the MeshGenerator class functionality"""
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import threading
 
+import numpy as np
 import pytest
 
-from pymesh import BilinearSurface, ExponentialDistribution, CosineDistribution
+from pymesh import ExponentialDistribution, CosineDistribution
+from pymesh import GDFWriter, Line, RuledSurface
+from pymesh.utils import (
+    get_mirror_affine,
+    get_rotation_affine,
+    get_translation_affine,
+    validate_affine,
+)
 from pymesh.mesh.mesh_generator import MeshGenerator
 
 
@@ -13,11 +23,6 @@ def mesher() -> MeshGenerator:
     return MeshGenerator()
 
 
-@pytest.fixture
-def surface(p00, p01, p11, p10) -> None:
-    return BilinearSurface(p00, p01, p11, p10)
-
-
 def test_init_invalid() -> None:
     with pytest.raises(TypeError):
         MeshGenerator("")
@@ -46,6 +51,246 @@ def test__generate_panels(mesher, surface) -> None:
     mesh_points = mesher._generate_panels(mesh_points, flipped_normal=True)
 
 
+def test__generate_panels_vertex_order() -> None:
+    mp = np.arange(3 * 3 * 4, dtype=float).reshape(3, 3, 4)
+    panels = MeshGenerator._generate_panels(mp, flipped_normal=False)
+    flipped = MeshGenerator._generate_panels(mp, flipped_normal=True)
+    assert panels.shape == (6, 4, 3)
+    assert panels.dtype == np.float64
+    k = 0
+    for j in range(3):
+        for i in range(2):
+            expected = [
+                mp[:, i, j],
+                mp[:, i + 1, j],
+                mp[:, i + 1, j + 1],
+                mp[:, i, j + 1],
+            ]
+            assert np.all(panels[k] == np.array(expected))
+            assert np.all(flipped[k] == np.array(expected[::-1]))
+            k += 1
+
+
 def test_get_panels(mesher, surface) -> None:
     mesher.add_surface(surface)
     panels = mesher.get_panels()
+
+
+def test_get_panel_array(mesher, surface) -> None:
+    mesher.add_surface(surface, density_u=2, density_w=3)
+    panels = mesher.get_panel_array()
+    assert isinstance(panels, np.ndarray)
+    assert panels.shape[1:] == (4, 3)
+    assert panels.flags["C_CONTIGUOUS"]
+    assert np.all(np.array(mesher.get_panels()) == panels.reshape(-1, 12))
+
+
+def test_surfaces_per_instance(surface) -> None:
+    mesher1, mesher2 = MeshGenerator(), MeshGenerator()
+    mesher1.add_surface(surface, density_u=1, density_w=1)
+    assert len(mesher1.surfaces) == 1
+    assert len(mesher2.surfaces) == 0
+    assert mesher2.get_panel_array().shape == (0, 4, 3)
+
+
+def test_add_surface_threaded(mesher, surface) -> None:
+    num_threads, num_surfaces = 4, 25
+
+    def add_surfaces():
+        for _ in range(num_surfaces):
+            mesher.add_surface(surface, density_u=1, density_w=1)
+            mesher.get_panel_array()
+
+    threads = [threading.Thread(target=add_surfaces) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(mesher.surfaces) == num_threads * num_surfaces
+    assert mesher.get_panel_array().shape == (num_threads * num_surfaces, 4, 3)
+
+
+def test_get_panel_array_parallel(surface) -> None:
+    def create_mesher():
+        mesher = MeshGenerator()
+        mesher.add_surface(surface, density_u=3, density_w=2)
+        mesher.add_surface(surface.copy().move(1, 0, 0), density_u=0.1, density_w=0.2)
+        return mesher
+
+    panels = create_mesher().get_panel_array()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        panels_threaded = create_mesher().get_panel_array(executor=executor)
+    panels_processes = create_mesher().get_panel_array(workers=2)
+    assert panels_threaded.tobytes() == panels.tobytes()
+    assert panels_processes.tobytes() == panels.tobytes()
+
+
+def test_get_panel_array_invalid_workers(mesher) -> None:
+    with pytest.raises(TypeError):
+        mesher.get_panel_array(workers=2.0)
+    with pytest.raises(ValueError):
+        mesher.get_panel_array(workers=0)
+
+
+def test_get_panel_array_memoized(mesher, surface, monkeypatch) -> None:
+    surface_moved = surface.copy().move(0, 0, 1)
+    mesher.add_surface(surface, density_u=3, density_w=2)
+    mesher.add_surface(surface_moved, density_u=2, density_w=2)
+    panels = mesher.get_panel_array()
+    assert mesher.get_panel_array() is panels
+    assert not panels.flags.writeable
+    evaluated = []
+    generate_mesh_points = MeshGenerator._generate_mesh_points
+
+    def count(data):
+        evaluated.append(data["surface"])
+        return generate_mesh_points(data)
+
+    monkeypatch.setattr(MeshGenerator, "_generate_mesh_points", count)
+    surface_moved.move(0, 0, 1)
+    panels_moved = mesher.get_panel_array()
+    assert evaluated == [surface_moved]
+    assert np.all(panels_moved[:6] == panels[:6])
+    assert np.all(panels_moved[6:, :, 2] == panels[6:, :, 2] + 1)
+    mesher.surfaces[0]["num_points"] = (2, 2)
+    assert mesher.get_panel_array().shape == (5, 4, 3)
+    assert evaluated == [surface_moved, surface]
+
+
+def test_get_num_panels(mesher, surface) -> None:
+    mesher.add_surface(surface, density_u=3, density_w=2)
+    mesher.add_surface(surface, density_u=0.1, density_w=1)
+    assert mesher.get_num_panels() == 3 * 2 + 10 * 1
+    assert mesher.get_num_panels() == len(mesher.get_panel_array())
+
+
+def test_get_surface_ids(mesher, surface) -> None:
+    assert mesher.get_surface_ids().shape == (0,)
+    mesher.add_surface(surface, density_u=3, density_w=2)
+    mesher.add_surface(surface, density_u=1, density_w=2)
+    assert mesher.get_surface_ids().tolist() == [0] * 6 + [1] * 2
+
+
+@pytest.mark.parametrize("max_panels", [None, 1, 4, 100])
+def test_iter_panel_blocks(mesher, surface, max_panels) -> None:
+    mesher.add_surface(surface, density_u=3, density_w=4)
+    mesher.add_surface(surface.copy().move(1, 0, 0), density_u=2, density_w=1)
+    blocks = list(mesher.iter_panel_blocks(max_panels))
+    if max_panels is not None:
+        assert all(len(block) <= max(max_panels, 3) for block in blocks)
+    panels = mesher.get_panel_array()
+    assert np.concatenate(blocks).tobytes() == panels.tobytes()
+    memoized_blocks = list(mesher.iter_panel_blocks(max_panels))
+    assert np.concatenate(memoized_blocks).tobytes() == panels.tobytes()
+
+
+def test_iter_panel_blocks_invalid(mesher) -> None:
+    with pytest.raises(TypeError):
+        next(mesher.iter_panel_blocks(1.0))
+    with pytest.raises(ValueError):
+        next(mesher.iter_panel_blocks(0))
+
+
+def test_get_panel_array_trusted_path(p00, p01, p11, p10, monkeypatch) -> None:
+    surface = RuledSurface(Line(p00, p10), Line(p01, p11))
+    mesher = MeshGenerator()
+    mesher.add_surface(surface, density_u=3, density_w=2)
+    expected = mesher.get_panel_array().copy()
+
+    def validate(*args):
+        raise AssertionError("Expected no validation on the trusted path")
+
+    monkeypatch.setattr(
+        "pymesh.geo.surfaces.surface.validate_surface_path_arrays", validate
+    )
+    monkeypatch.setattr("pymesh.geo.curves.curve.validate_curve_path_array", validate)
+    mesher = MeshGenerator()
+    mesher.add_surface(surface, density_u=3, density_w=2)
+    assert mesher.get_panel_array().tobytes() == expected.tobytes()
+    with pytest.raises(AssertionError):
+        surface.path_grid([0.0, 1.0], [0.0, 1.0])
+
+
+def test_add_instance(mesher, surface, angle, monkeypatch) -> None:
+    evaluated = []
+    generate_mesh_points = MeshGenerator._generate_mesh_points
+
+    def count(data):
+        evaluated.append(data["surface"])
+        return generate_mesh_points(data)
+
+    monkeypatch.setattr(MeshGenerator, "_generate_mesh_points", count)
+    rotation = get_rotation_affine(angle, 0, 0, 1, x0=1)
+    mirror = get_mirror_affine(1, 1, 0)
+    mesher.add_surface(surface, density_u=3, density_w=2)
+    mesher.add_instance(surface, rotation, density_u=3, density_w=2)
+    mesher.add_instance(surface, mirror, density_u=3, density_w=2)
+    mesher.add_instance(surface.copy().flip_normal(), mirror, density_u=3, density_w=2)
+    panels = mesher.get_panel_array()
+    assert len(evaluated) == 2  # the flipped copy is a separate source surface
+
+    expected = MeshGenerator()
+    expected.add_surface(surface, density_u=3, density_w=2)
+    expected.add_surface(
+        surface.copy().rotate(angle, 0, 0, 1, x0=1), density_u=3, density_w=2
+    )
+    expected.add_surface(
+        surface.copy().mirror(1, 1, 0).flip_normal(), density_u=3, density_w=2
+    )
+    expected.add_surface(surface.copy().mirror(1, 1, 0), density_u=3, density_w=2)
+    assert np.allclose(panels, expected.get_panel_array())
+    blocks = list(mesher.iter_panel_blocks(max_panels=2))
+    assert np.concatenate(blocks).tobytes() == panels.tobytes()
+
+
+@pytest.mark.parametrize("max_panels", [None, 2, 4])
+def test_add_instance_streamed(
+    mesher, surface, max_panels, tmp_path, monkeypatch
+) -> None:
+    evaluated = []
+    generate_mesh_points = MeshGenerator._generate_mesh_points
+
+    def count(data, rows=slice(None)):
+        evaluated.append(rows)
+        return generate_mesh_points(data, rows)
+
+    monkeypatch.setattr(MeshGenerator, "_generate_mesh_points", staticmethod(count))
+    mesher.add_surface(surface, density_u=3, density_w=2)
+    mesher.add_surface(surface.copy().move(0, 0, 1), density_u=1, density_w=1)
+    for angle in (0.5, 1.0, 1.5):
+        rotation = get_rotation_affine(angle * np.pi, 0, 0, 1)
+        mesher.add_instance(surface, rotation, density_u=3, density_w=2)
+    GDFWriter(mesher).write(tmp_path / "mesh.gdf")
+    assert len(evaluated) == 2  # the source surface once for all instances
+    evaluated.clear()
+    blocks = list(mesher.iter_panel_blocks(max_panels=max_panels))
+    assert len(evaluated) == 2
+    panels = mesher.get_panel_array()
+    assert np.concatenate(blocks).tobytes() == panels.tobytes()
+    GDFWriter(mesher).write(tmp_path / "mesh_memoized.gdf")
+    expected = (tmp_path / "mesh_memoized.gdf").read_bytes()
+    assert (tmp_path / "mesh.gdf").read_bytes() == expected
+
+
+def test_add_instance_memoized(mesher, surface) -> None:
+    mesher.add_instance(surface, get_translation_affine(0, 0, 1), density_u=1)
+    panels = mesher.get_panel_array()
+    mesher.surfaces[0]["transform"] = validate_affine(get_translation_affine(0, 0, 2))
+    panels_moved = mesher.get_panel_array()
+    assert np.allclose(panels_moved[..., 2], panels[..., 2] + 1)
+
+
+def test_add_instance_invalid(mesher, surface) -> None:
+    with pytest.raises(TypeError):
+        mesher.add_instance(surface, "transform")
+    with pytest.raises(ValueError):
+        mesher.add_instance(surface, np.eye(3))
+    with pytest.raises(ValueError):
+        mesher.add_instance(surface, np.ones((4, 4)))
+    with pytest.raises(ValueError, match="rigid"):
+        mesher.add_instance(surface, np.diag([2.0, 1.0, 1.0, 1.0]))
+    shear = np.eye(4)
+    shear[0, 1] = 0.5
+    with pytest.raises(ValueError, match="rigid"):
+        mesher.add_instance(surface, shear)
+    assert mesher.surfaces == []
@@ -0,0 +1,31 @@
+"""Module for testing the MeshViewer class functionality"""
+
+import numpy as np
+import pytest
+
+from pymesh import BilinearSurface, MeshGenerator
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+from pymesh import MeshViewer  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture
+def viewer(p00, p01, p11, p10) -> MeshViewer:
+    mesh = MeshGenerator()
+    surface = BilinearSurface(p00, p01, p11, p10).move(0, 0, -2.5)
+    mesh.add_surface(surface, density_u=3, density_w=2)
+    return MeshViewer(mesh)
+
+
+def test_plot_panels(viewer) -> None:
+    viewer._plot_panels()
+    assert len(viewer.ax.collections) == 2  # panels and normals
+    assert np.all(viewer.xyzlim == np.array([1, 1, 3]))
+
+
+def test_plot_panels_empty() -> None:
+    viewer = MeshViewer(MeshGenerator())
+    viewer._plot_panels()
+    assert len(viewer.ax.collections) == 0
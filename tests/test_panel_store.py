@@ -0,0 +1,92 @@
+"""Module for testing the PanelStoreWriter and PanelStoreReader classes"""
+
+import numpy as np
+import pytest
+
+from pymesh import (
+    GDFWriter,
+    MeshGenerator,
+    PanelStoreReader,
+    PanelStoreWriter,
+)
+from pymesh.writers.panel_store_writer import ALIGNMENT
+
+
+@pytest.fixture
+def mesh(mesh, surface) -> MeshGenerator:
+    mesh.add_surface(surface.copy().move(0, 0, 1), density_u=2, density_w=1)
+    return mesh
+
+
+def test_write_read(mesh, tmp_path) -> None:
+    filename = tmp_path / "mesh.pmesh"
+    PanelStoreWriter(mesh, ulen=2.0, grav=9.81, isy=True, header="hull").write(filename)
+    reader = PanelStoreReader(filename)
+    assert isinstance(reader.panels, np.memmap)
+    assert not reader.panels.flags.writeable
+    assert reader.panels.offset % ALIGNMENT == 0
+    assert reader.panels.tobytes() == mesh.get_panel_array().tobytes()
+    assert reader.surface_ids.tolist() == [0] * 6 + [1] * 2
+    assert (reader.ulen, reader.grav, reader.isx, reader.isy) == (
+        2.0,
+        9.81,
+        False,
+        True,
+    )
+    assert reader.header == "hull"
+    assert reader.get_num_panels() == 8
+    assert np.concatenate(list(reader.iter_panel_blocks(3))).shape == (8, 4, 3)
+
+
+def test_write_without_surface_ids(mesh, tmp_path) -> None:
+    filename = tmp_path / "mesh.pmesh"
+    PanelStoreWriter(mesh.get_indexed_mesh()).write(filename)
+    reader = PanelStoreReader(filename)
+    assert reader.surface_ids.tolist() == [0] * 8
+    assert reader.panels.tobytes() == mesh.get_panel_array().tobytes()
+
+
+def test_write_empty(tmp_path) -> None:
+    filename = tmp_path / "mesh.pmesh"
+    PanelStoreWriter(MeshGenerator()).write(filename)
+    reader = PanelStoreReader(filename)
+    assert reader.panels.shape == (0, 4, 3)
+    assert reader.surface_ids.shape == (0,)
+
+
+def test_write_invalid(mesh, tmp_path) -> None:
+    with pytest.raises(TypeError):
+        PanelStoreWriter(mesh).write("mesh.pmesh")
+    with pytest.raises(TypeError):
+        PanelStoreWriter(mesh).write(tmp_path / "mesh.gdf")
+
+
+def test_write_mesh_changed(mesh, tmp_path, monkeypatch) -> None:
+    filename = tmp_path / "mesh.pmesh"
+    PanelStoreWriter(mesh).write(filename)
+    expected = filename.read_bytes()
+    monkeypatch.setattr(mesh, "get_num_panels", lambda: 9)
+    monkeypatch.setattr(mesh, "get_surface_ids", lambda: np.zeros(9, dtype=np.int32))
+    with pytest.raises(RuntimeError):
+        PanelStoreWriter(mesh).write(filename)
+    assert filename.read_bytes() == expected
+    assert list(tmp_path.iterdir()) == [filename]
+
+
+def test_read_invalid(mesh, tmp_path) -> None:
+    with pytest.raises(TypeError):
+        PanelStoreReader("mesh.pmesh")
+    filename = tmp_path / "mesh.gdf"
+    GDFWriter(mesh).write(filename)
+    with pytest.raises(ValueError):
+        PanelStoreReader(filename)
+
+
+def test_gdf_conversion(mesh, tmp_path) -> None:
+    GDFWriter(mesh, ulen=2.0, isx=True).write(tmp_path / "mesh.gdf")
+    reader = PanelStoreReader.from_gdf(tmp_path / "mesh.gdf", tmp_path / "mesh.pmesh")
+    assert (reader.ulen, reader.isx) == (2.0, True)
+    assert np.allclose(reader.panels, mesh.get_panel_array(), atol=1e-4)
+    reader.to_gdf(tmp_path / "converted.gdf")
+    expected = (tmp_path / "mesh.gdf").read_bytes()
+    assert (tmp_path / "converted.gdf").read_bytes() == expected
@@ -1,6 +1,7 @@
 """Module for testing the Point class functionality"""
 
 import math
+import pickle
 
 import numpy as np
 import pytest
@@ -100,3 +101,34 @@ def test_mirror() -> None:
     assert Point(2, 0, 0).mirror(1, 0, 0, x0=1) == Point(0, 0, 0)
     assert Point(0, 2, 0).mirror(0, 1, 0, y0=1) == Point(0, 0, 0)
     assert Point(0, 0, 3).mirror(0, 0, 1, z0=2) == Point(0, 0, 1)
+
+
+def test_xyz_view(point1) -> None:
+    xyz = point1.xyz
+    assert point1.xyz is xyz
+    assert xyz.dtype == np.float64
+    with pytest.raises(ValueError):
+        xyz[0] = 1.0
+    point1.move(1, 2, 3)
+    assert np.all(xyz == np.array([1, 2, 3]))
+
+
+def test_set_invalid(point1) -> None:
+    with pytest.raises(TypeError):
+        point1.x = "x"
+    with pytest.raises(TypeError):
+        point1.move("dx", 0, 0)
+    assert np.all(point1.xyz == 0)
+
+
+def test_slots(point1) -> None:
+    with pytest.raises(AttributeError):
+        point1.w = 1.0
+
+
+def test_pickle(point2) -> None:
+    point = pickle.loads(pickle.dumps(point2))
+    assert point == point2
+    point.move(1, 1, 1)
+    assert point.xyz is not point2.xyz
+    assert np.all(point.xyz == point2.xyz + 1)
@@ -0,0 +1,108 @@
+"""Module for testing the PointArray class functionality"""
+
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from pymesh import Point, PointArray
+
+
+@pytest.fixture
+def points() -> list[Point]:
+    return [Point(0, 0, 0), Point(1, 0, 0), Point(1, 2, 3)]
+
+
+@pytest.fixture
+def point_array(points) -> PointArray:
+    return PointArray(points)
+
+
+def test_init(points) -> None:
+    assert PointArray(points) == PointArray(np.array([[0, 0, 0], [1, 0, 0], [1, 2, 3]]))
+
+
+def test_init_invalid() -> None:
+    with pytest.raises(TypeError):
+        PointArray([Point(0, 0, 0), "point"])
+    with pytest.raises(TypeError):
+        PointArray(np.array([["x", "y", "z"]]))
+    with pytest.raises(ValueError):
+        PointArray(np.zeros((2, 2)))
+
+
+def test_len(point_array) -> None:
+    assert len(point_array) == 3
+
+
+def test_getitem(point_array, points) -> None:
+    assert point_array[2] == points[2]
+    assert list(point_array) == points
+    point_array[0].move(1, 1, 1)
+    assert np.all(point_array.xyz[0] == 1.0)
+    assert points[0] == Point(0, 0, 0)
+
+
+def test_getitem_integral(point_array, points) -> None:
+    assert point_array[np.int64(1)] == points[1]
+    assert point_array[-1] == points[-1]
+    with pytest.raises(IndexError):
+        point_array[3]
+    with pytest.raises(TypeError):
+        point_array[1.0]
+    with pytest.raises(TypeError):
+        point_array["1"]
+
+
+def test_getitem_slice(point_array, points) -> None:
+    last = point_array[-1:]
+    assert isinstance(last, PointArray)
+    assert last == PointArray(points[-1:])
+    assert point_array[::-1] == PointArray(points[::-1])
+    assert len(point_array[3:]) == 0
+    last.move(1, 0, 0)
+    assert point_array[2] == Point(2, 2, 3)
+
+
+def test_xyz_view(point_array) -> None:
+    xyz = point_array.xyz
+    assert xyz.shape == (3, 3)
+    with pytest.raises(ValueError):
+        xyz[0, 0] = 1.0
+    point_array.move(1, 2, 3)
+    assert np.all(xyz[0] == np.array([1, 2, 3]))
+
+
+def test_copy(point_array) -> None:
+    copy = point_array.copy()
+    assert copy == point_array
+    copy.move(1, 0, 0)
+    assert copy != point_array
+
+
+def test_move(point_array, points) -> None:
+    point_array.move(1, 2, 3)
+    for point_moved, point in zip(point_array, points):
+        assert point_moved == point.move(1, 2, 3)
+    with pytest.raises(TypeError):
+        point_array.move("dx", 0, 0)
+
+
+def test_rotate(point_array) -> None:
+    point_array.rotate(math.pi / 2, 0, 0, 1)
+    expected = np.array([[0, 0, 0], [0, 1, 0], [-2, 1, 3]])
+    assert np.allclose(point_array.xyz, expected, rtol=0, atol=1e-12)
+
+
+def test_mirror(point_array) -> None:
+    point_array.mirror(1, 0, 0, x0=1)
+    expected = np.array([[2, 0, 0], [1, 0, 0], [1, 2, 3]])
+    assert np.allclose(point_array.xyz, expected, rtol=0, atol=1e-12)
+
+
+def test_pickle(point_array) -> None:
+    copy = pickle.loads(pickle.dumps(point_array))
+    assert copy == point_array
+    copy.move(1, 0, 0)
+    assert np.all(copy.xyz[:, 0] == point_array.xyz[:, 0] + 1)